@@ -0,0 +1,233 @@
+"""
+Batch Calculator Module
+Evaluates files of arithmetic expressions such as ``sample_calculations.txt``.
+
+Each line is parsed with ``ast`` and only numbers, parentheses, unary
+``+``/``-`` and the four ``basic_calculator`` operations are accepted, so
+nothing in the file is ever executed as Python code. The accepted tree is
+compiled once into nested closures over the same operations
+``basic_calculator`` performs (including its division-by-zero error), and
+compiled forms are kept in a bounded cache keyed by the expression text.
+Files are streamed line by line; a bad line produces an error result
+instead of stopping the batch. ``parallel_results`` spreads chunks of lines
+over a process pool and still yields results in input order.
+
+Example:
+    >>> [r.value for r in iter_results(["3 * 3 * 3", "12 - 8 + 4"])]
+    [27, 8]
+
+@author: Admin (Repository Owner)
+"""
+
+import ast
+import functools
+import itertools
+import operator
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+
+COMPILE_CACHE_SIZE = 4096
+MAX_EXPRESSION_LENGTH = 1000
+DEFAULT_CHUNK_SIZE = 10_000
+
+CalculationResult = namedtuple('CalculationResult', ['line_number', 'expression', 'value', 'error'])
+CalculationResult.__doc__ = """Outcome of one line: ``value`` on success, otherwise an ``error`` message."""
+
+
+def _divide(a, b):
+    if b == 0:
+        raise ValueError("Division by zero is not allowed")
+    return a / b
+
+
+_BINARY_OPERATIONS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: _divide,
+}
+
+_UNARY_OPERATIONS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _compile_node(node) -> Callable[[], float]:
+    """Turn a validated AST node into a zero-argument function computing it."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+        return lambda: value
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATIONS:
+        unary, operand = _UNARY_OPERATIONS[type(node.op)], _compile_node(node.operand)
+        return lambda: unary(operand())
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATIONS:
+        binary = _BINARY_OPERATIONS[type(node.op)]
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda: binary(left(), right())
+    element = type(node.op if hasattr(node, 'op') else node).__name__
+    raise ValueError(f"Unsupported expression element: {element}")
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_expression(expression: str) -> Callable[[], float]:
+    """
+    Compile an arithmetic expression into a reusable function.
+
+    Args:
+        expression (str): Expression such as ``"12 - 8 + 4"``
+
+    Returns:
+        Callable[[], float]: Function evaluating the expression
+
+    Raises:
+        ValueError: If the expression is too long, is not valid syntax or
+            uses anything other than numbers and + - * /
+    """
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"Expression longer than {MAX_EXPRESSION_LENGTH} characters")
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+        return _compile_node(tree.body)
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression: {e.msg}") from None
+    except RecursionError:
+        raise ValueError("Expression is nested too deeply") from None
+
+
+def evaluate_expression(expression: str) -> float:
+    """
+    Evaluate one arithmetic expression.
+
+    Raises:
+        ValueError: If the expression is invalid or divides by zero
+    """
+    return compile_expression(expression)()
+
+
+def iter_results(lines: Iterable[str], start: int = 1) -> Iterator[CalculationResult]:
+    """
+    Lazily evaluate lines, skipping blank lines and ``#`` comments.
+
+    Args:
+        lines (Iterable[str]): Expressions, e.g. an open file
+        start (int): Line number of the first line
+
+    Yields:
+        CalculationResult: One result per expression line, in input order
+    """
+    for line_number, line in enumerate(lines, start):
+        expression = line.strip()
+        if not expression or expression.startswith('#'):
+            continue
+        try:
+            value = compile_expression(expression)()
+        except (ValueError, OverflowError, RecursionError) as e:
+            yield CalculationResult(line_number, expression, None, str(e))
+        else:
+            yield CalculationResult(line_number, expression, value, None)
+
+
+def _evaluate_chunk(start: int, lines: list) -> list:
+    """
+    Worker task: results for one chunk of lines beginning at line ``start``.
+
+    Results travel back as plain ``(line_number, value, error)`` tuples; the
+    parent still holds the lines, so the expression text is not sent twice.
+    """
+    return [(r.line_number, r.value, r.error) for r in iter_results(lines, start)]
+
+
+def parallel_results(lines: Iterable[str], workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     max_pending: Optional[int] = None) -> Iterator[CalculationResult]:
+    """
+    Evaluate lines in a process pool, yielding results in input order.
+
+    Lines are read ``chunk_size`` at a time and each chunk is one task.
+    Results of a chunk are yielded as soon as it and every earlier chunk
+    have finished. At most ``max_pending`` chunks are read ahead of the
+    output, so a slow consumer stops the reading instead of letting
+    results pile up in memory.
+
+    Args:
+        lines (Iterable[str]): Expressions, e.g. an open file
+        workers (Optional[int]): Worker processes (default: one per CPU this
+            process may run on); with a single worker the lines are
+            evaluated in this process
+        chunk_size (int): Lines per task
+        max_pending (Optional[int]): Chunks in flight (default: 2 per worker)
+
+    Yields:
+        CalculationResult: Same results, in the same order, as ``iter_results``
+
+    Raises:
+        ValueError: If workers, chunk_size or max_pending is not positive
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if max_pending is not None and max_pending < 1:
+        raise ValueError("max_pending must be positive")
+    if workers is None:
+        from parallel_stats import _available_cpus
+        workers = _available_cpus()
+    if workers == 1:
+        yield from iter_results(lines)
+        return
+
+    max_pending = max_pending or 2 * workers
+    lines = iter(lines)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        start = 1
+        while True:
+            chunk = list(itertools.islice(lines, chunk_size))
+            if chunk:
+                pending.append((pool.submit(_evaluate_chunk, start, chunk), start, chunk))
+                start += len(chunk)
+            # Emit finished chunks in order; block on the oldest one when the
+            # read-ahead limit is reached or the input is exhausted
+            while pending and (pending[0][0].done() or len(pending) >= max_pending or not chunk):
+                future, chunk_start, chunk_lines = pending.popleft()
+                for line_number, value, error in future.result():
+                    expression = chunk_lines[line_number - chunk_start].strip()
+                    yield CalculationResult(line_number, expression, value, error)
+            if not chunk:
+                break
+
+
+def process_file(path: str, workers: Optional[int] = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[CalculationResult]:
+    """
+    Stream the results of a calculation file (``-`` reads stdin).
+
+    Memory use is bounded by the longest line, the compile cache and, with
+    several workers, the chunks in flight, not by the size of the file.
+
+    Args:
+        path (str): Calculation file
+        workers (Optional[int]): Worker processes; 1 (the default) evaluates
+            in this process, None uses every usable CPU (see ``parallel_results``)
+        chunk_size (int): Lines per task when using workers
+
+    Raises:
+        OSError: If the file cannot be opened
+        UnicodeDecodeError: If the input is not valid UTF-8 (results of
+            the lines before the bad bytes have been yielded by then)
+    """
+    if path == '-':
+        yield from parallel_results(sys.stdin, workers, chunk_size)
+        return
+    with open(path, encoding='utf-8') as f:
+        yield from parallel_results(f, workers, chunk_size)
+
+
+def format_result(result: CalculationResult) -> str:
+    """Render a result as ``expression = value`` or ``line N: error``."""
+    if result.error is not None:
+        return f"line {result.line_number}: {result.expression}: {result.error}"
+    return f"{result.expression} = {result.value}"
@@ -0,0 +1,6 @@
+"""
+Benchmarks for collaborative math utilities project.
+
+Each module can be run directly, e.g.
+``python -m benchmarks.bench_multiple_regression``.
+"""
@@ -0,0 +1,109 @@
+"""
+Benchmark: in-process code metrics against one subprocess per radon command.
+
+Builds a tree of ``--files`` Python modules (copies of this project's own
+modules) and times two ways of getting cc, mi and raw metrics for all of
+them:
+
+- subprocesses: the three commands ``code_analysis`` used to launch, each
+  in its own interpreter that re-reads and re-parses every file and prints
+  JSON the caller parses back. These are ``python -m radon cc|mi|raw`` when
+  radon is installed, and otherwise equivalent one-metric runs of
+  ``code_metrics`` so that the comparison still works;
+- in-process: ``code_metrics.analyze_file`` per file, one parse shared by
+  all three metrics.
+
+@author: Admin (Repository Owner)
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import code_metrics
+from code_analysis import discover_modules
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# One metric over all files in a fresh interpreter, printing radon-style JSON
+ONE_METRIC = (
+    "import json, sys\n"
+    "sys.path.insert(0, sys.argv[1])\n"
+    "import code_metrics\n"
+    "metric = sys.argv[2]\n"
+    "print(json.dumps({path: code_metrics.analyze_file(path)[metric] for path in sys.argv[3:]}))\n"
+)
+
+
+def build_tree(directory: str, count: int) -> list:
+    """Copy project modules into directory until it holds count files."""
+    sources = discover_modules(ROOT)
+    paths = []
+    for index in range(count):
+        source = sources[index % len(sources)]
+        path = os.path.join(directory, f"module_{index:03d}_{os.path.basename(source)}")
+        shutil.copyfile(os.path.join(ROOT, source), path)
+        paths.append(path)
+    return paths
+
+
+def subprocess_metrics(paths: list) -> dict:
+    """cc, mi and raw from three concurrent subprocesses."""
+    if code_metrics.metrics_version().startswith('radon'):
+        commands = [[sys.executable, '-m', 'radon', metric, '-a', '--json'] + paths
+                    for metric in ('cc', 'mi', 'raw')]
+    else:
+        commands = [[sys.executable, '-c', ONE_METRIC, ROOT, metric] + paths for metric in ('cc', 'mi', 'raw')]
+    processes = [subprocess.Popen(command, stdout=subprocess.PIPE, text=True) for command in commands]
+    cc_data, mi_data, raw_data = [json.loads(process.communicate()[0]) for process in processes]
+    return {path: {'cc': cc_data[path], 'mi': mi_data[path], 'raw': raw_data[path]} for path in paths}
+
+
+def in_process_metrics(paths: list) -> dict:
+    """cc, mi and raw from one parse per file."""
+    return {path: code_metrics.analyze_file(path) for path in paths}
+
+
+def best_of(func, paths: list, repeats: int) -> float:
+    """Fastest of repeats wall-clock runs, in seconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(paths)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--files', type=int, default=50, help='Modules in the tree (default: 50)')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per variant, best is reported (default: 3)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = build_tree(directory, args.files)
+        lines = 0
+        for path in paths:
+            with open(path, 'rb') as f:
+                lines += f.read().count(b'\n')
+        if subprocess_metrics(paths) != in_process_metrics(paths):
+            print("warning: the two variants disagree", file=sys.stderr)
+        old = best_of(subprocess_metrics, paths, args.repeats)
+        new = best_of(in_process_metrics, paths, args.repeats)
+
+    print(f"{args.files} files, {lines} lines, metrics by {code_metrics.metrics_version()}")
+    print(f"subprocesses: {old:.3f}s")
+    print(f"in-process:   {new:.3f}s")
+    print(f"speedup:      {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
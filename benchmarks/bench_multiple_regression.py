@@ -0,0 +1,57 @@
+"""
+Benchmark: cached vs. per-call factorization in multiple_linear_regression.
+
+Fits many response vectors against one design matrix, once refactorizing
+XᵀX on every call and once reusing the cached factorization.
+
+@author: Contributor 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from math_utils import multiple_linear_regression, _cached_solver
+
+
+def run(rows: int, features: int, fits: int, seed: int = 0) -> dict:
+    """Time both strategies and return the elapsed seconds for each."""
+    rng = random.Random(seed)
+    x_data = [[rng.uniform(-1, 1) for _ in range(features)] for _ in range(rows)]
+    responses = [[rng.gauss(0, 1) for _ in range(rows)] for _ in range(fits)]
+
+    start = time.perf_counter()
+    for y_data in responses:
+        multiple_linear_regression(x_data, y_data, use_cache=False)
+    refactorize = time.perf_counter() - start
+
+    _cached_solver.cache_clear()
+    start = time.perf_counter()
+    for y_data in responses:
+        multiple_linear_regression(x_data, y_data)
+    cached = time.perf_counter() - start
+
+    return {'refactorize': refactorize, 'cached': cached}
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000, help='Observations (default: 2000)')
+    parser.add_argument('--features', type=int, default=8, help='Predictors (default: 8)')
+    parser.add_argument('--fits', type=int, default=20, help='Response vectors (default: 20)')
+    args = parser.parse_args()
+
+    timings = run(args.rows, args.features, args.fits)
+    print(f"{args.fits} fits of {args.rows}x{args.features} design matrix")
+    print(f"  refactorize every call: {timings['refactorize']:.4f}s")
+    print(f"  cached factorization:   {timings['cached']:.4f}s")
+    print(f"  speedup:                {timings['refactorize'] / timings['cached']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: outlier detection before and after the two-pass detectors.
+
+Compares the original sort-based / three-pass implementation (kept here as
+``reference_outlier_detection``) with the current ``outlier_detection``,
+``outlier_indices`` (list and NumPy input) and ``StreamingOutlierDetector``.
+
+@author: Contributor 3
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from math_utils import outlier_detection, outlier_indices, StreamingOutlierDetector, _get_numpy
+
+
+def reference_outlier_detection(data, method='iqr'):
+    """The original implementation: full sort for IQR, three passes for z-score."""
+    if method == 'iqr':
+        sorted_data = sorted(data)
+        n = len(sorted_data)
+        q1_idx = n // 4
+        q3_idx = 3 * n // 4
+        if n % 4 == 0:
+            q1 = sorted_data[q1_idx - 1] if q1_idx > 0 else sorted_data[0]
+            q3 = sorted_data[q3_idx - 1] if q3_idx > 0 else sorted_data[-1]
+        else:
+            q1 = sorted_data[q1_idx]
+            q3 = sorted_data[q3_idx]
+        iqr = q3 - q1
+        return [x for x in data if x < q1 - 1.5 * iqr or x > q3 + 1.5 * iqr]
+    mean = sum(data) / len(data)
+    std_dev = math.sqrt(sum((x - mean) ** 2 for x in data) / len(data))
+    if std_dev == 0:
+        return []
+    return [x for x in data if abs((x - mean) / std_dev) > 3]
+
+
+def timed(func, *args) -> float:
+    """Wall time of one call in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def run(size: int, seed: int = 0) -> list:
+    """Time every detector on ``size`` Gaussian values with 0.1% spikes."""
+    rng = random.Random(seed)
+    data = [rng.gauss(0, 1) if rng.random() > 0.001 else rng.uniform(-50, 50) for _ in range(size)]
+    np = _get_numpy()
+    array = np.array(data) if np is not None else None
+
+    rows = []
+    for method in ('iqr', 'z_score', 'mad'):
+        row = {'method': method, 'size': size}
+        if method != 'mad':
+            row['reference'] = timed(reference_outlier_detection, data, method)
+        row['outlier_detection'] = timed(outlier_detection, data, method)
+        row['outlier_indices'] = timed(outlier_indices, data, method)
+        if array is not None:
+            row['outlier_indices[numpy]'] = timed(outlier_indices, array, method)
+        rows.append(row)
+    rows.append({'method': 'streaming z_score', 'size': size,
+                 'StreamingOutlierDetector': timed(StreamingOutlierDetector().update, data)})
+    return rows
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 6, 10 ** 7],
+                        help='Input sizes (default: 1000000 10000000)')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        for row in run(size):
+            timings = ", ".join(f"{key}: {value:.3f}s" for key, value in row.items()
+                                if key not in ('method', 'size'))
+            print(f"n={row['size']:>9} {row['method']:<18} {timings}")
+
+
+if __name__ == "__main__":
+    main()
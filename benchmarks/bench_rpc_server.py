@@ -0,0 +1,131 @@
+"""
+Load generator for the asyncio RPC server.
+
+Starts ``main.py serve --unix`` in a subprocess (or targets a running server
+with ``--tcp HOST:PORT`` / ``--unix PATH``), then runs closed-loop clients
+that each send one request at a time and wait for its response. The mix
+covers the three server paths: batched ``basic_calculator`` calls,
+coalesced identical ``prime_number_generator`` calls, offloaded
+``matrix_multiply`` calls and plain ``statistical_analysis`` calls.
+Reports throughput and p50/p99 latency.
+
+@author: Admin (Repository Owner)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rpc_server import MAX_REQUEST_BYTES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_requests(count: int, seed: int = 0) -> list:
+    """Deterministic request mix."""
+    rng = random.Random(seed)
+    matrix = [[rng.random() for _ in range(20)] for _ in range(20)]
+    requests = []
+    for i in range(count):
+        kind = i % 10
+        if kind < 6:
+            request = {'fn': 'basic_calculator',
+                       'args': [rng.choice(['add', 'subtract', 'multiply', 'divide']),
+                                rng.randint(1, 100), rng.randint(1, 100)]}
+        elif kind < 8:
+            request = {'fn': 'statistical_analysis', 'args': [[rng.gauss(0, 1) for _ in range(50)]]}
+        elif kind == 8:
+            request = {'fn': 'prime_number_generator', 'args': [200000]}
+        else:
+            request = {'fn': 'matrix_multiply', 'args': [matrix, matrix]}
+        request['id'] = i
+        requests.append(request)
+    return requests
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    index = max(0, min(len(values) - 1, int(round(fraction * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+async def run_clients(connect, requests: list, clients: int) -> dict:
+    """Send requests over ``clients`` connections; return latency statistics."""
+    queue = list(reversed(requests))
+    latencies = []
+    errors = 0
+
+    async def client():
+        nonlocal errors
+        reader, writer = await connect()
+        try:
+            while queue:
+                request = queue.pop()
+                start = time.perf_counter()
+                writer.write(json.dumps(request).encode() + b'\n')
+                await writer.drain()
+                response = json.loads(await reader.readline())
+                latencies.append(time.perf_counter() - start)
+                errors += 'error' in response
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {'requests': len(latencies), 'errors': errors, 'seconds': elapsed,
+            'throughput': len(latencies) / elapsed,
+            'p50_ms': percentile(latencies, 0.50) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000}
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000, help='Total requests (default: 2000)')
+    parser.add_argument('--clients', type=int, default=32, help='Concurrent connections (default: 32)')
+    parser.add_argument('--tcp', metavar='HOST:PORT', help='Use a running server on this TCP address')
+    parser.add_argument('--unix', metavar='PATH', help='Use a running server on this Unix socket')
+    args = parser.parse_args()
+
+    server = None
+    tmpdir = None
+    if args.tcp:
+        host, _, port = args.tcp.rpartition(':')
+        connect = lambda: asyncio.open_connection(host, int(port), limit=MAX_REQUEST_BYTES)  # noqa: E731
+    else:
+        path = args.unix
+        if path is None:
+            tmpdir = tempfile.TemporaryDirectory()
+            path = os.path.join(tmpdir.name, 'rpc.sock')
+            server = subprocess.Popen([sys.executable, os.path.join(ROOT, 'main.py'), 'serve', '--unix', path],
+                                      stdout=subprocess.PIPE, text=True)
+            server.stdout.readline()  # "Serving math_utils on ..."
+        connect = lambda: asyncio.open_unix_connection(path, limit=MAX_REQUEST_BYTES)  # noqa: E731
+
+    try:
+        stats = asyncio.run(run_clients(connect, make_requests(args.requests), args.clients))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    print(f"{stats['requests']} requests ({stats['errors']} errors) over {args.clients} clients "
+          f"in {stats['seconds']:.2f}s")
+    print(f"throughput: {stats['throughput']:,.0f} req/s")
+    print(f"latency p50: {stats['p50_ms']:.2f} ms, p99: {stats['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
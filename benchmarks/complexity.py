@@ -0,0 +1,166 @@
+"""
+Empirical complexity: fitted log-log slopes of hot functions.
+
+Runs a function at geometrically increasing sizes and fits the slope of
+log(time) against log(size) by least squares. A function doing O(n**k)
+work has slope k, so an accidental quadratic pass shows up as a slope near
+2 where 1 was expected, long before it is slow enough to notice in a
+benchmark table.
+
+Expected growth is given as a model g(n) such as ``n * log(n)``. Its own
+slope over the same sizes (1.09 for n log n at 10**4..10**5) is what the
+fitted slope is compared with, so models that are not pure powers work
+too.
+
+Each size is timed with ``benchmarks.suite.measure``. The fit uses the
+fastest sample, the least disturbed by other processes, divided by the
+reference workload timed alongside it, which cancels drift in machine
+speed between sizes.
+
+Run as ``python -m benchmarks.complexity`` to print the fitted and
+expected slope of every case; ``tests/test_complexity.py`` asserts them.
+
+@author: Admin (Repository Owner)
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+from collections import namedtuple
+from typing import Callable, List, Optional, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math_utils
+from benchmarks.suite import gaussian, linear_pairs, measure, square_matrix, with_outliers
+
+DEFAULT_TOLERANCE = 0.25
+
+# sizes: geometric; model(n) -> expected work; label: model as printed
+ComplexityCase = namedtuple('ComplexityCase', ['name', 'func', 'make_args', 'sizes', 'model', 'label'])
+
+
+def geometric_sizes(start: int, factor: float = 2.0, count: int = 5) -> List[int]:
+    """count sizes from start, each factor times the previous one."""
+    return [int(round(start * factor ** i)) for i in range(count)]
+
+
+def linear(n: float) -> float:
+    return n
+
+
+def n_log_n(n: float) -> float:
+    return n * math.log(n)
+
+
+def n_log_log_n(n: float) -> float:
+    return n * math.log(math.log(n))
+
+
+def cubic(n: float) -> float:
+    return n ** 3
+
+
+CASES = [
+    # The sort for the median dominates at these sizes, hence n log n
+    ComplexityCase('statistical_analysis', math_utils.statistical_analysis, lambda rng, n: (gaussian(rng, n),),
+                   geometric_sizes(4000), n_log_n, 'n log n'),
+    ComplexityCase('outlier_detection', math_utils.outlier_detection, lambda rng, n: (with_outliers(rng, n),),
+                   geometric_sizes(4000), linear, 'n'),
+    ComplexityCase('outlier_indices', math_utils.outlier_indices, lambda rng, n: (with_outliers(rng, n),),
+                   geometric_sizes(4000), linear, 'n'),
+    ComplexityCase('data_normalization', math_utils.data_normalization, lambda rng, n: (gaussian(rng, n),),
+                   geometric_sizes(4000), linear, 'n'),
+    ComplexityCase('linear_regression', math_utils.linear_regression, linear_pairs,
+                   geometric_sizes(4000), linear, 'n'),
+    ComplexityCase('prime_number_generator', math_utils.prime_number_generator, lambda rng, n: (n,),
+                   geometric_sizes(25000), n_log_log_n, 'n log log n'),
+    # Size is the side length of the square matrices
+    ComplexityCase('matrix_multiply', math_utils.matrix_multiply,
+                   lambda rng, n: (square_matrix(rng, n * n), square_matrix(rng, n * n)),
+                   geometric_sizes(16, 1.5), cubic, 'n^3'),
+]
+
+
+def fit_slope(sizes: Sequence[float], times: Sequence[float]) -> float:
+    """
+    Least-squares slope of log(times) against log(sizes).
+
+    Raises:
+        ValueError: If there are fewer than two distinct sizes, the lengths
+            differ, or a size or time is not positive
+    """
+    if len(sizes) != len(times):
+        raise ValueError("sizes and times must have the same length")
+    if any(value <= 0 for value in list(sizes) + list(times)):
+        raise ValueError("sizes and times must be positive")
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(time) for time in times]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sxy = 0.0
+    for x, y in zip(xs, ys):
+        dx = x - x_mean
+        sxx += dx * dx
+        sxy += dx * (y - y_mean)
+    if sxx == 0:
+        raise ValueError("At least two distinct sizes are required")
+    return sxy / sxx
+
+
+def model_slope(model: Callable[[float], float], sizes: Sequence[float]) -> float:
+    """Slope ``fit_slope`` gives for time exactly proportional to model."""
+    return fit_slope(sizes, [model(size) for size in sizes])
+
+
+def scaling_times(func: Callable, make_args: Callable, sizes: Sequence[int], repeats: int = 5,
+                  seed: int = 0) -> List[float]:
+    """
+    Relative time of func at each size: the fastest sample divided by the
+    reference workload timed alongside it.
+
+    Args:
+        func (Callable): Function to time
+        make_args (Callable): (rng, size) -> positional arguments
+        sizes (Sequence[int]): Sizes to time
+        repeats (int): Samples per size
+        seed (int): Seed of the generated data
+    """
+    times = []
+    for size in sizes:
+        args = make_args(random.Random(f"complexity:{size}:{seed}"), size)
+        timing = measure(func, args, repeats)
+        times.append(timing['min_ns'] / timing['reference_ns'])
+    return times
+
+
+def case_slopes(case: ComplexityCase, repeats: int = 5):
+    """Fitted and expected slope of one case."""
+    return (fit_slope(case.sizes, scaling_times(case.func, case.make_args, case.sizes, repeats)),
+            model_slope(case.model, case.sizes))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; exit status 1 if a slope is off by more than the tolerance."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--filter', metavar='NAME', help='Only cases whose name contains NAME')
+    parser.add_argument('--repeats', type=int, default=5, help='Samples per size (default: 5)')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed difference from the expected slope (default: {DEFAULT_TOLERANCE})')
+    args = parser.parse_args(argv)
+
+    status = 0
+    for case in CASES:
+        if args.filter and args.filter not in case.name:
+            continue
+        fitted, expected = case_slopes(case, args.repeats)
+        verdict = "ok" if abs(fitted - expected) <= args.tolerance else "UNEXPECTED"
+        status = status or int(verdict != "ok")
+        print(f"{case.name:<24} sizes {case.sizes[0]}..{case.sizes[-1]:<8} slope {fitted:5.2f}, "
+              f"expected {expected:5.2f} ({case.label})  {verdict}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
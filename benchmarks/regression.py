@@ -0,0 +1,329 @@
+"""
+Performance regression gate: fresh benchmark results against a baseline.
+
+Compares two ``benchmarks.suite`` JSON files entry by entry (function and
+size). An entry counts as a regression only when both checks agree:
+
+- relative median: the current median is more than ``threshold`` (25% by
+  default) above the baseline median, so that small drifts are ignored;
+- Mann-Whitney U: the current samples are significantly slower than the
+  baseline samples (one-sided p below ``alpha``), so that one noisy run
+  does not fail the gate. It is rank-based and makes no normality
+  assumption. With fewer than three samples on either side only the median
+  check applies.
+
+A real slowdown shows at more than one input size, while noise hits
+entries one at a time: a regression at a single size of a function that
+was compared at several sizes is reported as ``unconfirmed`` and does not
+fail the gate. Improvements are detected the same way in the other
+direction. Entries
+skipped or missing on either side, and calls faster than ``NOISE_FLOOR_NS``
+in the baseline, are listed but never fail the gate.
+
+When both files were recorded with ``--memory``, peak memory is compared
+too: growth by more than ``MEMORY_THRESHOLD`` and ``MEMORY_SLACK_BYTES``
+is a memory regression. Allocation sizes don't depend on machine load, so
+one fails the gate at any single size - but they do depend on the Python
+and NumPy builds, so when the environments differ memory regressions are
+only reported (advisory) until the baseline is re-recorded.
+
+Shared and virtual machines drift by tens of percent between runs, and so
+does everything timed on them. The suite times a fixed reference workload
+next to every measurement, and current samples are scaled by the ratio of
+the two runs' reference times before comparing. A function then only
+regresses if it slowed down relative to the machine it ran on. Timings
+still only compare on the same kind of machine, so regenerate the
+baseline (``make bench-baseline``) when the hardware or Python version
+changes.
+
+Run as ``python -m benchmarks.regression current.json`` (exit status 1 on
+regressions) or through ``code_analysis.py --benchmark current.json``.
+
+@author: Admin (Repository Owner)
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Committed baseline, relative to the project root
+BASELINE_FILE = os.path.join('benchmarks', 'baseline.json')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), BASELINE_FILE)
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_ALPHA = 0.05
+MIN_SAMPLES = 3
+# Calls faster than this are dominated by interpreter and cache effects
+NOISE_FLOOR_NS = 20_000
+# Peak memory (``--memory`` results) is nearly deterministic: a relative
+# threshold plus an absolute slack for allocator and freelist effects
+MEMORY_THRESHOLD = 0.10
+MEMORY_SLACK_BYTES = 64 * 1024
+ENVIRONMENT_KEYS = ('python', 'implementation', 'machine', 'cpus', 'numpy')
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Read a ``benchmarks.suite`` results file.
+
+    Raises:
+        ValueError: If the file is not a benchmark results file
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get('results'), list):
+        raise ValueError(f"{path} is not a benchmark results file")
+    return data
+
+
+def mann_whitney_u(baseline: Sequence[float], current: Sequence[float]) -> Tuple[float, float]:
+    """
+    Mann-Whitney U test that current tends to be larger than baseline.
+
+    Uses mid-ranks for ties and the normal approximation with tie and
+    continuity corrections.
+
+    Args:
+        baseline (Sequence[float]): Baseline samples
+        current (Sequence[float]): Current samples
+
+    Returns:
+        Tuple[float, float]: U statistic of current and the one-sided p-value
+
+    Raises:
+        ValueError: If either sample is empty
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        raise ValueError("Both samples must be non-empty")
+    pooled = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    rank_sum = 0.0
+    tie_term = 0
+    n = len(pooled)
+    i = 0
+    while i < n:
+        value = pooled[i][0]
+        j = i
+        while j < n and pooled[j][0] == value:
+            j += 1
+        # positions i..j-1 share the mid-rank of ranks i+1..j
+        rank_sum += (i + 1 + j) / 2 * sum(group for _, group in pooled[i:j])
+        tie_term += (j - i) ** 3 - (j - i)
+        i = j
+    u = rank_sum - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 0.5
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _entries(results: Dict[str, Any]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    return {(entry['function'], entry['size']): entry for entry in results['results']}
+
+
+def _classify(base: Dict[str, Any], new: Dict[str, Any], threshold: float, alpha: float) -> Dict[str, Any]:
+    # Machine speed: > 1 when the current run's reference workload was slower
+    speed = 1.0
+    if base.get('reference_ns') and new.get('reference_ns'):
+        speed = new['reference_ns'] / base['reference_ns']
+    change = new['median_ns'] / speed / base['median_ns'] - 1 if base['median_ns'] else 0.0
+    row = {'baseline_ns': base['median_ns'], 'current_ns': new['median_ns'], 'machine_factor': speed,
+           'change': change, 'p_value': None}
+    base_samples = base.get('samples_ns', [])
+    new_samples = [sample / speed for sample in new.get('samples_ns', [])]
+    slower = faster = True
+    if len(base_samples) >= MIN_SAMPLES and len(new_samples) >= MIN_SAMPLES:
+        _, p_slower = mann_whitney_u(base_samples, new_samples)
+        _, p_faster = mann_whitney_u(new_samples, base_samples)
+        row['p_value'] = min(p_slower, p_faster)
+        slower, faster = p_slower < alpha, p_faster < alpha
+    if change > threshold and slower:
+        row['status'] = 'regression'
+    elif change < -threshold / (1 + threshold) and faster:
+        row['status'] = 'improvement'
+    else:
+        row['status'] = 'unchanged'
+    return row
+
+
+def _compare_memory(base: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    base_bytes, new_bytes = base['peak_bytes'], new['peak_bytes']
+    allowed = max(MEMORY_THRESHOLD * base_bytes, MEMORY_SLACK_BYTES)
+    if new_bytes - base_bytes > allowed:
+        status = 'regression'
+    elif base_bytes - new_bytes > allowed:
+        status = 'improvement'
+    else:
+        status = 'unchanged'
+    return {'baseline_bytes': base_bytes, 'current_bytes': new_bytes,
+            'change': new_bytes / base_bytes - 1 if base_bytes else 0.0, 'status': status,
+            'top_sites': new.get('top_sites', [])[:3]}
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD,
+                    alpha: float = DEFAULT_ALPHA) -> Dict[str, Any]:
+    """
+    Compare current benchmark results against a baseline.
+
+    Args:
+        baseline (Dict[str, Any]): Baseline ``benchmarks.suite`` results
+        current (Dict[str, Any]): Fresh results
+        threshold (float): Relative median slowdown that counts as a
+            regression (a speedup of the same factor counts as an improvement)
+        alpha (float): Significance level of the Mann-Whitney test
+
+    Returns:
+        Dict[str, Any]: 'comparisons' (one row per function and size with
+        baseline_ns and current_ns as measured, machine_factor, change
+        after correcting for it, p_value and status 'regression',
+        'unconfirmed', 'improvement', 'unchanged', 'below_floor',
+        'skipped', 'missing' or 'new'), the
+        'regressions', 'memory_regressions' and 'improvements' counts,
+        'passed', 'warnings' about differing environments and
+        'memory_gate' (False when they differ, so memory regressions don't
+        fail the comparison). Rows of
+        entries profiled with ``--memory`` on both sides also have a
+        'memory' comparison (baseline_bytes, current_bytes, change, status
+        and the current top_sites).
+
+    Raises:
+        ValueError: If threshold is negative or alpha is not in (0, 1)
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    if not 0 < alpha < 1:
+        raise ValueError("alpha must be between 0 and 1")
+    base_entries, new_entries = _entries(baseline), _entries(current)
+    comparisons = []
+    for key in sorted(base_entries.keys() | new_entries.keys()):
+        base, new = base_entries.get(key), new_entries.get(key)
+        row = {'function': key[0], 'size': key[1]}
+        if new is None:
+            row['status'] = 'missing'
+        elif base is None:
+            row['status'] = 'new'
+        elif 'skipped' in base or 'skipped' in new:
+            row['status'] = 'skipped'
+        elif base['median_ns'] < NOISE_FLOOR_NS:
+            row['status'] = 'below_floor'
+        else:
+            row.update(_classify(base, new, threshold, alpha))
+        if row['status'] not in ('missing', 'new', 'skipped') and 'memory' in base and 'memory' in new:
+            row['memory'] = _compare_memory(base['memory'], new['memory'])
+        comparisons.append(row)
+    flagged, compared = Counter(), Counter()
+    for row in comparisons:
+        if 'change' in row:
+            compared[row['function']] += 1
+            flagged[row['function']] += row['status'] == 'regression'
+    counts = Counter()
+    for row in comparisons:
+        if row['status'] == 'regression' and flagged[row['function']] == 1 and compared[row['function']] > 1:
+            row['status'] = 'unconfirmed'
+        counts[row['status']] += 1
+        counts['memory_' + row.get('memory', {}).get('status', 'none')] += 1
+
+    warnings = []
+    base_env, new_env = baseline.get('environment', {}), current.get('environment', {})
+    for key in ENVIRONMENT_KEYS:
+        if base_env.get(key) != new_env.get(key):
+            warnings.append(f"{key} differs: baseline {base_env.get(key)}, current {new_env.get(key)}")
+    regressions, memory_regressions = counts['regression'], counts['memory_regression']
+    memory_gate = not warnings
+    return {'threshold': threshold, 'alpha': alpha,
+            'passed': regressions == 0 and not (memory_gate and memory_regressions),
+            'regressions': regressions, 'memory_regressions': memory_regressions, 'memory_gate': memory_gate,
+            'improvements': counts['improvement'],
+            'warnings': warnings, 'comparisons': comparisons}
+
+
+def _milliseconds(nanoseconds: float) -> str:
+    return f"{nanoseconds / 1e6:.4f} ms"
+
+
+def format_comparison(comparison: Dict[str, Any], show_all: bool = False) -> List[str]:
+    """
+    Per-function diff lines, one per compared entry.
+
+    Each shows the measured medians, then the change after scaling by the
+    machine factor (how much slower the reference workload ran). Peak
+    memory changes get a line of their own, with the top allocation sites
+    of a memory regression.
+
+    Args:
+        comparison (Dict[str, Any]): ``compare_results`` output
+        show_all (bool): Include unchanged, below_floor, skipped, missing
+            and new entries (default: only regressions, unconfirmed
+            regressions and improvements)
+
+    Returns:
+        List[str]: Report lines, ending with a one-line verdict
+    """
+    lines = [f"  ! {warning}" for warning in comparison['warnings']]
+    for row in comparison['comparisons']:
+        label = f"{row['function']} [n={row['size']}]"
+        if show_all or row['status'] in ('regression', 'unconfirmed', 'improvement'):
+            if 'change' not in row:
+                lines.append(f"  {label:<44} {row['status']}")
+            else:
+                p_value = "" if row['p_value'] is None else f", p={row['p_value']:.3f}"
+                marker = {'regression': 'REGRESSION', 'unconfirmed': 'slower at this size only',
+                          'improvement': 'improvement'}.get(row['status'], 'unchanged')
+                lines.append(f"  {label:<44} {_milliseconds(row['baseline_ns']):>14} -> "
+                             f"{_milliseconds(row['current_ns']):>14} {row['change']:+8.1%}{p_value}, "
+                             f"machine x{row['machine_factor']:.2f}  {marker}")
+        memory = row.get('memory')
+        if memory and (show_all or memory['status'] != 'unchanged'):
+            marker = {'regression': 'MEMORY REGRESSION', 'improvement': 'less memory'}.get(memory['status'],
+                                                                                          'unchanged')
+            sites = ", ".join(site['site'] for site in memory['top_sites'])
+            lines.append(f"  {label:<44} {memory['baseline_bytes'] / 1024:>11.1f} KiB -> "
+                         f"{memory['current_bytes'] / 1024:>11.1f} KiB {memory['change']:+8.1%} peak  {marker}"
+                         + (f" ({sites})" if memory['status'] == 'regression' and sites else ""))
+    verdict = "PASSED" if comparison['passed'] else "FAILED"
+    memory_regressions = comparison.get('memory_regressions', 0)
+    advisory = ""
+    if memory_regressions and not comparison.get('memory_gate', True):
+        advisory = " (advisory: environment differs)"
+    lines.append(f"{verdict}: {comparison['regressions']} regressions, {memory_regressions} memory regressions"
+                 f"{advisory}, {comparison['improvements']} improvements "
+                 f"(threshold {comparison['threshold']:.0%}, alpha {comparison['alpha']})")
+    return lines
+
+
+def check_files(current_path: str, baseline_path: str = DEFAULT_BASELINE, threshold: float = DEFAULT_THRESHOLD,
+                alpha: float = DEFAULT_ALPHA) -> Dict[str, Any]:
+    """``compare_results`` of two results files, with their paths recorded."""
+    comparison = compare_results(load_results(baseline_path), load_results(current_path), threshold, alpha)
+    return dict(comparison, baseline=baseline_path, current=current_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; exit status 1 on regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('current', help='Fresh results from python main.py --bench --bench-output FILE')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='Baseline results (default: benchmarks/baseline.json)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Relative median slowdown that fails the gate (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA,
+                        help=f'Mann-Whitney significance level (default: {DEFAULT_ALPHA})')
+    parser.add_argument('--all', action='store_true', help='List every entry, not only the changed ones')
+    args = parser.parse_args(argv)
+
+    try:
+        comparison = check_files(args.current, args.baseline, args.threshold, args.alpha)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    print("\n".join(format_comparison(comparison, args.all)))
+    return 0 if comparison['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,423 @@
+"""
+Benchmark suite: scaling curves for every math_utils function.
+
+Each case times one public function (or class method) at input sizes
+10, 100, ..., 10**7 on deterministic synthetic data, with
+``time.perf_counter_ns``. Every measurement does ``warmup`` untimed calls,
+then ``repeats`` timed samples. Fast calls are looped so each sample lasts
+at least ``MIN_SAMPLE_NS``, and times are reported per call. Sizes stop
+early once the next one is predicted to take longer than ``max_seconds``
+per call, using the growth observed so far, so cubic or memory-heavy
+functions don't run for hours.
+
+Results are JSON: one entry per function and size with the median, the
+quartiles and IQR, and the raw samples, all in nanoseconds per call.
+With ``--memory`` each entry also has a ``memory`` section from an extra
+call under ``tracemalloc``: peak bytes, bytes retained, blocks allocated,
+and the top allocation sites (see ``profile_memory``).
+
+Run as ``python main.py --bench [--filter NAME] [--memory]`` or
+``python -m benchmarks.suite``.
+
+@author: Admin (Repository Owner)
+"""
+
+import argparse
+import fnmatch
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math_utils
+
+DEFAULT_SIZES = tuple(10 ** exponent for exponent in range(1, 8))
+DEFAULT_REPEATS = 5
+DEFAULT_WARMUP = 1
+DEFAULT_MAX_SECONDS = 5.0
+MIN_SAMPLE_NS = 1_000_000
+SCHEMA_VERSION = 1
+DEFAULT_TOP_SITES = 5
+# Keep the harness's own bookkeeping out of allocation sites
+SNAPSHOT_FILTERS = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+
+# name: label in results and for --filter; unit: what size counts;
+# make_args(rng, size) -> positional arguments for func; max_size: hard cap
+# for inputs that grow faster than the size (big Fibonacci integers)
+BenchmarkCase = namedtuple('BenchmarkCase', ['name', 'func', 'make_args', 'unit', 'max_size'])
+
+
+# Deterministic synthetic data
+
+def gaussian(rng: random.Random, n: int) -> List[float]:
+    """n values from N(50, 10)."""
+    return [rng.gauss(50.0, 10.0) for _ in range(n)]
+
+
+def with_outliers(rng: random.Random, n: int) -> List[float]:
+    """Gaussian values with about 1% far-out spikes."""
+    return [rng.gauss(50.0, 10.0) if rng.random() > 0.01 else rng.uniform(200.0, 400.0) for _ in range(n)]
+
+
+def linear_pairs(rng: random.Random, n: int):
+    """x = 0..n-1 and y = 2x + 1 plus unit noise."""
+    x_data = [float(i) for i in range(n)]
+    return x_data, [2.0 * x + 1.0 + rng.gauss(0.0, 1.0) for x in x_data]
+
+
+def design_matrix(rng: random.Random, n: int, predictors: int = 3):
+    """n observations of random predictors and a linear response."""
+    x_data = [[rng.random() for _ in range(predictors)] for _ in range(n)]
+    return x_data, [1.0 + sum(row) + rng.gauss(0.0, 0.1) for row in x_data]
+
+
+def square_matrix(rng: random.Random, size: int) -> List[List[float]]:
+    """Square matrix with about size elements."""
+    side = max(1, math.isqrt(size))
+    return [[rng.random() for _ in range(side)] for _ in range(side)]
+
+
+def operations(rng: random.Random, n: int):
+    """n random basic_calculator operations with non-zero divisors."""
+    ops = [rng.choice(('add', 'subtract', 'multiply', 'divide')) for _ in range(n)]
+    return ops, [rng.uniform(1.0, 100.0) for _ in range(n)], [rng.uniform(1.0, 100.0) for _ in range(n)]
+
+
+def series_batch(rng: random.Random, n: int, length: int = 10):
+    """n // length series of length points each (at least one series)."""
+    count = max(1, n // length)
+    pairs = [linear_pairs(rng, length) for _ in range(count)]
+    return [x for x, _ in pairs], [y for _, y in pairs]
+
+
+# Cases
+
+def _calculator_calls(ops, a, b):
+    calculator = math_utils.basic_calculator
+    for operation, x, y in zip(ops, a, b):
+        calculator(operation, x, y)
+
+
+def _online_regression(x_data, y_data):
+    return math_utils.OnlineLinearRegression().update(x_data, y_data).result()
+
+
+CASES = [
+    BenchmarkCase('basic_calculator', _calculator_calls, operations, 'calls', None),
+    BenchmarkCase('basic_calculator_array', math_utils.basic_calculator_array, operations, 'values', None),
+    BenchmarkCase('fibonacci_sequence', math_utils.fibonacci_sequence, lambda rng, n: (n,), 'terms', 10 ** 5),
+    BenchmarkCase('prime_number_generator', math_utils.prime_number_generator,
+                  lambda rng, n: (max(n, 2),), 'limit', None),
+    BenchmarkCase('matrix_multiply', math_utils.matrix_multiply,
+                  lambda rng, n: (square_matrix(rng, n), square_matrix(rng, n)), 'elements', None),
+    BenchmarkCase('statistical_analysis', math_utils.statistical_analysis,
+                  lambda rng, n: (gaussian(rng, n),), 'values', None),
+    BenchmarkCase('linear_regression', math_utils.linear_regression, linear_pairs, 'points', None),
+    BenchmarkCase('linear_regression_many', math_utils.linear_regression_many, series_batch, 'points', None),
+    BenchmarkCase('multiple_linear_regression',
+                  lambda x, y: math_utils.multiple_linear_regression(x, y, use_cache=False),
+                  design_matrix, 'observations', None),
+    BenchmarkCase('data_normalization', math_utils.data_normalization,
+                  lambda rng, n: (gaussian(rng, n),), 'values', None),
+    BenchmarkCase('outlier_detection', math_utils.outlier_detection,
+                  lambda rng, n: (with_outliers(rng, n),), 'values', None),
+    BenchmarkCase('outlier_indices', math_utils.outlier_indices,
+                  lambda rng, n: (with_outliers(rng, n),), 'values', None),
+    BenchmarkCase('describe', math_utils.describe, lambda rng, n: (with_outliers(rng, n),), 'values', None),
+    BenchmarkCase('Dataset.statistics', lambda data: math_utils.Dataset(data).statistics(),
+                  lambda rng, n: (gaussian(rng, n),), 'values', None),
+    BenchmarkCase('OnlineLinearRegression.update', _online_regression, linear_pairs, 'points', None),
+    BenchmarkCase('NormalEquationsSolver.fit', lambda x, y: math_utils.NormalEquationsSolver(x).fit(y),
+                  design_matrix, 'observations', None),
+    BenchmarkCase('Normalizer.fit_transform', lambda data: math_utils.Normalizer().fit_transform(data),
+                  lambda rng, n: (gaussian(rng, n),), 'values', None),
+    BenchmarkCase('StreamingOutlierDetector.update', lambda data: math_utils.StreamingOutlierDetector().update(data),
+                  lambda rng, n: (with_outliers(rng, n),), 'values', None),
+]
+
+
+def select_cases(pattern: Optional[str] = None) -> List[BenchmarkCase]:
+    """
+    Cases whose name matches pattern: a glob if it contains wildcards,
+    otherwise a case-insensitive substring. None selects every case.
+    """
+    if not pattern:
+        return list(CASES)
+    if any(char in pattern for char in '*?['):
+        return [case for case in CASES if fnmatch.fnmatchcase(case.name, pattern)]
+    return [case for case in CASES if pattern.lower() in case.name.lower()]
+
+
+def make_args(case: BenchmarkCase, size: int, seed: int = 0) -> tuple:
+    """Arguments for one case and size; the same seed always gives the same data."""
+    return case.make_args(random.Random(f"{case.name}:{size}:{seed}"), size)
+
+
+def reference_workload() -> int:
+    """Fixed pure-Python work (about a millisecond) that measures machine speed."""
+    total = 0
+    for i in range(20_000):
+        total += i * i % 7
+    return total
+
+
+def _sample(func: Callable, args: tuple, loops: int) -> int:
+    perf_counter_ns = time.perf_counter_ns
+    start = perf_counter_ns()
+    for _ in range(loops):
+        func(*args)
+    return perf_counter_ns() - start
+
+
+def summarize(samples: List[float]) -> dict:
+    """Median, quartiles and IQR of per-call samples in nanoseconds."""
+    ordered = sorted(samples)
+    if len(ordered) > 1:
+        q1, median, q3 = statistics.quantiles(ordered, n=4, method='inclusive')
+    else:
+        q1 = median = q3 = ordered[0]
+    return {'median_ns': median, 'q1_ns': q1, 'q3_ns': q3, 'iqr_ns': q3 - q1,
+            'min_ns': ordered[0], 'max_ns': ordered[-1]}
+
+
+def measure(func: Callable, args: tuple, repeats: int = DEFAULT_REPEATS,
+            warmup: int = DEFAULT_WARMUP) -> dict:
+    """
+    Time func(*args).
+
+    A run of ``reference_workload`` follows every sample; its median
+    ``reference_ns`` tracks how fast the machine was while the samples were
+    taken, so that comparisons can factor out CPU frequency changes and
+    noisy neighbours.
+
+    Returns:
+        dict: loops per sample, per-call samples and their ``summarize``,
+        and reference_ns
+    """
+    for _ in range(warmup):
+        func(*args)
+    loops = 1
+    elapsed = _sample(func, args, loops)
+    while elapsed < MIN_SAMPLE_NS and loops < 10 ** 6:
+        loops *= 10
+        elapsed = _sample(func, args, loops)
+    samples = [elapsed / loops]
+    reference = [_sample(reference_workload, (), 1)]
+    for _ in range(repeats - 1):
+        samples.append(_sample(func, args, loops) / loops)
+        reference.append(_sample(reference_workload, (), 1))
+    return dict(summarize(samples), loops=loops, samples_ns=samples, reference_ns=statistics.median(reference))
+
+
+def _site(statistic: tracemalloc.Statistic) -> dict:
+    frame = statistic.traceback[0]
+    return {'site': f"{os.path.basename(frame.filename)}:{frame.lineno}", 'bytes': statistic.size,
+            'blocks': statistic.count}
+
+
+def profile_memory(func: Callable, args: tuple, top: int = DEFAULT_TOP_SITES) -> dict:
+    """
+    Allocations of one func(*args) call under ``tracemalloc``.
+
+    tracemalloc only knows the blocks alive at a given moment, and the
+    memory that matters most (a sort's copy, a sieve's flag list) is freed
+    before the call returns. So a snapshot is taken whenever any function
+    returns with more traced memory than half again the last snapshot; at
+    that point its locals are still alive. The largest snapshot is the one
+    reported. Any tracer already installed (a debugger, coverage) is paused
+    for the call and restored afterwards.
+
+    Returns:
+        dict: peak_bytes (highest traced memory during the call),
+        retained_bytes (still held after it, mostly the result),
+        allocations (blocks alive in the largest snapshot) and top_sites
+        (up to top file:line sites by bytes in that snapshot)
+    """
+    func(*args)  # first-call allocations (imports, caches) are not the function's
+    largest = {'bytes': 0, 'site_stats': []}
+
+    def snapshot():
+        current = tracemalloc.get_traced_memory()[0]
+        if current > largest['bytes'] * 1.5:
+            site_stats = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS).statistics('lineno')
+            largest.update(bytes=current, site_stats=site_stats)
+
+    def tracer(frame, event, arg):
+        if event == 'call':
+            frame.f_trace_lines = False
+            return tracer
+        if event == 'return':
+            snapshot()
+        return None
+
+    tracemalloc.start()
+    try:
+        tracemalloc.clear_traces()
+        previous = sys.gettrace()
+        sys.settrace(tracer)
+        try:
+            result = func(*args)
+        finally:
+            sys.settrace(previous)
+        retained, peak = tracemalloc.get_traced_memory()
+        if not largest['site_stats']:
+            snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+    site_stats = largest['site_stats']
+    return {'peak_bytes': peak, 'retained_bytes': retained,
+            'allocations': sum(statistic.count for statistic in site_stats),
+            'top_sites': [_site(statistic) for statistic in site_stats[:top]]}
+
+
+def run_case(case: BenchmarkCase, sizes=DEFAULT_SIZES, repeats: int = DEFAULT_REPEATS,
+             warmup: int = DEFAULT_WARMUP, max_seconds: float = DEFAULT_MAX_SECONDS,
+             progress: Optional[Callable[[dict], None]] = None, memory: bool = False) -> List[dict]:
+    """
+    Results of one case at each size, smallest first.
+
+    A size is skipped (and recorded with ``skipped``) when the growth seen
+    between the previous two sizes, at least linear, predicts a call longer
+    than max_seconds, or when it exceeds the case's ``max_size``. With
+    memory, each measured size also gets a ``memory`` entry from
+    ``profile_memory``, from a separate call after the timed ones.
+    """
+    results = []
+    previous = []  # (size, median seconds) of the last two measured sizes
+    for size in sorted(sizes):
+        entry = {'function': case.name, 'size': size, 'unit': case.unit}
+        if case.max_size is not None and size > case.max_size:
+            entry['skipped'] = f"above the case limit of {case.max_size}"
+        elif previous:
+            exponent = 1.0
+            if len(previous) == 2 and previous[0][1] > 0:
+                (size_a, time_a), (size_b, time_b) = previous
+                exponent = max(1.0, math.log(time_b / time_a) / math.log(size_b / size_a))
+            predicted = previous[-1][1] * (size / previous[-1][0]) ** exponent
+            if predicted > max_seconds:
+                entry['skipped'] = f"predicted {predicted:.1f}s per call exceeds {max_seconds}s"
+        if 'skipped' not in entry:
+            timing = measure(case.func, make_args(case, size), repeats, warmup)
+            entry.update(timing, repeats=repeats, warmup=warmup)
+            if memory:
+                entry['memory'] = profile_memory(case.func, make_args(case, size))
+            previous = (previous + [(size, timing['median_ns'] / 1e9)])[-2:]
+        results.append(entry)
+        if progress is not None:
+            progress(entry)
+    return results
+
+
+def environment() -> dict:
+    """Interpreter and machine details stored with every result file."""
+    numpy = math_utils._get_numpy()
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'platform': platform.platform(), 'machine': platform.machine(), 'cpus': os.cpu_count(),
+            'numpy': numpy.__version__ if numpy is not None else None}
+
+
+def run_suite(pattern: Optional[str] = None, sizes=DEFAULT_SIZES, repeats: int = DEFAULT_REPEATS,
+              warmup: int = DEFAULT_WARMUP, max_seconds: float = DEFAULT_MAX_SECONDS,
+              progress: Optional[Callable[[dict], None]] = None, memory: bool = False) -> dict:
+    """
+    Run every selected case; the result is what ``main`` writes as JSON.
+
+    With memory, every measured entry also gets ``profile_memory`` results.
+
+    Raises:
+        ValueError: If no case matches pattern, or repeats is not positive
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be positive")
+    cases = select_cases(pattern)
+    if not cases:
+        raise ValueError(f"No benchmark matches {pattern!r}")
+    results = []
+    for case in cases:
+        results.extend(run_case(case, sizes, repeats, warmup, max_seconds, progress, memory))
+    return {'schema': SCHEMA_VERSION, 'created': datetime.now().isoformat(timespec='seconds'),
+            'environment': environment(),
+            'settings': {'sizes': list(sizes), 'repeats': repeats, 'warmup': warmup, 'max_seconds': max_seconds,
+                         'memory': memory},
+            'results': results}
+
+
+def format_entry(entry: dict) -> str:
+    """One human-readable progress line."""
+    label = f"{entry['function']:<32} {entry['size']:>9} {entry['unit']:<12}"
+    if 'skipped' in entry:
+        return f"{label} skipped ({entry['skipped']})"
+    line = f"{label} median {entry['median_ns'] / 1e6:12.4f} ms  IQR {entry['iqr_ns'] / 1e6:10.4f} ms"
+    if 'memory' in entry:
+        memory = entry['memory']
+        sites = ", ".join(site['site'] for site in memory['top_sites'][:2])
+        line += f"  peak {memory['peak_bytes'] / 1024:10.1f} KiB  {memory['allocations']:>8} blocks  ({sites})"
+    return line
+
+
+def run_and_report(pattern: Optional[str] = None, max_size: int = DEFAULT_SIZES[-1],
+                   repeats: int = DEFAULT_REPEATS, max_seconds: float = DEFAULT_MAX_SECONDS,
+                   output: Optional[str] = None, memory: bool = False) -> int:
+    """
+    Run the suite with progress on stderr and write the JSON results.
+
+    Args:
+        pattern (Optional[str]): ``select_cases`` pattern
+        max_size (int): Largest input size
+        repeats (int): Timed samples per size
+        max_seconds (float): Skip sizes predicted to take longer per call
+        output (Optional[str]): JSON file (default: stdout)
+        memory (bool): Also profile allocations with tracemalloc
+
+    Returns:
+        int: Exit status
+    """
+    sizes = [size for size in DEFAULT_SIZES if size <= max_size]
+    try:
+        report = run_suite(pattern, sizes, repeats, DEFAULT_WARMUP, max_seconds,
+                           progress=lambda entry: print(format_entry(entry), file=sys.stderr, flush=True),
+                           memory=memory)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"Results written to {output}", file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--filter', metavar='NAME',
+                        help='Only benchmarks whose name contains NAME (or matches a glob such as "outlier_*")')
+    parser.add_argument('--max-size', type=int, default=DEFAULT_SIZES[-1],
+                        help=f'Largest input size (default: {DEFAULT_SIZES[-1]})')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS,
+                        help=f'Timed samples per size (default: {DEFAULT_REPEATS})')
+    parser.add_argument('--max-seconds', type=float, default=DEFAULT_MAX_SECONDS,
+                        help=f'Skip sizes predicted to take longer per call (default: {DEFAULT_MAX_SECONDS})')
+    parser.add_argument('-o', '--output', help='Write the JSON results to this file instead of stdout')
+    parser.add_argument('--memory', action='store_true',
+                        help='Also record peak memory, allocations and top allocation sites (tracemalloc)')
+    args = parser.parse_args(argv)
+    return run_and_report(args.filter, args.max_size, args.repeats, args.max_seconds, args.output, args.memory)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
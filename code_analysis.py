@@ -8,101 +8,294 @@ Analyzes code complexity, maintainability, and quality metrics.
 import os
 import sys
 import subprocess
+import hashlib
 import json
-from typing import Dict, List, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional
 import argparse
 
+import code_metrics
+import perf_lint
+from benchmarks import regression
+from result_cache import ResultCache
+
+# Seconds each tool may run before it is killed and reported as timed out
+DEFAULT_TIMEOUTS = {'flake8': 60, 'bandit': 120, 'pytest': 600}
+CACHE_DIR = '.code_analysis_cache'
+# Directories never searched for project modules
+EXCLUDED_DIRS = {'tests', '__pycache__', 'build', 'dist', 'htmlcov', 'venv', CACHE_DIR}
+FLAKE8_FORMAT = '%(path)s::%(row)d::%(col)d::%(code)s::%(text)s'
+
+
+def discover_modules(project_root: str = ".") -> List[str]:
+    """Sorted paths, relative to project_root, of the project's Python files (tests excluded)."""
+    modules = []
+    for directory, subdirs, files in os.walk(project_root):
+        subdirs[:] = sorted(d for d in subdirs if d not in EXCLUDED_DIRS and not d.startswith('.'))
+        relative = os.path.relpath(directory, project_root)
+        modules.extend(os.path.normpath(os.path.join(relative, name))
+                       for name in sorted(files) if name.endswith('.py'))
+    return modules
+
 
 class CodeAnalyzer:
-    """Code analysis tool using radon and other quality tools."""
+    """
+    Code analysis tool using radon and other quality tools.
     
-    def __init__(self, project_root: str = "."):
+    ``generate_report`` runs the tools concurrently; each tool's wall time
+    and outcome ('ok', 'timeout' or 'error') end up in ``timings`` and in
+    the report.
+    
+    radon, flake8 and bandit results are kept per file in a ``ResultCache``
+    under ``CACHE_DIR``, keyed by the file's content hash and the tool's
+    version, so a report only runs the tools on files that changed since
+    the last one and merges in the cached results for the rest.
+    
+    Args:
+        project_root (str): Directory the tools run in
+        timeouts (Optional[Dict[str, float]]): Per-tool overrides of
+            ``DEFAULT_TIMEOUTS``
+        use_cache (bool): Reuse and store per-file results
+        modules (Optional[List[str]]): Files to analyze, relative to
+            project_root (default: ``discover_modules``)
+        benchmark (Optional[str]): Fresh ``main.py --bench`` results to
+            check against the baseline (default: no regression check)
+        baseline (Optional[str]): Baseline results (default:
+            ``benchmarks/baseline.json`` under project_root)
+        threshold (float): Relative median slowdown that counts as a
+            performance regression
+    """
+    
+    def __init__(self, project_root: str = ".", timeouts: Optional[Dict[str, float]] = None,
+                 use_cache: bool = True, modules: Optional[List[str]] = None, benchmark: Optional[str] = None,
+                 baseline: Optional[str] = None, threshold: float = regression.DEFAULT_THRESHOLD):
         self.project_root = project_root
         self.results = {}
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.modules = modules if modules is not None else discover_modules(project_root)
+        self.cache = ResultCache(disk_dir=os.path.join(project_root, CACHE_DIR)) if use_cache else None
+        self.timings = {}
+        self.cache_stats = {}
+        self._status = {}
+        self._versions = {}
+        self._digests = None
+        self.benchmark = benchmark
+        self.baseline = baseline or os.path.join(project_root, regression.BASELINE_FILE)
+        self.threshold = threshold
+        self.regression_results = {}
+    
+    def _run_command(self, tool: str, command: List[str]) -> subprocess.CompletedProcess:
+        """Run one tool command in the project root under the tool's timeout."""
+        return subprocess.run(command, capture_output=True, text=True, cwd=self.project_root,
+                              timeout=self.timeouts[tool])
+    
+    def _tool_failed(self, tool: str, error: Exception):
+        """Report a tool failure and remember it for the timing section."""
+        if isinstance(error, subprocess.TimeoutExpired):
+            self._status[tool] = 'timeout'
+            print(f"{tool} timed out after {self.timeouts[tool]}s")
+        else:
+            self._status[tool] = 'error'
+            print(f"Error running {tool} analysis: {error}")
+    
+    def _timed(self, tool: str, analysis):
+        """Run one analysis method and record its wall time and outcome."""
+        start = time.perf_counter()
+        try:
+            return analysis()
+        finally:
+            self.timings[tool] = {'seconds': round(time.perf_counter() - start, 3),
+                                  'status': self._status.pop(tool, 'ok')}
+    
+    def _tool_output(self, tool: str, command: List[str]) -> str:
+        """
+        Stdout of a tool command.
+        
+        Linters exit non-zero when they find issues, so only a run that
+        printed nothing to stdout counts as a failure.
+        
+        Raises:
+            RuntimeError: If the command failed without output
+        """
+        result = self._run_command(tool, command)
+        if result.returncode != 0 and not result.stdout.strip():
+            raise RuntimeError(result.stderr.strip() or f"{command[0]} exited with {result.returncode}")
+        return result.stdout
+    
+    def tool_version(self, tool: str) -> str:
+        """``tool --version`` output, part of every cache key for that tool."""
+        if tool not in self._versions:
+            if tool == 'radon':
+                self._versions[tool] = code_metrics.metrics_version()
+            elif tool == 'perf_lint':
+                self._versions[tool] = f"perf_lint {perf_lint.LINT_VERSION}"
+            else:
+                self._versions[tool] = self._tool_output(tool, [tool, '--version']).strip()
+        return self._versions[tool]
+    
+    def _file_digests(self) -> Dict[str, str]:
+        """SHA-256 of every module's contents, computed once per analyzer."""
+        if self._digests is None:
+            digests = {}
+            for path in self.modules:
+                with open(os.path.join(self.project_root, path), 'rb') as f:
+                    digests[path] = hashlib.sha256(f.read()).hexdigest()
+            self._digests = digests
+        return self._digests
+    
+    def _incremental(self, tool: str, analyze: Callable[[List[str]], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Per-file results of a tool over all modules, running it only on
+        files without a cached result.
+        
+        Args:
+            tool (str): Tool name, as in ``DEFAULT_TIMEOUTS``
+            analyze (Callable): Maps a list of paths to {path: result}
+        
+        Returns:
+            Dict[str, Any]: Result for every module, in module order
+        """
+        if self.cache is None:
+            self.cache_stats[tool] = {'cached': 0, 'analyzed': len(self.modules)}
+            return analyze(self.modules) if self.modules else {}
+        version = self.tool_version(tool)
+        keys = {path: hashlib.blake2b(f"{tool}\0{version}\0{path}\0{digest}".encode(),
+                                      digest_size=20).hexdigest()
+                for path, digest in self._file_digests().items()}
+        missing = object()
+        results = {path: self.cache.get(keys[path], missing) for path in self.modules}
+        stale = [path for path in self.modules if results[path] is missing]
+        if stale:
+            fresh = analyze(stale)
+            for path in stale:
+                results[path] = fresh[path]
+                self.cache.put(keys[path], fresh[path])
+        self.cache_stats[tool] = {'cached': len(self.modules) - len(stale), 'analyzed': len(stale)}
+        return results
+    
+    def _radon_files(self, paths: List[str]) -> Dict[str, Any]:
+        """cc, mi and raw metrics of each path from a single parse (see ``code_metrics``)."""
+        return {path: code_metrics.analyze_file(os.path.join(self.project_root, path)) for path in paths}
     
     def run_radon_analysis(self) -> Dict[str, Any]:
-        """Run radon analysis for complexity and maintainability."""
+        """
+        Run radon analysis for complexity and maintainability.
+        
+        The metrics are computed in-process by ``code_metrics``, through
+        radon's API when it is installed and its own ``ast`` visitor
+        otherwise.
+        
+        Returns:
+            Dict[str, Any]: cyclomatic_complexity, maintainability_index and
+            raw_metrics, each keyed by file path as radon reports them
+        """
         print("Running radon analysis...")
         
         try:
-            # Cyclomatic complexity
-            cc_result = subprocess.run(
-                ['radon', 'cc', 'math_utils.py', '-a', '--json'],
-                capture_output=True, text=True, cwd=self.project_root
-            )
-            cc_data = json.loads(cc_result.stdout) if cc_result.stdout else []
-            
-            # Maintainability index
-            mi_result = subprocess.run(
-                ['radon', 'mi', 'math_utils.py', '-a', '--json'],
-                capture_output=True, text=True, cwd=self.project_root
-            )
-            mi_data = json.loads(mi_result.stdout) if mi_result.stdout else []
-            
-            # Raw metrics
-            raw_result = subprocess.run(
-                ['radon', 'raw', 'math_utils.py', '-a', '--json'],
-                capture_output=True, text=True, cwd=self.project_root
-            )
-            raw_data = json.loads(raw_result.stdout) if raw_result.stdout else []
-            
+            per_file = self._incremental('radon', self._radon_files)
             return {
-                'cyclomatic_complexity': cc_data,
-                'maintainability_index': mi_data,
-                'raw_metrics': raw_data
+                'cyclomatic_complexity': {path: result['cc'] for path, result in per_file.items()},
+                'maintainability_index': {path: result['mi'] for path, result in per_file.items()},
+                'raw_metrics': {path: result['raw'] for path, result in per_file.items()}
             }
             
         except Exception as e:
-            print(f"Error running radon analysis: {e}")
+            self._tool_failed('radon', e)
             return {}
     
-    def run_flake8_analysis(self) -> Dict[str, Any]:
+    def _flake8_files(self, paths: List[str]) -> Dict[str, List[Dict]]:
+        """flake8 issues of each path, in the field names of flake8's JSON formatters."""
+        issues = {path: [] for path in paths}
+        output = self._tool_output('flake8', ['flake8', f'--format={FLAKE8_FORMAT}'] + paths)
+        for line in output.splitlines():
+            fields = line.split('::', 4)
+            if len(fields) == 5:
+                path, row, col, code, text = fields
+                issues.setdefault(os.path.normpath(path), []).append(
+                    {'filename': path, 'line_number': int(row), 'column_number': int(col),
+                     'code': code, 'text': text})
+        return issues
+    
+    def run_flake8_analysis(self) -> List[Dict]:
         """Run flake8 linting analysis."""
         print("Running flake8 analysis...")
         
         try:
-            result = subprocess.run(
-                ['flake8', 'math_utils.py', '--format=json'],
-                capture_output=True, text=True, cwd=self.project_root
-            )
-            
-            if result.stdout:
-                return json.loads(result.stdout)
-            else:
-                return []
+            per_file = self._incremental('flake8', self._flake8_files)
+            return [issue for issues in per_file.values() for issue in issues]
                 
         except Exception as e:
-            print(f"Error running flake8 analysis: {e}")
+            self._tool_failed('flake8', e)
             return []
     
+    def _bandit_files(self, paths: List[str]) -> Dict[str, Dict]:
+        """bandit results and errors of each path."""
+        data = json.loads(self._tool_output('bandit', ['bandit', '-q', '-f', 'json'] + paths) or '{}')
+        per_file = {path: {'results': [], 'errors': []} for path in paths}
+        for section in ('results', 'errors'):
+            for item in data.get(section, []):
+                path = os.path.normpath(item.get('filename', ''))
+                per_file.setdefault(path, {'results': [], 'errors': []})[section].append(item)
+        return per_file
+    
     def run_bandit_analysis(self) -> Dict[str, Any]:
         """Run bandit security analysis."""
         print("Running bandit security analysis...")
         
         try:
-            result = subprocess.run(
-                ['bandit', '-r', '.', '-f', 'json'],
-                capture_output=True, text=True, cwd=self.project_root
-            )
-            
-            if result.stdout:
-                return json.loads(result.stdout)
-            else:
-                return {}
+            per_file = self._incremental('bandit', self._bandit_files)
+            return {section: [item for result in per_file.values() for item in result[section]]
+                    for section in ('results', 'errors')}
                 
         except Exception as e:
-            print(f"Error running bandit analysis: {e}")
+            self._tool_failed('bandit', e)
             return {}
     
+    def run_performance_lint(self) -> List[Dict]:
+        """
+        Run the AST performance checks of ``perf_lint`` over all modules.
+        
+        Returns:
+            List[Dict]: Findings with filename, line, column, code, rule and message
+        """
+        print("Running performance lint...")
+        
+        try:
+            per_file = self._incremental('perf_lint', lambda paths: {
+                path: perf_lint.lint_file(os.path.join(self.project_root, path)) for path in paths})
+            return [dict(finding, filename=path) for path, findings in per_file.items() for finding in findings]
+                
+        except Exception as e:
+            self._tool_failed('perf_lint', e)
+            return []
+    
+    def run_benchmark_regression(self) -> Dict[str, Any]:
+        """
+        Compare the benchmark results given to the analyzer with the baseline.
+        
+        Returns:
+            Dict[str, Any]: ``regression.compare_results`` output with the
+            file paths, {'error': message} if a file can't be read, or {} when
+            no benchmark results were given
+        """
+        if not self.benchmark:
+            return {}
+        print("Checking benchmarks against the baseline...")
+        try:
+            return regression.check_files(self.benchmark, self.baseline, self.threshold)
+        except (OSError, ValueError) as e:
+            print(f"Error checking benchmarks: {e}")
+            return {'error': str(e)}
+    
     def run_pytest_coverage(self) -> Dict[str, Any]:
         """Run pytest with coverage analysis."""
         print("Running pytest coverage analysis...")
         
         try:
-            result = subprocess.run(
-                ['pytest', 'tests/', '--cov=math_utils', '--cov-report=json'],
-                capture_output=True, text=True, cwd=self.project_root
-            )
+            packages = sorted({os.path.splitext(path.split(os.sep)[0])[0] for path in self.modules})
+            self._run_command('pytest', ['pytest', 'tests/', '--cov-report=json'] +
+                              [f'--cov={package}' for package in packages])
             
             # Try to read coverage.json if it exists
             coverage_file = os.path.join(self.project_root, 'coverage.json')
@@ -113,14 +306,30 @@ class CodeAnalyzer:
                 return {}
                 
         except Exception as e:
-            print(f"Error running pytest coverage: {e}")
+            self._tool_failed('pytest', e)
             return {}
     
+    @staticmethod
+    def flatten_complexity(cc_data) -> List[Dict]:
+        """radon cc blocks of all files as one list, names prefixed with their file."""
+        if isinstance(cc_data, list):
+            return cc_data
+        return [dict(block, name=f"{path}:{block.get('name', 'unknown')}")
+                for path, blocks in cc_data.items() if isinstance(blocks, list)
+                for block in blocks]
+    
+    @staticmethod
+    def flatten_maintainability(mi_data) -> List[Dict]:
+        """radon mi results of all files as one list with one entry per file."""
+        if isinstance(mi_data, list):
+            return mi_data
+        return [dict(metrics, name=path) for path, metrics in mi_data.items() if 'mi' in metrics]
+    
     def analyze_function_complexity(self, cc_data: List[Dict]) -> Dict[str, Any]:
         """Analyze function complexity and provide recommendations."""
         analysis = {
             'total_functions': len(cc_data),
-            'complexity_distribution': {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0},
+            'complexity_distribution': {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'E': 0, 'F': 0},
             'high_complexity_functions': [],
             'recommendations': []
         }
@@ -197,26 +406,41 @@ class CodeAnalyzer:
         """Generate comprehensive code analysis report."""
         print("Generating comprehensive code analysis report...")
         
-        # Run all analyses
-        radon_results = self.run_radon_analysis()
-        flake8_results = self.run_flake8_analysis()
-        bandit_results = self.run_bandit_analysis()
-        coverage_results = self.run_pytest_coverage()
+        # Run all analyses at once; each waits on its own subprocesses
+        self.timings = {}
+        self.cache_stats = {}
+        analyses = [('radon', self.run_radon_analysis), ('flake8', self.run_flake8_analysis),
+                    ('bandit', self.run_bandit_analysis), ('pytest', self.run_pytest_coverage),
+                    ('perf_lint', self.run_performance_lint)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(len(analyses)) as pool:
+            futures = [pool.submit(self._timed, tool, analysis) for tool, analysis in analyses]
+            (radon_results, flake8_results, bandit_results, coverage_results,
+             performance_results) = [f.result() for f in futures]
+        self.timings = {tool: self.timings[tool] for tool, _ in analyses}
+        self.timings['total'] = {'seconds': round(time.perf_counter() - start, 3), 'status': 'ok'}
         
         # Analyze results
-        cc_analysis = self.analyze_function_complexity(radon_results.get('cyclomatic_complexity', []))
-        mi_analysis = self.analyze_maintainability(radon_results.get('maintainability_index', []))
+        cc_analysis = self.analyze_function_complexity(
+            self.flatten_complexity(radon_results.get('cyclomatic_complexity', [])))
+        mi_analysis = self.analyze_maintainability(
+            self.flatten_maintainability(radon_results.get('maintainability_index', [])))
+        # Timing-sensitive benchmarks are run beforehand; this only compares files
+        self.regression_results = self.run_benchmark_regression()
         
         # Generate report
         if output_format == 'json':
             return self.generate_json_report(radon_results, flake8_results, bandit_results, 
-                                           coverage_results, cc_analysis, mi_analysis)
+                                           coverage_results, cc_analysis, mi_analysis, performance_results,
+                                           self.regression_results)
         else:
             return self.generate_text_report(radon_results, flake8_results, bandit_results, 
-                                           coverage_results, cc_analysis, mi_analysis)
+                                           coverage_results, cc_analysis, mi_analysis, performance_results,
+                                           self.regression_results)
     
     def generate_text_report(self, radon_results, flake8_results, bandit_results, 
-                           coverage_results, cc_analysis, mi_analysis) -> str:
+                           coverage_results, cc_analysis, mi_analysis, performance_results=None,
+                           regression_results=None) -> str:
         """Generate text format report."""
         report = []
         report.append("=" * 80)
@@ -262,7 +486,8 @@ class CodeAnalyzer:
         if flake8_results:
             report.append(f"Total Issues: {len(flake8_results)}")
             for issue in flake8_results[:10]:  # Show first 10 issues
-                report.append(f"  • Line {issue['line_number']}: {issue['text']}")
+                report.append(f"  • {issue['filename']}, Line {issue['line_number']}: "
+                              f"{issue['code']} {issue['text']}")
             if len(flake8_results) > 10:
                 report.append(f"  ... and {len(flake8_results) - 10} more issues")
         else:
@@ -292,6 +517,40 @@ class CodeAnalyzer:
         else:
             report.append("Coverage data not available")
         
+        # Performance Lint
+        report.append("\n\nPERFORMANCE ANALYSIS")
+        report.append("-" * 40)
+        if performance_results:
+            report.append(f"Performance Issues: {len(performance_results)}")
+            for issue in performance_results[:20]:  # Show first 20 issues
+                report.append(f"  • {issue['filename']}, Line {issue['line']}: {issue['code']} {issue['message']}")
+            if len(performance_results) > 20:
+                report.append(f"  ... and {len(performance_results) - 20} more issues")
+        else:
+            report.append("No performance issues found!")
+        
+        # Benchmark regressions
+        report.append("\n\nPERFORMANCE REGRESSIONS (BENCHMARKS)")
+        report.append("-" * 40)
+        if regression_results and 'error' in regression_results:
+            report.append(f"Benchmark check failed: {regression_results['error']}")
+        elif regression_results:
+            report.append(f"Baseline: {regression_results['baseline']}")
+            report.append(f"Current: {regression_results['current']}")
+            report.extend(regression.format_comparison(regression_results))
+        else:
+            report.append("No benchmark results given (run python main.py --bench --bench-output FILE, "
+                          "then pass --benchmark FILE)")
+        
+        # Tool timings
+        report.append("\n\nTOOL TIMINGS")
+        report.append("-" * 40)
+        for tool, timing in self.timings.items():
+            status = "" if timing['status'] == 'ok' else f" ({timing['status']})"
+            report.append(f"{tool}: {timing['seconds']:.2f}s{status}")
+        for tool, counts in self.cache_stats.items():
+            report.append(f"{tool} cache: {counts['cached']} files reused, {counts['analyzed']} analyzed")
+        
         report.append("\n" + "=" * 80)
         report.append("END OF REPORT")
         report.append("=" * 80)
@@ -299,7 +558,8 @@ class CodeAnalyzer:
         return "\n".join(report)
     
     def generate_json_report(self, radon_results, flake8_results, bandit_results, 
-                           coverage_results, cc_analysis, mi_analysis) -> str:
+                           coverage_results, cc_analysis, mi_analysis, performance_results=None,
+                           regression_results=None) -> str:
         """Generate JSON format report."""
         report = {
             'timestamp': __import__('datetime').datetime.now().isoformat(),
@@ -311,24 +571,44 @@ class CodeAnalyzer:
             },
             'security': bandit_results,
             'coverage': coverage_results.get('totals', {}) if coverage_results else {},
-            'raw_radon_data': radon_results
+            'performance': {
+                'total_issues': len(performance_results or []),
+                'issues': performance_results or []
+            },
+            'benchmarks': regression_results or {},
+            'raw_radon_data': radon_results,
+            'timings': self.timings,
+            'cache': self.cache_stats
         }
         
         return json.dumps(report, indent=2)
 
 
-def main():
-    """Main function for code analysis."""
+def main() -> int:
+    """Main function for code analysis; exit status 1 on benchmark regressions."""
     parser = argparse.ArgumentParser(description='Code Analysis Tool for Math Utilities')
     parser.add_argument('--format', '-f', choices=['text', 'json'], default='text',
                        help='Output format (default: text)')
     parser.add_argument('--output', '-o', help='Output file (default: stdout)')
     parser.add_argument('--project-root', '-p', default='.',
                        help='Project root directory (default: current directory)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'Analyze every file from scratch and leave {CACHE_DIR}/ untouched')
+    parser.add_argument('--timeout', '-t', type=float,
+                       help='Seconds each tool may run (default: per tool, see DEFAULT_TIMEOUTS)')
+    parser.add_argument('--benchmark', '-b', metavar='FILE',
+                       help='Benchmark results (python main.py --bench --bench-output FILE) to check for regressions')
+    parser.add_argument('--baseline', metavar='FILE',
+                       help=f'Baseline benchmark results (default: {regression.BASELINE_FILE})')
+    parser.add_argument('--threshold', type=float, default=regression.DEFAULT_THRESHOLD,
+                       help=f'Relative median slowdown that counts as a regression '
+                            f'(default: {regression.DEFAULT_THRESHOLD})')
     
     args = parser.parse_args()
     
-    analyzer = CodeAnalyzer(args.project_root)
+    timeouts = dict.fromkeys(DEFAULT_TIMEOUTS, args.timeout) if args.timeout else None
+    analyzer = CodeAnalyzer(args.project_root, timeouts, use_cache=not args.no_cache,
+                            benchmark=args.benchmark, baseline=args.baseline, threshold=args.threshold)
     report = analyzer.generate_report(args.format)
     
     if args.output:
@@ -337,7 +617,8 @@ def main():
         print(f"Report saved to {args.output}")
     else:
         print(report)
+    return 1 if analyzer.regression_results.get('passed') is False else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+Code Metrics Module
+In-process cyclomatic complexity, maintainability index and raw metrics for
+``code_analysis.py``.
+
+Each file is parsed once and the same AST feeds all three metrics. When
+radon is installed its Python API does the counting, so the numbers match
+``radon cc`` / ``radon mi`` / ``radon raw``. Without radon a built-in
+``ast`` visitor follows the same rules:
+
+- cyclomatic complexity: 1 per function plus one per ``if``, ``elif``,
+  conditional expression, loop (and its ``else``), ``with``, ``assert``,
+  ``except`` handler (and ``try``'s ``else``), extra boolean operand,
+  comprehension (and its ``if`` clauses) and ``match`` case;
+- maintainability index: radon's formula over Halstead volume, total
+  complexity, logical lines and the comment ratio;
+- raw metrics: loc, lloc, sloc, comments, multi, blank, single_comments.
+
+The results have the shape of radon's JSON output for a single file.
+
+@author: Admin (Repository Owner)
+"""
+
+import ast
+import functools
+import io
+import math
+import sys
+import tokenize
+from typing import Any, Dict, List, Optional
+
+# Bump when the fallback's counting rules change, so cached results are redone
+FALLBACK_VERSION = 1
+CC_RANKS = ((5, 'A'), (10, 'B'), (20, 'C'), (30, 'D'), (40, 'E'))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_radon():
+    try:
+        import radon.cli.tools
+        import radon.complexity
+        import radon.metrics
+        import radon.raw
+        import radon.visitors
+    except ImportError:
+        return None
+    return radon
+
+
+def metrics_version(use_radon: Optional[bool] = None) -> str:
+    """Identifies the implementation (and its version) that produces the metrics."""
+    radon = _get_radon() if use_radon is not False else None
+    if radon is not None:
+        return f"radon {radon.__version__}"
+    return f"ast fallback {FALLBACK_VERSION} (Python {sys.version_info[0]}.{sys.version_info[1]})"
+
+
+def cc_rank(complexity: int) -> str:
+    """Letter grade A-F of a cyclomatic complexity, as radon assigns it."""
+    for limit, rank in CC_RANKS:
+        if complexity <= limit:
+            return rank
+    return 'F'
+
+
+def mi_rank(score: float) -> str:
+    """Letter grade A-C of a maintainability index, as radon assigns it."""
+    return 'A' if score > 19 else 'B' if score > 9 else 'C'
+
+
+def mi_compute(volume: float, complexity: int, sloc: int, comments: float) -> float:
+    """Maintainability index on radon's 0-100 scale; comments is a percentage."""
+    if not all((volume, complexity, sloc)):
+        return 100.0
+    comments_scale = math.sqrt(2.46 * math.radians(comments))
+    score = (171 - 5.2 * math.log(volume) - 0.23 * complexity - 16.2 * math.log(sloc) +
+             50 * math.sin(comments_scale))
+    return min(max(0.0, score * 100 / 171.0), 100.0)
+
+
+def _decision_points(node: ast.AST) -> int:
+    """Branches in node and everything nested in it."""
+    count = 0
+    for child in ast.walk(node):
+        if isinstance(child, (ast.If, ast.IfExp, ast.With, ast.AsyncWith, ast.Assert)):
+            count += 1
+        elif isinstance(child, (ast.For, ast.AsyncFor, ast.While)):
+            count += 1 + bool(child.orelse)
+        elif isinstance(child, ast.Try) or type(child).__name__ == 'TryStar':
+            count += len(child.handlers) + bool(child.orelse)
+        elif isinstance(child, ast.BoolOp):
+            count += len(child.values) - 1
+        elif isinstance(child, ast.comprehension):
+            count += 1 + len(child.ifs)
+        elif type(child).__name__ == 'Match':
+            count += len(child.cases)
+    return count
+
+
+def _block(node: ast.AST, kind: str, complexity: int) -> Dict[str, Any]:
+    return {'type': kind, 'rank': cc_rank(complexity), 'name': node.name, 'lineno': node.lineno,
+            'endline': node.end_lineno, 'col_offset': node.col_offset, 'complexity': complexity}
+
+
+def _collect_blocks(node: ast.AST, functions: list, classes: list, classname: Optional[str] = None):
+    """
+    Functions, and classes with their methods, defined under node.
+
+    Closures are not reported separately: their branches count towards the
+    enclosing function, as ``radon cc`` does without ``--show-closures``.
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            block = _block(child, 'method' if classname else 'function', 1 + _decision_points(child))
+            if classname:
+                block['classname'] = classname
+            block['closures'] = []
+            functions.append(block)
+        elif isinstance(child, ast.ClassDef):
+            methods, inner = [], []
+            _collect_blocks(child, methods, inner, child.name)
+            real = sum(method['complexity'] for method in methods) or 1
+            # radon grades a class by the average of its methods
+            complexity = int(real / len(methods)) + (len(methods) > 1) if methods else real
+            block = _block(child, 'class', complexity)
+            block['methods'] = methods
+            classes.append(block)
+            classes.extend(inner)
+        else:
+            _collect_blocks(child, functions, classes, classname)
+
+
+def _complexity_blocks(tree: ast.AST) -> List[Dict[str, Any]]:
+    functions, classes = [], []
+    _collect_blocks(tree, functions, classes)
+    blocks = functions
+    for cls in classes:
+        blocks.append(cls)
+        blocks.extend(cls['methods'])
+    return blocks
+
+
+def _halstead_volume(tree: ast.AST) -> float:
+    """Halstead volume N * log2(n) over operators and their operands."""
+    operators, operands = [], []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.BinOp):
+            operators.append(type(node.op).__name__)
+            operands.extend((node.left, node.right))
+        elif isinstance(node, ast.UnaryOp):
+            operators.append(type(node.op).__name__)
+            operands.append(node.operand)
+        elif isinstance(node, ast.BoolOp):
+            operators.extend([type(node.op).__name__] * (len(node.values) - 1))
+            operands.extend(node.values)
+        elif isinstance(node, ast.AugAssign):
+            operators.append(type(node.op).__name__)
+            operands.extend((node.target, node.value))
+        elif isinstance(node, ast.Compare):
+            operators.extend(type(op).__name__ for op in node.ops)
+            operands.append(node.left)
+            operands.extend(node.comparators)
+    operand_names = [ast.dump(operand) for operand in operands]
+    vocabulary = len(set(operators)) + len(set(operand_names))
+    length = len(operators) + len(operand_names)
+    return length * math.log2(vocabulary) if vocabulary else 0.0
+
+
+def _raw_metrics(tree: ast.AST, source: str) -> Dict[str, int]:
+    """Line counts; comments come from the token stream, everything else from the AST."""
+    lines = source.splitlines()
+    multi_lines = set()
+    lloc = 0
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.stmt):
+            continue
+        if (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)):
+            if node.end_lineno > node.lineno:
+                multi_lines.update(range(node.lineno, node.end_lineno + 1))
+            continue
+        lloc += 1
+
+    comments = 0
+    comment_lines = set()
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type == tokenize.COMMENT:
+                comments += 1
+                comment_lines.add(token.start[0])
+    except (tokenize.TokenError, SyntaxError):
+        pass
+
+    blank = single_comments = 0
+    for number, line in enumerate(lines, 1):
+        if number in multi_lines:
+            continue
+        stripped = line.strip()
+        if not stripped:
+            blank += 1
+        elif stripped.startswith('#') and number in comment_lines:
+            single_comments += 1
+    loc = len(lines)
+    return {'loc': loc, 'lloc': lloc, 'sloc': loc - blank - single_comments - len(multi_lines),
+            'comments': comments, 'multi': len(multi_lines), 'blank': blank,
+            'single_comments': single_comments}
+
+
+def _fallback_metrics(tree: ast.AST, source: str) -> Dict[str, Any]:
+    blocks = _complexity_blocks(tree)
+    raw = _raw_metrics(tree, source)
+    functions = sum(isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) for node in ast.walk(tree))
+    total_complexity = _decision_points(tree) + functions
+    comments = (raw['comments'] + raw['multi']) / raw['sloc'] * 100 if raw['sloc'] else 0
+    mi = mi_compute(_halstead_volume(tree), total_complexity, raw['lloc'], comments)
+    return {'cc': blocks, 'mi': {'mi': mi, 'rank': mi_rank(mi)}, 'raw': raw}
+
+
+def _radon_metrics(radon, tree: ast.AST, source: str) -> Dict[str, Any]:
+    blocks = radon.complexity.cc_visit_ast(tree)
+    raw = radon.raw.analyze(source)
+    comments = (raw.comments + raw.multi) / raw.sloc * 100 if raw.sloc else 0
+    mi = radon.metrics.mi_compute(radon.metrics.h_visit_ast(tree).total.volume,
+                                  radon.visitors.ComplexityVisitor.from_ast(tree).total_complexity,
+                                  raw.lloc, comments)
+    return {'cc': [radon.cli.tools.cc_to_dict(block) for block in blocks],
+            'mi': {'mi': mi, 'rank': radon.metrics.mi_rank(mi)},
+            'raw': raw._asdict()}
+
+
+def analyze_source(source: str, filename: str = '<string>', use_radon: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Complexity, maintainability and raw metrics of one module's source.
+
+    Args:
+        source (str): Python source code
+        filename (str): Name used in syntax error messages
+        use_radon (Optional[bool]): Force (True) or skip (False) radon;
+            by default it is used when installed
+
+    Returns:
+        Dict[str, Any]: 'cc' (list of blocks), 'mi' ({'mi', 'rank'}) and
+        'raw' (line counts). If the source doesn't parse, each holds
+        {'error': message} instead, as radon reports it.
+
+    Raises:
+        ImportError: If use_radon is True and radon is not installed
+    """
+    radon = _get_radon() if use_radon is not False else None
+    if use_radon and radon is None:
+        raise ImportError("radon is not installed")
+    try:
+        tree = ast.parse(source, filename)
+    except SyntaxError as e:
+        error = {'error': str(e)}
+        return {'cc': error, 'mi': error, 'raw': error}
+    if radon is not None:
+        return _radon_metrics(radon, tree, source)
+    return _fallback_metrics(tree, source)
+
+
+def analyze_file(path: str, use_radon: Optional[bool] = None) -> Dict[str, Any]:
+    """``analyze_source`` of the file at path."""
+    with open(path, 'rb') as f:
+        source = f.read().decode('utf-8', errors='replace')
+    return analyze_source(source, path, use_radon)
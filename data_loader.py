@@ -0,0 +1,540 @@
+"""
+Data Loader Module
+Out-of-core ingestion of large numeric datasets for the statistics functions.
+
+Raw binary float64 files are memory-mapped and exposed as zero-copy
+``memoryview`` chunks; CSV columns are parsed in bounded ``array('d')``
+chunks. Both sources can be passed straight to ``statistical_analysis`` and
+``outlier_detection``, which then run the chunked algorithms below instead
+of building a Python list: moments are merged chunk by chunk and order
+statistics (median, quartiles) are found by histogram refinement over
+repeated passes, so peak memory stays proportional to the chunk size rather
+than the file size. Infinities sort below and above every finite value and
+a NaN makes the order statistics NaN; data holding either costs one more
+pass, to count them.
+
+@author: Contributor 3
+"""
+
+import csv
+import math
+import mmap
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from typing import Iterator, List, Optional, Tuple, Union
+
+from math_utils import _get_numpy, _quartile_ranks
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+SELECT_BUCKETS = 4096
+SELECT_COLLECT_LIMIT = 1 << 16
+MODE_MAX_DISTINCT = 1 << 20
+
+
+class Float64File:
+    """
+    Zero-copy view of a raw binary file of native-endian float64 values.
+
+    Such files are produced by ``array('d').tofile()`` or
+    ``numpy.ndarray.tofile()``. The file is memory-mapped read-only and
+    ``values`` is a ``memoryview`` cast to doubles, so slicing it never
+    copies data. Use as a context manager, or call ``close()``.
+
+    Args:
+        path (str): Path to the binary file
+        chunk_size (int): Number of values per chunk yielded by ``iter_chunks``
+
+    Raises:
+        ValueError: If the file size is not a multiple of 8 bytes
+
+    @author: Contributor 3
+    """
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.path = path
+        self.chunk_size = chunk_size
+        self._file = open(path, 'rb')
+        try:
+            size = self._file.seek(0, 2)
+            if size % 8 != 0:
+                raise ValueError(f"{path} is not a float64 file: size {size} is not a multiple of 8")
+            # mmap refuses empty files, so an empty view stands in for them
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        except Exception:
+            self._file.close()
+            raise
+        self.values = memoryview(self._mmap if self._mmap is not None else b'').cast('d')
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def iter_chunks(self) -> Iterator[memoryview]:
+        """Yield consecutive zero-copy slices of at most ``chunk_size`` values."""
+        values = self.values
+        for start in range(0, len(values), self.chunk_size):
+            yield values[start:start + self.chunk_size]
+
+    def close(self):
+        """Release the view and unmap the file."""
+        self.values.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'Float64File':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvColumn:
+    """
+    One numeric column of a CSV file, parsed lazily in chunks.
+
+    Every call to ``iter_chunks`` re-reads the file, so the column can be
+    scanned several times without ever being held in memory as a whole.
+    Blank lines are skipped.
+
+    Args:
+        path (str): Path to the CSV file
+        column (Union[int, str]): Column index, or column name (implies a header row)
+        has_header (bool): Whether the first row is a header
+        delimiter (str): Field delimiter
+        chunk_size (int): Number of values per chunk yielded by ``iter_chunks``
+
+    @author: Contributor 3
+    """
+
+    def __init__(self, path: str, column: Union[int, str] = 0, has_header: bool = False,
+                 delimiter: str = ',', chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.path = path
+        self.column = column
+        self.has_header = has_header or isinstance(column, str)
+        self.delimiter = delimiter
+        self.chunk_size = chunk_size
+
+    def iter_chunks(self) -> Iterator[array]:
+        """Yield ``array('d')`` chunks of at most ``chunk_size`` parsed values."""
+        with open(self.path, newline='') as f:
+            reader = csv.reader(f, delimiter=self.delimiter)
+            index = self.column
+            if self.has_header:
+                header = next(reader, [])
+                if isinstance(index, str):
+                    if index not in header:
+                        raise ValueError(f"Column {index!r} not found in {self.path}")
+                    index = header.index(index)
+            chunk = array('d')
+            for row in reader:
+                if not row:
+                    continue
+                try:
+                    chunk.append(float(row[index]))
+                except IndexError:
+                    raise ValueError(f"Line {reader.line_num}: missing column {self.column!r}") from None
+                except ValueError:
+                    raise TypeError(f"All data values must be numeric (line {reader.line_num})") from None
+                if len(chunk) >= self.chunk_size:
+                    yield chunk
+                    chunk = array('d')
+            if chunk:
+                yield chunk
+
+
+def is_chunked_source(data) -> bool:
+    """Return True for objects that provide re-iterable ``iter_chunks()``."""
+    return callable(getattr(data, 'iter_chunks', None))
+
+
+def chunk_moments(np, chunk) -> Tuple[int, float, float, float, float]:
+    """Count, mean, centred sum of squares, min and max of one float64 chunk."""
+    n = len(chunk)
+    if np is not None:
+        values = np.frombuffer(chunk, dtype=np.float64)
+        # Infinities and NaN give inf or NaN moments without warnings, as in pure Python
+        with np.errstate(invalid='ignore', over='ignore'):
+            mean = float(values.sum()) / n
+            deviations = values - mean
+            return n, mean, float(deviations.dot(deviations)), float(values.min()), float(values.max())
+    mean = sum(chunk) / n
+    # x * x overflows to inf where x ** 2 raises OverflowError, matching NumPy
+    return n, mean, sum((x - mean) * (x - mean) for x in chunk), min(chunk), max(chunk)
+
+
+def merge_moments(left: Tuple[int, float, float, float, float],
+                  right: Tuple[int, float, float, float, float]) -> Tuple[int, float, float, float, float]:
+    """Combine two ``chunk_moments`` tuples with Chan's pairwise update."""
+    n_left, mean_left, m2_left, min_left, max_left = left
+    n_right, mean_right, m2_right, min_right, max_right = right
+    if n_left == 0:
+        return right
+    if n_right == 0:
+        return left
+    total = n_left + n_right
+    if not (math.isfinite(mean_left) and math.isfinite(mean_right)):
+        # inf - inf in the update would turn an infinite mean into NaN
+        return (total, (mean_left * n_left + mean_right * n_right) / total, math.nan,
+                min(min_left, min_right), max(max_left, max_right))
+    delta = mean_right - mean_left
+    return (total,
+            mean_left + delta * n_right / total,
+            m2_left + m2_right + delta * delta * n_left * n_right / total,
+            min(min_left, min_right),
+            max(max_left, max_right))
+
+
+def streaming_moments(source, count_mode: bool = False) -> dict:
+    """
+    Single pass count, mean, variance, min and max of a chunked source.
+
+    Chunk moments are combined with Chan's pairwise update, so the result
+    matches the in-memory computation to floating-point tolerance.
+
+    Args:
+        source: Object with an ``iter_chunks()`` method
+        count_mode (bool): Also count value frequencies for the mode
+
+    Returns:
+        dict: count, mean, m2 (centred sum of squares), min, max and, when
+        requested, mode (None if there is no mode or more than
+        ``MODE_MAX_DISTINCT`` distinct values were seen)
+
+    Raises:
+        ValueError: If the source is empty
+    """
+    np = _get_numpy()
+    moments = (0, 0.0, 0.0, math.inf, -math.inf)
+    counter = Counter() if count_mode else None
+    for chunk in source.iter_chunks():
+        if len(chunk) == 0:
+            continue
+        moments = merge_moments(moments, chunk_moments(np, chunk))
+        if counter is not None:
+            counter.update(chunk)
+            if len(counter) > MODE_MAX_DISTINCT:
+                counter = None
+    count, mean, m2, low, high = moments
+    if count == 0:
+        raise ValueError("Data cannot be empty")
+
+    result = {'count': count, 'mean': mean, 'm2': m2, 'min': low, 'max': high}
+    if count_mode:
+        result['mode'] = _mode_from_counter(counter, count)
+    return result
+
+
+def _mode_from_counter(counter: Optional[Counter], count: int):
+    """Mode with the same conventions as ``statistical_analysis``."""
+    if counter is None:
+        return None
+    max_count = max(counter.values())
+    mode = [k for k, v in counter.items() if v == max_count]
+    if len(mode) == count and count > 1:
+        return None
+    return mode[0] if len(mode) == 1 else mode
+
+
+def bucket_counts(np, chunks, edges: List[float]) -> Tuple[int, List[int]]:
+    """Count values below ``edges[0]`` and per half-open bucket between edges."""
+    buckets = len(edges) - 1
+    low, high = edges[0], edges[-1]
+    if np is not None:
+        edges = np.asarray(edges)
+    below = 0
+    counts = [0] * buckets
+    for chunk in chunks:
+        if np is not None:
+            values = np.frombuffer(chunk, dtype=np.float64)
+            below += int(np.count_nonzero(values < low))
+            inside = values[(values >= low) & (values < high)]
+            indices = np.searchsorted(edges, inside, side='right') - 1
+            for bucket, n in enumerate(np.bincount(indices, minlength=buckets).tolist()):
+                counts[bucket] += n
+        else:
+            for x in chunk:
+                if x < low:
+                    below += 1
+                elif x < high:
+                    counts[bisect_right(edges, x) - 1] += 1
+    return below, counts
+
+
+def collect_range(np, chunks, low: float, high: float) -> List[float]:
+    """All values in the half-open range [low, high)."""
+    collected = []
+    for chunk in chunks:
+        if np is not None:
+            values = np.frombuffer(chunk, dtype=np.float64)
+            collected.extend(values[(values >= low) & (values < high)].tolist())
+        else:
+            collected.extend(x for x in chunk if low <= x < high)
+    return collected
+
+
+def nonfinite_counts(np, chunks) -> Tuple[int, int, int, int, float, float]:
+    """
+    Counts of -inf, finite, +inf and NaN values, and the finite min and max.
+
+    The finite min and max are inf and -inf when there are no finite values.
+    """
+    negative = finite = positive = nans = 0
+    low, high = math.inf, -math.inf
+    for chunk in chunks:
+        if np is not None:
+            values = np.frombuffer(chunk, dtype=np.float64)
+            finite_values = values[np.isfinite(values)]
+            negative += int(np.count_nonzero(values == -np.inf))
+            positive += int(np.count_nonzero(values == np.inf))
+            nans += int(np.count_nonzero(np.isnan(values)))
+            finite += finite_values.size
+            if finite_values.size:
+                low = min(low, float(finite_values.min()))
+                high = max(high, float(finite_values.max()))
+        else:
+            for x in chunk:
+                if x != x:
+                    nans += 1
+                elif x == math.inf:
+                    positive += 1
+                elif x == -math.inf:
+                    negative += 1
+                else:
+                    finite += 1
+                    low = min(low, x)
+                    high = max(high, x)
+    return negative, finite, positive, nans, low, high
+
+
+def merge_nonfinite_counts(left: Tuple[int, int, int, int, float, float],
+                           right: Tuple[int, int, int, int, float, float]) -> Tuple[int, int, int, int, float, float]:
+    """Combine two ``nonfinite_counts`` tuples."""
+    return tuple(a + b for a, b in zip(left[:4], right[:4])) + (min(left[4], right[4]), max(left[5], right[5]))
+
+
+def _bucket_edges(low: float, high: float) -> List[float]:
+    step = (high - low) / SELECT_BUCKETS
+    if math.isinf(step):
+        # The range is wider than the largest float (e.g. -1e308..1e308)
+        return [low / SELECT_BUCKETS * (SELECT_BUCKETS - i) + high / SELECT_BUCKETS * i
+                for i in range(SELECT_BUCKETS)] + [high]
+    return [low + step * i for i in range(SELECT_BUCKETS)] + [high]
+
+
+def select_kth(k: int, low: float, high: float, count_buckets, collect) -> float:
+    """
+    Exact k-th smallest value (0-based) by histogram refinement.
+
+    Each round histograms the current value range into ``SELECT_BUCKETS``
+    buckets and narrows to the bucket holding rank k; once that bucket holds
+    at most ``SELECT_COLLECT_LIMIT`` values they are collected and sorted.
+    The data itself is only touched through the two callbacks, so the
+    passes can run over chunks in this process or over shards elsewhere.
+
+    low and high must be finite, and the k-th value must lie between
+    them; ``select_ranks`` handles infinities and NaN.
+
+    Args:
+        k (int): Rank to select
+        low (float): Minimum value of the data
+        high (float): Maximum value of the data
+        count_buckets: ``count_buckets(edges) -> (below, counts)``, see ``bucket_counts``
+        collect: ``collect(low, high) -> values`` in the half-open range, see ``collect_range``
+
+    Returns:
+        float: The k-th smallest value
+    """
+    # All ranges are half-open so that every value belongs to exactly one bucket
+    high = math.nextafter(high, math.inf)
+    while True:
+        if math.nextafter(low, math.inf) >= high:
+            return low
+        edges = _bucket_edges(low, high)
+        below, counts = count_buckets(edges)
+        rank = k - below
+        for bucket, n in enumerate(counts):
+            if rank < n:
+                break
+            rank -= n
+        low, high = edges[bucket], edges[bucket + 1]
+        if counts[bucket] <= SELECT_COLLECT_LIMIT:
+            return sorted(collect(low, high))[rank]
+
+
+def select_ranks(ranks: List[int], low: float, high: float, count_buckets, collect,
+                 counts: Optional[Tuple[int, int, int, int, float, float]] = None) -> List[float]:
+    """
+    Exact values at several ranks (0-based), allowing non-finite data.
+
+    Infinities sort below and above every finite value. NaN has no place
+    in the order, so any NaN makes every value NaN, as in ``numpy.median``.
+    Finite ranks are found by ``select_kth`` over the finite range, where
+    the -inf values simply count as below the lowest bucket.
+
+    Args:
+        ranks (List[int]): Ranks to select
+        low (float): Minimum value of the data
+        high (float): Maximum value of the data
+        count_buckets: See ``select_kth``
+        collect: See ``select_kth``
+        counts: ``nonfinite_counts`` of the data; required unless every
+            value is known to be finite
+
+    Returns:
+        List[float]: The value at each rank
+    """
+    if counts is None:
+        return [select_kth(k, low, high, count_buckets, collect) for k in ranks]
+    negative, finite, _, nans, low, high = counts
+    if nans:
+        return [math.nan] * len(ranks)
+    values = []
+    for k in ranks:
+        if k < negative:
+            values.append(-math.inf)
+        elif k >= negative + finite:
+            values.append(math.inf)
+        else:
+            values.append(select_kth(k, low, high, count_buckets, collect))
+    return values
+
+
+def needs_nonfinite_counts(moments: dict) -> bool:
+    """Whether data with these ``streaming_moments`` may hold infinities or NaN."""
+    return not all(math.isfinite(moments[key]) for key in ('mean', 'min', 'max'))
+
+
+def nonfinite_bounds(counts: Tuple[int, int, int, int, float, float]) -> Tuple[float, float]:
+    """
+    Min and max from ``nonfinite_counts``, ignoring NaN like ``min()`` on a list.
+
+    Chunk minima and maxima can't be trusted once a NaN is involved, since
+    every comparison with NaN is false.
+    """
+    negative, finite, positive, _, low, high = counts
+    if not finite:
+        low, high = (math.inf if positive else math.nan), (-math.inf if negative else math.nan)
+    return (-math.inf if negative else low), (math.inf if positive else high)
+
+
+def _nonfinite(source, moments: dict) -> Optional[Tuple[int, int, int, int, float, float]]:
+    if not needs_nonfinite_counts(moments):
+        return None
+    return nonfinite_counts(_get_numpy(), source.iter_chunks())
+
+
+def _select(source, ranks: List[int], moments: dict,
+            counts: Optional[Tuple[int, int, int, int, float, float]]) -> List[float]:
+    np = _get_numpy()
+    return select_ranks(ranks, moments['min'], moments['max'],
+                        lambda edges: bucket_counts(np, source.iter_chunks(), edges),
+                        lambda lo, hi: collect_range(np, source.iter_chunks(), lo, hi), counts)
+
+
+def streaming_select(source, k: int, low: float, high: float) -> float:
+    """
+    Exact k-th smallest value (0-based) of a chunked source.
+
+    Only one bucket's values are ever held in memory; see ``select_kth``.
+    Infinite bounds cost one more pass to count the non-finite values.
+
+    Args:
+        source: Object with an ``iter_chunks()`` method
+        k (int): Rank to select
+        low (float): Minimum value of the source
+        high (float): Maximum value of the source
+
+    Returns:
+        float: The k-th smallest value
+    """
+    moments = {'mean': 0.0, 'min': low, 'max': high}
+    return _select(source, [k], moments, _nonfinite(source, moments))[0]
+
+
+def streaming_statistical_analysis(source) -> dict:
+    """
+    ``statistical_analysis`` for chunked sources without materializing them.
+
+    Mode counting keeps a frequency table of distinct values and is dropped
+    (reported as None) once more than ``MODE_MAX_DISTINCT`` distinct values
+    are seen, which bounds memory on continuous data. Infinities and NaN
+    follow ``select_ranks``.
+
+    Args:
+        source: Object with an ``iter_chunks()`` method
+
+    Returns:
+        dict: Dictionary containing mean, median, mode, std_dev, count, min, max
+
+    Raises:
+        ValueError: If the source is empty
+    """
+    moments = streaming_moments(source, count_mode=True)
+    n = moments['count']
+    counts = _nonfinite(source, moments)
+    if counts is not None:
+        moments['min'], moments['max'] = nonfinite_bounds(counts)
+    middle = _select(source, [n // 2 - 1, n // 2] if n % 2 == 0 else [n // 2], moments, counts)
+
+    return {
+        'mean': moments['mean'],
+        'median': sum(middle) / len(middle),
+        'mode': moments['mode'],
+        'std_dev': math.sqrt(moments['m2'] / n),
+        'count': n,
+        'min': moments['min'],
+        'max': moments['max']
+    }
+
+
+def streaming_outlier_detection(source, method: str = 'iqr') -> List[float]:
+    """
+    ``outlier_detection`` for chunked sources without materializing them.
+
+    Args:
+        source: Object with an ``iter_chunks()`` method
+        method (str): Detection method ('iqr' or 'z_score')
+
+    Returns:
+        List[float]: List of outlier values, in source order
+
+    Raises:
+        ValueError: If the source is empty or method is invalid
+    """
+    if method == 'mad':
+        raise ValueError("Method 'mad' is not supported for chunked sources")
+    if method not in ['iqr', 'z_score']:
+        raise ValueError("Method must be 'iqr', 'z_score' or 'mad'")
+    moments = streaming_moments(source)
+    n = moments['count']
+
+    if method == 'iqr':
+        # Same quartile positions as outlier_detection uses on sorted data
+        q1_idx, q3_idx = _quartile_ranks(n)
+        counts = _nonfinite(source, moments)
+        if counts is not None:
+            moments['min'], moments['max'] = nonfinite_bounds(counts)
+        q1, q3 = _select(source, [q1_idx, q3_idx], moments, counts)
+        iqr = q3 - q1
+        lower_bound = q1 - 1.5 * iqr
+        upper_bound = q3 + 1.5 * iqr
+        if moments['min'] >= lower_bound and moments['max'] <= upper_bound:
+            return []
+        outliers = []
+        for chunk in source.iter_chunks():
+            outliers.extend(x for x in chunk if x < lower_bound or x > upper_bound)
+        return outliers
+
+    mean = moments['mean']
+    std_dev = math.sqrt(moments['m2'] / n)
+    if std_dev == 0:
+        return []  # No outliers if no variance
+    outliers = []
+    for chunk in source.iter_chunks():
+        outliers.extend(x for x in chunk if abs((x - mean) / std_dev) > 3)
+    return outliers
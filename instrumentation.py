@@ -0,0 +1,353 @@
+"""
+Instrumentation Module
+Opt-in call metrics for the math_utils functions: call counts, error counts
+by exception type, and latency and input-size histograms per function.
+
+``enable()`` replaces the public math_utils functions (and their entries
+in ``service.REGISTRY`` when the service is loaded) with recording
+wrappers; ``disable()`` puts the originals back. While disabled nothing is
+wrapped, so the functions run at full speed. A flag checked on every call
+would cost more than a whole ``basic_calculator`` call. Code that bound a
+function with ``from math_utils import ...`` before ``enable()`` keeps
+the unwrapped one.
+
+Only the outermost call is recorded. math_utils calls itself through the
+same module attributes (``outlier_detection`` uses ``outlier_indices``,
+``multiple_linear_regression`` uses ``matrix_multiply``), and counting
+those nested calls would make the counts differ from what callers made and
+the latencies overlap. A context variable marks a recorded call in
+progress; calls made inside it run unrecorded, at the cost of one lookup.
+
+Setting ``MATH_UTILS_METRICS=FILE`` makes ``main.py`` enable recording at
+start-up and merge its metrics into FILE at exit; ``python main.py metrics``
+prints that file. A running ``main.py serve`` also answers
+``{"fn": "metrics"}`` requests with its live metrics. Calls that never go
+through the module attribute are not counted: those in worker processes
+(``batch -w``, ``parallel=True``, the socket server's process pool) and the
+socket server's micro-batches.
+
+Metrics export as JSON or in the Prometheus text exposition format:
+
+    math_utils_calls_total{function="statistical_analysis"} 3
+    math_utils_latency_seconds_bucket{function="statistical_analysis",le="0.001"} 2
+
+Example:
+    >>> import instrumentation, math_utils
+    >>> instrumentation.enable()
+    >>> math_utils.fibonacci_sequence(10)[-1]
+    34
+    >>> instrumentation.METRICS.snapshot()['functions']['fibonacci_sequence']['calls']
+    1
+    >>> instrumentation.disable()
+
+@author: Admin (Repository Owner)
+"""
+
+import atexit
+import bisect
+import contextvars
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import math_utils
+
+METRICS_ENV = 'MATH_UTILS_METRICS'
+# Upper bounds in seconds, and in elements (or the value of an int argument)
+LATENCY_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+SIZE_BUCKETS = (1, 10, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+INSTRUMENTED = ('basic_calculator', 'basic_calculator_array', 'fibonacci_sequence', 'matrix_multiply',
+                'prime_number_generator', 'statistical_analysis', 'linear_regression',
+                'linear_regression_many', 'multiple_linear_regression', 'data_normalization',
+                'outlier_detection', 'outlier_indices', 'describe')
+# Position of the argument whose size is recorded (default 0); None records no size
+SIZE_ARGUMENTS = {'basic_calculator': None, 'basic_calculator_array': 1}
+
+
+def input_size(value: Any) -> Optional[int]:
+    """Number of elements in value, the value itself for an int, otherwise None."""
+    if isinstance(value, (bool, str)):
+        return None
+    if isinstance(value, int):
+        return value
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+class Histogram:
+    """
+    Observation counts per bucket, plus their sum.
+
+    Args:
+        buckets (Sequence[float]): Increasing upper bounds; values above the
+            last one go to an overflow bucket
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'counts': list(self.counts), 'sum': self.sum}
+
+
+class MetricsRegistry:
+    """Thread-safe per-function metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._functions = {}
+
+    def _entry(self, name: str) -> Dict[str, Any]:
+        entry = self._functions.get(name)
+        if entry is None:
+            entry = self._functions[name] = {'calls': 0, 'errors': Counter(),
+                                             'latency': Histogram(LATENCY_BUCKETS),
+                                             'size': Histogram(SIZE_BUCKETS)}
+        return entry
+
+    def record(self, name: str, seconds: float, size: Optional[int] = None, error: Optional[str] = None):
+        """Count one call of name that took seconds and raised error (an exception type name)."""
+        with self._lock:
+            entry = self._entry(name)
+            entry['calls'] += 1
+            entry['latency'].observe(seconds)
+            if size is not None:
+                entry['size'].observe(size)
+            if error is not None:
+                entry['errors'][error] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable copy of all metrics."""
+        with self._lock:
+            functions = {name: {'calls': entry['calls'], 'errors': dict(entry['errors']),
+                                'latency': entry['latency'].to_dict(), 'size': entry['size'].to_dict()}
+                         for name, entry in sorted(self._functions.items())}
+        return {'latency_buckets': list(LATENCY_BUCKETS), 'size_buckets': list(SIZE_BUCKETS),
+                'functions': functions}
+
+    def merge(self, snapshot: Dict[str, Any]):
+        """
+        Add the counts of a snapshot (from another process or an earlier run).
+
+        Raises:
+            ValueError: If the snapshot uses different bucket bounds
+        """
+        if (snapshot.get('latency_buckets') != list(LATENCY_BUCKETS)
+                or snapshot.get('size_buckets') != list(SIZE_BUCKETS)):
+            raise ValueError("Snapshot buckets do not match")
+        with self._lock:
+            for name, data in snapshot['functions'].items():
+                entry = self._entry(name)
+                entry['calls'] += data['calls']
+                entry['errors'].update(data['errors'])
+                for kind in ('latency', 'size'):
+                    histogram = entry[kind]
+                    histogram.counts = [a + b for a, b in zip(histogram.counts, data[kind]['counts'])]
+                    histogram.sum += data[kind]['sum']
+
+    def reset(self):
+        """Forget all recorded calls."""
+        with self._lock:
+            self._functions.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(entry['calls'] for entry in self._functions.values())
+
+
+METRICS = MetricsRegistry()
+
+_originals: Dict[str, Callable] = {}
+# True inside a recorded call, so that nested calls are not recorded
+_recording = contextvars.ContextVar('math_utils_recording', default=False)
+
+
+def instrument(func: Callable, name: Optional[str] = None, registry: MetricsRegistry = METRICS,
+               size_argument: Optional[int] = 0) -> Callable:
+    """
+    Return a version of func that records every call in registry, except
+    calls made while another recorded call is running.
+
+    Args:
+        func (Callable): Function to wrap
+        name (Optional[str]): Metric label (default: func.__name__)
+        registry (MetricsRegistry): Where calls are recorded
+        size_argument (Optional[int]): Position of the argument whose
+            ``input_size`` is recorded; None records no size
+    """
+    label = name or func.__name__
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _recording.get():
+            return func(*args, **kwargs)
+        size = None
+        if size_argument is not None and len(args) > size_argument:
+            size = input_size(args[size_argument])
+        token = _recording.set(True)
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            registry.record(label, perf_counter() - start, size, type(e).__name__)
+            raise
+        finally:
+            _recording.reset(token)
+        registry.record(label, perf_counter() - start, size)
+        return result
+
+    return wrapper
+
+
+def _swap_service(replacements: Dict[Callable, Callable]):
+    service = sys.modules.get('service')
+    if service is not None:
+        for name, func in service.REGISTRY.items():
+            if func in replacements:
+                service.REGISTRY[name] = replacements[func]
+
+
+def enable():
+    """Start recording calls of the math_utils functions in ``METRICS``; repeated calls do nothing."""
+    if _originals:
+        return
+    replacements = {}
+    for name in INSTRUMENTED:
+        original = getattr(math_utils, name)
+        _originals[name] = original
+        replacements[original] = instrument(original, name, METRICS, SIZE_ARGUMENTS.get(name, 0))
+        setattr(math_utils, name, replacements[original])
+    _swap_service(replacements)
+
+
+def disable():
+    """Put the original math_utils functions back; recorded metrics are kept."""
+    replacements = {}
+    for name, original in _originals.items():
+        replacements[getattr(math_utils, name)] = original
+        setattr(math_utils, name, original)
+    _swap_service(replacements)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable_from_environment() -> Optional[str]:
+    """
+    ``enable()`` and save to the file named by ``METRICS_ENV`` at exit, if set.
+
+    Returns:
+        Optional[str]: The metrics file, or None if the variable is unset
+    """
+    path = os.environ.get(METRICS_ENV)
+    if not path:
+        return None
+    enable()
+    atexit.register(save, path)
+    return path
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _histogram_lines(metric: str, function: str, bounds: Sequence[float], data: Dict[str, Any]) -> list:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(list(bounds) + ['+Inf'], data['counts']):
+        cumulative += count
+        lines.append(f"{metric}_bucket{_labels(function=function, le=bound)} {cumulative}")
+    lines.append(f"{metric}_sum{_labels(function=function)} {data['sum']}")
+    lines.append(f"{metric}_count{_labels(function=function)} {cumulative}")
+    return lines
+
+
+def to_prometheus(snapshot: Dict[str, Any]) -> str:
+    """A snapshot in the Prometheus text exposition format."""
+    functions = snapshot['functions']
+    lines = ["# HELP math_utils_calls_total Calls per function.",
+             "# TYPE math_utils_calls_total counter"]
+    lines.extend(f"math_utils_calls_total{_labels(function=name)} {data['calls']}"
+                 for name, data in functions.items())
+    lines += ["# HELP math_utils_errors_total Calls that raised, per function and exception type.",
+              "# TYPE math_utils_errors_total counter"]
+    lines.extend(f"math_utils_errors_total{_labels(function=name, exception=error)} {count}"
+                 for name, data in functions.items() for error, count in sorted(data['errors'].items()))
+    lines += ["# HELP math_utils_latency_seconds Call latency per function.",
+              "# TYPE math_utils_latency_seconds histogram"]
+    for name, data in functions.items():
+        lines.extend(_histogram_lines('math_utils_latency_seconds', name, snapshot['latency_buckets'],
+                                      data['latency']))
+    lines += ["# HELP math_utils_input_size Elements (or int value) of the main argument per call.",
+              "# TYPE math_utils_input_size histogram"]
+    for name, data in functions.items():
+        if sum(data['size']['counts']):
+            lines.extend(_histogram_lines('math_utils_input_size', name, snapshot['size_buckets'], data['size']))
+    return "\n".join(lines) + "\n"
+
+
+def metrics_report(output_format: str = 'json'):
+    """
+    Live metrics of this process, the ``metrics`` function of the service.
+
+    Raises:
+        ValueError: If output_format is not 'json' or 'prometheus'
+    """
+    if output_format == 'json':
+        return METRICS.snapshot()
+    if output_format == 'prometheus':
+        return to_prometheus(METRICS.snapshot())
+    raise ValueError("Format must be 'json' or 'prometheus'")
+
+
+def load(path: str) -> Dict[str, Any]:
+    """Snapshot saved by ``save``."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save(path: str, registry: MetricsRegistry = METRICS):
+    """
+    Merge the registry's metrics into the snapshot file at path.
+
+    The file is replaced atomically. A file with different buckets, or that
+    isn't a snapshot, is overwritten.
+    """
+    if not len(registry):
+        return
+    combined = MetricsRegistry()
+    combined.merge(registry.snapshot())
+    try:
+        combined.merge(load(path))
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(combined.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
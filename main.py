@@ -10,8 +10,12 @@ functions are added by contributors.
 """
 
 import argparse
+import os
 import sys
-from math_utils import basic_calculator, statistical_analysis, linear_regression, data_normalization, outlier_detection
+
+# Subcommands import what they need when they run, so that a quick
+# ``main.py primes 100`` does not pay for NumPy, the analysis tools or the
+# server modules.
 
 
 def demo_functions():
@@ -21,6 +25,9 @@ def demo_functions():
     This function will be updated as new functions are added by team members.
     It showcases the integration of all mathematical utilities in a meaningful way.
     """
+    from math_utils import (basic_calculator, statistical_analysis, linear_regression,
+                            data_normalization, outlier_detection)
+    
     print("=" * 60)
     print("COLLABORATIVE MATH UTILITIES - DEMONSTRATION")
     print("=" * 60)
@@ -113,9 +120,279 @@ def demo_functions():
     print("=" * 60)
 
 
-def main():
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+def run_batch(path: str, workers: int = 1, chunk_size: int = None, output: str = None) -> int:
+    """
+    Evaluate a calculation file such as sample_calculations.txt.
+    
+    Results are written in input order as soon as they are ready; invalid
+    lines are reported on stderr with their line number and do not stop
+    the batch. A throughput summary is printed to stderr at the end.
+    
+    Args:
+        path (str): Calculation file ('-' for stdin)
+        workers (int): Worker processes (None for one per usable CPU)
+        chunk_size (int): Lines per worker task
+        output (str): File to write results to instead of stdout
+    
+    Returns:
+        int: Exit status, 1 if any line failed
+    """
+    import time
+    from batch_calculator import process_file, format_result, DEFAULT_CHUNK_SIZE
+    
+    lines = failed = 0
+    start = time.perf_counter()
+    try:
+        out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+        try:
+            for result in process_file(path, workers, chunk_size or DEFAULT_CHUNK_SIZE):
+                lines += 1
+                if result.error is not None:
+                    failed += 1
+                    print(format_result(result), file=sys.stderr)
+                else:
+                    print(format_result(result), file=out)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except UnicodeDecodeError as e:
+        print(f"Error: {path}: not valid UTF-8 ({e})", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    rate = lines / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {lines} expressions ({failed} failed) in {elapsed:.2f}s "
+          f"({rate:,.0f} lines/s)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def column_spec(value: str):
+    """argparse type for --column: an index, or a header name."""
+    return int(value) if value.isdigit() else value
+
+
+def _parse_number(token: str):
+    """int if the token is an integer literal, else float (ValueError otherwise)."""
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _open_input(path: str):
+    """Text stream for path, with '-' meaning stdin (which is left open)."""
+    return sys.stdin if path == '-' else open(path, encoding='utf-8')
+
+
+def run_sequence(name: str, values: list) -> int:
+    """
+    Print ``prime_number_generator`` or ``fibonacci_sequence`` results.
+    
+    Each value (or, without values, each non-blank stdin line) is one
+    argument; its result is printed as one space-separated line as soon as
+    it is computed.
+    
+    Args:
+        name (str): 'primes' or 'fib'
+        values (list): Arguments from the command line
+    
+    Returns:
+        int: Exit status, 1 if any argument was invalid
+    """
+    if name == 'primes':
+        from math_utils import prime_number_generator as func
+    else:
+        from math_utils import fibonacci_sequence as func
+    
+    status = 0
+    tokens = values or (line.strip() for line in sys.stdin if line.strip())
+    for token in tokens:
+        try:
+            result = func(int(token))
+        except (TypeError, ValueError) as e:
+            print(f"Error: {token}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(" ".join(map(str, result)))
+    return status
+
+
+def read_matrix(path: str) -> list:
+    """
+    Read a matrix file: one row per line, values separated by whitespace or commas.
+    
+    Raises:
+        ValueError: If a value is not a number
+    """
+    matrix = []
+    stream = _open_input(path)
+    try:
+        for line_number, line in enumerate(stream, 1):
+            tokens = line.replace(',', ' ').split()
+            if not tokens:
+                continue
+            try:
+                matrix.append([_parse_number(token) for token in tokens])
+            except ValueError:
+                raise ValueError(f"{path}, line {line_number}: all matrix values must be numeric") from None
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return matrix
+
+
+def run_matmul(path_a: str, path_b: str) -> int:
+    """Print the product of two matrix files, one row per line."""
+    from math_utils import matrix_multiply
+    
+    try:
+        product = matrix_multiply(read_matrix(path_a), read_matrix(path_b))
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for row in product:
+        print(" ".join(map(str, row)))
+    return 0
+
+
+def _print_fields(result: dict, keys: tuple):
+    for key in keys:
+        print(f"{key}: {result[key]}")
+
+
+def run_stats(path: str, column=0, has_header: bool = False, delimiter: str = ',') -> int:
+    """
+    Print ``statistical_analysis`` of one CSV column without loading the file.
+    
+    The column is read through ``data_loader.CsvColumn`` in bounded chunks.
+    That needs a file it can re-read, so stdin ('-') is first spooled to a
+    temporary file.
+    
+    Returns:
+        int: Exit status
+    """
+    import tempfile
+    from data_loader import CsvColumn
+    from math_utils import statistical_analysis
+    
+    spool = None
+    try:
+        if path == '-':
+            spool = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False)
+            with spool:
+                for block in iter(lambda: sys.stdin.read(1 << 16), ''):
+                    spool.write(block)
+            path = spool.name
+        result = statistical_analysis(CsvColumn(path, column, has_header, delimiter))
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if spool is not None:
+            os.unlink(spool.name)
+    _print_fields(result, ('count', 'mean', 'median', 'mode', 'std_dev', 'min', 'max'))
+    return 0
+
+
+def run_regress(path: str, has_header: bool = False, delimiter: str = ',',
+                chunk_size: int = 1 << 16) -> int:
+    """
+    Print the least squares fit of the x,y pairs in a CSV file.
+    
+    Rows are folded into an ``OnlineLinearRegression`` ``chunk_size`` pairs
+    at a time, so memory stays bounded however long the input is.
+    
+    Returns:
+        int: Exit status
+    """
+    import csv
+    from math_utils import OnlineLinearRegression
+    
+    model = OnlineLinearRegression()
+    stream = None
+    try:
+        stream = _open_input(path)
+        reader = csv.reader(stream, delimiter=delimiter)
+        if has_header:
+            next(reader, None)
+        x_chunk, y_chunk = [], []
+        for row in reader:
+            if not row:
+                continue
+            try:
+                x_chunk.append(float(row[0]))
+                y_chunk.append(float(row[1]))
+            except IndexError:
+                raise ValueError(f"Line {reader.line_num}: expected x{delimiter}y") from None
+            except ValueError:
+                raise TypeError(f"All data values must be numeric (line {reader.line_num})") from None
+            if len(x_chunk) >= chunk_size:
+                model.update(x_chunk, y_chunk)
+                x_chunk, y_chunk = [], []
+        model.update(x_chunk, y_chunk)
+        result = model.result()
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if stream is not None and stream is not sys.stdin:
+            stream.close()
+    print(f"count: {model.n}")
+    _print_fields(result, ('slope', 'intercept', 'r_squared', 'correlation', 'equation'))
+    return 0
+
+
+def run_metrics(path: str = None, output_format: str = 'prometheus') -> int:
+    """
+    Print the call metrics saved by earlier runs with ``MATH_UTILS_METRICS`` set.
+    
+    Args:
+        path (str): Metrics file (default: ``$MATH_UTILS_METRICS``)
+        output_format (str): 'prometheus' or 'json'
+    
+    Returns:
+        int: Exit status
+    """
+    import json
+    import instrumentation
+    
+    path = path or os.environ.get(instrumentation.METRICS_ENV)
+    if not path:
+        print(f"Error: no metrics file; run commands with {instrumentation.METRICS_ENV}=FILE or pass --file",
+              file=sys.stderr)
+        return 1
+    try:
+        snapshot = instrumentation.load(path)
+        if output_format == 'json':
+            text = json.dumps(snapshot, indent=2) + "\n"
+        else:
+            text = instrumentation.to_prometheus(snapshot)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    sys.stdout.write(text)
+    return 0
+
+
+def main(argv: list = None) -> int:
     """
     Main driver function with multiple interface options.
+    
+    Args:
+        argv (list): Command line arguments (default: ``sys.argv[1:]``)
+    
+    Returns:
+        int: Exit status
     """
     parser = argparse.ArgumentParser(
         description='Math Utilities - Collaborative Project',
@@ -124,20 +401,118 @@ def main():
 Examples:
   python main.py                    # Run demonstration
   python main.py --analysis         # Run code analysis
+  python main.py --bench --filter outlier  # Time matching functions at sizes 10..10^7 (JSON on stdout)
+  python main.py batch sample_calculations.txt  # Evaluate a calculation file
+  python main.py batch big.txt -w 8 -o out.txt  # ... across 8 worker processes
+  python main.py serve --jsonl      # JSON-lines request/response worker
+  python main.py serve --tcp 127.0.0.1:8765  # Same protocol over a local socket
+  python main.py primes 100         # Primes up to 100 (one limit per stdin line without arguments)
+  python main.py fib 10 20          # First 10 and first 20 Fibonacci numbers
+  python main.py stats data.csv --column 2  # Statistics of a CSV column ('-' for stdin)
+  python main.py matmul a.txt b.txt # Product of two whitespace- or comma-separated matrices
+  python main.py regress points.csv # Least squares fit of x,y rows (stdin by default)
+  MATH_UTILS_METRICS=m.json python main.py serve --jsonl  # Record call metrics into m.json
+  python main.py metrics --file m.json  # Print them in Prometheus text format
         """
     )
+    subparsers = parser.add_subparsers(dest='command')
+    batch_parser = subparsers.add_parser('batch', help='Evaluate a file of arithmetic expressions')
+    batch_parser.add_argument('file', help="Calculation file, one expression per line ('-' for stdin)")
+    batch_parser.add_argument('-w', '--workers', type=positive_int, default=None,
+                              help='Worker processes (default: one per CPU; 1 runs in-process)')
+    batch_parser.add_argument('-c', '--chunk-size', type=positive_int, default=None,
+                              help='Lines per worker task (default: 10000)')
+    batch_parser.add_argument('-o', '--output', help='Write results to this file instead of stdout')
+    serve_parser = subparsers.add_parser('serve', help='Answer requests from other programs until input ends')
+    serve_parser.add_argument('--jsonl', action='store_true',
+                              help='Read JSON requests from stdin and write JSON responses to stdout, one per line')
+    serve_parser.add_argument('--tcp', metavar='HOST:PORT',
+                              help='Serve the same protocol to socket clients on a TCP address')
+    serve_parser.add_argument('--unix', metavar='PATH',
+                              help='Serve the same protocol to socket clients on a Unix socket')
+    serve_parser.add_argument('-w', '--workers', type=positive_int, default=None,
+                              help='Requests processed concurrently with --jsonl (default: 4); '
+                                   'processes for CPU-heavy functions with --tcp/--unix (default: one per CPU)')
+    serve_parser.add_argument('--processes', action='store_true',
+                              help='With --jsonl, use worker processes instead of threads for CPU-bound requests')
+    primes_parser = subparsers.add_parser('primes', help='Print the primes up to each limit')
+    primes_parser.add_argument('values', nargs='*', metavar='LIMIT',
+                               help='Upper limits (default: one per line from stdin)')
+    fib_parser = subparsers.add_parser('fib', help='Print the first N Fibonacci numbers')
+    fib_parser.add_argument('values', nargs='*', metavar='N',
+                            help='Numbers of terms (default: one per line from stdin)')
+    stats_parser = subparsers.add_parser('stats', help='Statistics of one numeric CSV column')
+    stats_parser.add_argument('file', help="CSV file ('-' for stdin)")
+    stats_parser.add_argument('--column', type=column_spec, default=0,
+                              help='Column index or header name (default: 0)')
+    matmul_parser = subparsers.add_parser('matmul', help='Multiply two matrix files')
+    matmul_parser.add_argument('a', help="First matrix, one row per line ('-' for stdin)")
+    matmul_parser.add_argument('b', help='Second matrix')
+    regress_parser = subparsers.add_parser('regress', help='Linear regression of x,y rows')
+    regress_parser.add_argument('file', nargs='?', default='-', help="CSV file of x,y rows (default: stdin)")
+    metrics_parser = subparsers.add_parser('metrics', help='Print recorded call metrics of the math functions')
+    metrics_parser.add_argument('--file', help='Metrics file (default: $MATH_UTILS_METRICS)')
+    metrics_parser.add_argument('--format', choices=['prometheus', 'json'], default='prometheus',
+                                help='Output format (default: prometheus)')
+    for csv_parser in (stats_parser, regress_parser):
+        csv_parser.add_argument('--header', action='store_true', help='Skip a header row')
+        csv_parser.add_argument('-d', '--delimiter', default=',', help="Field delimiter (default: ',')")
     
     parser.add_argument('--analysis', action='store_true',
                        help='Run code analysis')
+    parser.add_argument('--bench', action='store_true',
+                       help='Run the benchmark suite and print JSON results')
+    parser.add_argument('--filter', metavar='NAME',
+                       help='With --bench, only functions whose name contains NAME (or matches a glob)')
+    parser.add_argument('--max-size', type=positive_int, default=10 ** 7,
+                       help='With --bench, the largest input size (default: 10000000)')
+    parser.add_argument('--bench-output', metavar='FILE',
+                       help='With --bench, write the JSON results to FILE instead of stdout')
+    parser.add_argument('--memory', action='store_true',
+                       help='With --bench, also profile peak memory and allocation sites (tracemalloc)')
     parser.add_argument('--demo', action='store_true', default=True,
                        help='Run function demonstration (default)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    # Opt-in: without the variable the math functions are never wrapped
+    if os.environ.get('MATH_UTILS_METRICS') and args.command != 'metrics':
+        import instrumentation
+        instrumentation.enable_from_environment()
     
-    if args.analysis:
+    if args.command == 'batch':
+        return run_batch(args.file, args.workers, args.chunk_size, args.output)
+    elif args.command in ('primes', 'fib'):
+        return run_sequence(args.command, args.values)
+    elif args.command == 'stats':
+        return run_stats(args.file, args.column, args.header, args.delimiter)
+    elif args.command == 'matmul':
+        return run_matmul(args.a, args.b)
+    elif args.command == 'regress':
+        return run_regress(args.file, args.header, args.delimiter)
+    elif args.command == 'metrics':
+        return run_metrics(args.file, args.format)
+    elif args.command == 'serve':
+        if sum(bool(option) for option in (args.jsonl, args.tcp, args.unix)) != 1:
+            serve_parser.error("choose one of --jsonl, --tcp HOST:PORT or --unix PATH")
+        if args.jsonl:
+            from service import serve_jsonl, DEFAULT_WORKERS
+            serve_jsonl(workers=args.workers or DEFAULT_WORKERS, processes=args.processes)
+        else:
+            from rpc_server import serve
+            if args.tcp:
+                host, _, port = args.tcp.rpartition(':')
+                if not port.isdigit():
+                    serve_parser.error(f"--tcp expects HOST:PORT, got {args.tcp}")
+                serve(host=host or None, port=int(port), workers=args.workers)
+            else:
+                serve(path=args.unix, workers=args.workers)
+    elif args.bench:
+        from benchmarks.suite import run_and_report
+        return run_and_report(args.filter, args.max_size, output=args.bench_output, memory=args.memory)
+    elif args.analysis:
         try:
             import subprocess
-            import sys
             result = subprocess.run([sys.executable, 'code_analysis.py'], 
                                   capture_output=False, text=True)
             if result.returncode != 0:
@@ -145,11 +520,12 @@ Examples:
         except Exception as e:
             print(f"Error running analysis: {e}")
             print("Make sure radon, flake8, and bandit are installed.")
-            sys.exit(1)
+            return 1
     else:
         # Default: run demonstration
         demo_functions()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
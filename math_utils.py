@@ -9,7 +9,10 @@ and include proper error handling.
 @author: Admin (Repository Owner)
 """
 
+import functools
 import math
+import operator
+from array import array
 from typing import List, Union, Tuple
 
 
@@ -47,6 +50,148 @@ def basic_calculator(operation: str, a: float, b: float) -> float:
         raise ValueError(f"Unsupported operation: {operation}")
 
 
+OPERATION_CODES = {'add': 0, 'subtract': 1, 'multiply': 2, 'divide': 3}
+
+_OPERATORS = (operator.add, operator.sub, operator.mul, operator.truediv)
+
+
+def basic_calculator_array(operation, a, b, errors: str = 'raise'):
+    """
+    Apply ``basic_calculator`` element-wise over two columns of operands.
+    
+    The operation is resolved once instead of per element. Lists are
+    processed with ``map`` over the operator functions; NumPy arrays are
+    processed with vectorized operations.
+    
+    Args:
+        operation: One operation name for every element, or a sequence /
+            NumPy array of per-element names or ``OPERATION_CODES`` values
+        a: First operands (list or NumPy array)
+        b: Second operands, same length as a
+        errors (str): How division by zero is reported: 'raise' raises like
+            ``basic_calculator``; 'mask' and 'list' store NaN in the failed
+            positions and also return a boolean mask or a list of
+            ``(index, message)`` pairs
+        
+    Returns:
+        The results (a list, or a NumPy array for NumPy input); with
+        errors='mask' or 'list', a tuple of the results and the error report
+        
+    Raises:
+        ValueError: If an operation is not supported, lengths differ, errors
+            is invalid, or (with errors='raise') an element divides by zero
+        
+    @author: Admin (Repository Owner)
+    """
+    if errors not in ('raise', 'mask', 'list'):
+        raise ValueError("errors must be 'raise', 'mask' or 'list'")
+    if len(a) != len(b):
+        raise ValueError("Operands must have the same length")
+    if not isinstance(operation, str) and len(operation) != len(a):
+        raise ValueError("Operations must have the same length as the operands")
+    
+    if any(hasattr(value, 'dtype') for value in (operation, a, b)):
+        numpy = _get_numpy()
+        results, mask = _calculator_array_numpy(numpy, operation, a, b)
+        failed = numpy.flatnonzero(mask).tolist()
+    else:
+        results, failed = _calculator_array_python(operation, a, b)
+        mask = None
+    
+    if errors == 'raise':
+        if failed:
+            raise ValueError("Division by zero is not allowed")
+        return results
+    if errors == 'list':
+        return results, [(i, "Division by zero is not allowed") for i in failed]
+    if mask is not None:
+        return results, mask
+    mask = [False] * len(a)
+    for i in failed:
+        mask[i] = True
+    return results, mask
+
+
+def _operation_code(operation) -> int:
+    """Resolve an operation name or code to an index into ``_OPERATORS``."""
+    code = OPERATION_CODES.get(operation, operation) if isinstance(operation, str) else operation
+    if code not in (0, 1, 2, 3) or isinstance(code, (bool, float)):
+        raise ValueError(f"Unsupported operation: {operation}")
+    return int(code)
+
+
+def _calculator_array_python(operation, a, b) -> Tuple[list, List[int]]:
+    """Lists: results (NaN where dividing by zero) and the failed positions."""
+    nan = float('nan')
+    if isinstance(operation, str):
+        code = _operation_code(operation)
+        if code != 3 or 0 not in b:
+            return list(map(_OPERATORS[code], a, b)), []
+        failed = [i for i, y in enumerate(b) if y == 0]
+        return [x / y if y != 0 else nan for x, y in zip(a, b)], failed
+    
+    # Per-element operations: resolve each distinct name once
+    functions = {op: _OPERATORS[_operation_code(op)] for op in set(operation)}
+    if 0 not in b:
+        return [functions[op](x, y) for op, x, y in zip(operation, a, b)], []
+    results = []
+    failed = []
+    for i, (op, x, y) in enumerate(zip(operation, a, b)):
+        function = functions[op]
+        if y == 0 and function is operator.truediv:
+            failed.append(i)
+            results.append(nan)
+        else:
+            results.append(function(x, y))
+    return results, failed
+
+
+def _calculator_array_numpy(np, operation, a, b):
+    """Vectorized ``_calculator_array_python``; returns results and a failure mask."""
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if isinstance(operation, str):
+        codes = None
+        code = _operation_code(operation)
+        used = {code}
+    else:
+        operation = np.asarray(operation)
+        if operation.dtype.kind in 'US':
+            codes = np.full(operation.shape, -1, dtype=np.int8)
+            for name, value in OPERATION_CODES.items():
+                codes[operation == name] = value
+        elif operation.dtype.kind in 'iu':
+            codes = operation
+        elif operation.dtype.kind == 'O':
+            codes = np.array([_operation_code(op) for op in operation.tolist()], dtype=np.int8)
+        else:
+            # Float and bool codes are rejected, as by _operation_code
+            raise ValueError(f"Unsupported operation: {operation.flat[0] if operation.size else operation}")
+        invalid = ~np.isin(codes, (0, 1, 2, 3))
+        if invalid.any():
+            raise ValueError(f"Unsupported operation: {operation[invalid.argmax()]}")
+        used = set(np.unique(codes).tolist())
+    
+    ufuncs = (np.add, np.subtract, np.multiply, np.true_divide)
+    dtype = np.result_type(a, b, np.float64) if 3 in used else np.result_type(a, b)
+    mask = np.zeros(a.shape, dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if codes is None:
+            results = ufuncs[code](a, b).astype(dtype, copy=False)
+            if code == 3:
+                mask = b == 0
+        else:
+            results = np.empty(a.shape, dtype=dtype)
+            for code in used:
+                selected = codes == code
+                results[selected] = ufuncs[code](a[selected], b[selected])
+                if code == 3:
+                    mask |= selected & (b == 0)
+    if mask.any():
+        results[mask] = np.nan
+    return results, mask
+
+
 # =============================================================================
 # CONTRIBUTOR FUNCTIONS - Add your functions below this line
 # =============================================================================
@@ -139,14 +284,197 @@ def matrix_multiply(matrix_a: List[List[float]], matrix_b: List[List[float]]) ->
 # Contributor 3 - Statistics & Data Analysis Functions
 # @author: Contributor 3
 
-def statistical_analysis(data: List[float]) -> dict:
+class Dataset:
+    """
+    A dataset that memoizes the artifacts shared by the statistics functions.
+    
+    The sorted order, mean and standard deviation, min/max and value counts
+    are each computed on first use and then reused, so running
+    ``statistical_analysis``, ``outlier_detection(..., 'iqr')`` and
+    ``data_normalization(..., 'min_max')`` on one Dataset sorts it once and
+    never rescans it for extremes. Values are validated once, on entry.
+    ``append()`` and ``extend()`` invalidate everything memoized.
+    
+    Args:
+        data (List[float]): Initial values
+        
+    Raises:
+        TypeError: If data is not a list or contains non-numeric values
+        
+    Example:
+        >>> ds = Dataset([4, 1, 3, 100])
+        >>> statistical_analysis(ds)['median'], outlier_detection(ds)
+        (3.5, [100])
+        
+    @author: Contributor 3
+    """
+    
+    def __init__(self, data: List[float]):
+        if not isinstance(data, list):
+            raise TypeError("Data must be a list")
+        self._values = []
+        self._memo = {}
+        self.extend(data)
+    
+    @classmethod
+    def _wrap(cls, values: List[float], moments: Tuple[float, float] = None) -> 'Dataset':
+        """Dataset over an already validated list, sharing it instead of copying."""
+        dataset = cls.__new__(cls)
+        dataset._values = values
+        dataset._memo = {} if moments is None else {'moments': moments}
+        return dataset
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    def __iter__(self):
+        return iter(self._values)
+    
+    def __getstate__(self) -> dict:
+        # Only the values: equal datasets pickle (and hash in ResultCache
+        # keys) the same whatever they have memoized
+        return {'_values': self._values}
+    
+    def __setstate__(self, state: dict):
+        self._values = state['_values']
+        self._memo = {}
+    
+    @property
+    def values(self) -> List[float]:
+        """A copy of the values; changing it doesn't change the dataset (use append/extend)."""
+        return list(self._values)
+    
+    def append(self, value: float):
+        """Add one value and invalidate memoized artifacts."""
+        self.extend([value])
+    
+    def extend(self, values: List[float]):
+        """Add several values and invalidate memoized artifacts."""
+        values = list(values)
+        for value in values:
+            if not isinstance(value, (int, float)):
+                raise TypeError("All data values must be numeric")
+        self._values.extend(values)
+        self._memo.clear()
+    
+    def _memoized(self, name: str, compute):
+        if name not in self._memo:
+            if not self._values:
+                raise ValueError("Data cannot be empty")
+            self._memo[name] = compute()
+        return self._memo[name]
+    
+    def sorted_values(self) -> List[float]:
+        """Values in ascending order."""
+        return self._memoized('sorted', lambda: sorted(self._values))
+    
+    def moments(self) -> Tuple[float, float]:
+        """Mean and population standard deviation."""
+        def compute():
+            data = self._values
+            mean = sum(data) / len(data)
+            variance = sum((x - mean) ** 2 for x in data) / len(data)
+            return mean, math.sqrt(variance)
+        return self._memoized('moments', compute)
+    
+    def extremes(self) -> Tuple[float, float]:
+        """Minimum and maximum, taken from the sorted order if it exists."""
+        def compute():
+            if 'sorted' in self._memo:
+                return self._memo['sorted'][0], self._memo['sorted'][-1]
+            return min(self._values), max(self._values)
+        return self._memoized('extremes', compute)
+    
+    def counts(self):
+        """``collections.Counter`` of the values."""
+        from collections import Counter
+        return self._memoized('counts', lambda: Counter(self._values))
+    
+    def median(self) -> float:
+        """Median from the sorted order."""
+        sorted_data = self.sorted_values()
+        n = len(sorted_data)
+        if n % 2 == 0:
+            return (sorted_data[n//2 - 1] + sorted_data[n//2]) / 2
+        return sorted_data[n//2]
+    
+    def quartiles(self) -> Tuple[float, float]:
+        """Q1 and Q3 as used by the IQR outlier method."""
+        sorted_data = self.sorted_values()
+        q1_idx, q3_idx = _quartile_ranks(len(sorted_data))
+        return sorted_data[q1_idx], sorted_data[q3_idx]
+    
+    def statistics(self) -> dict:
+        """The ``statistical_analysis`` result for this dataset."""
+        counter = self.counts()
+        max_count = max(counter.values())
+        mode = [k for k, v in counter.items() if v == max_count]
+        n = len(self._values)
+        if len(mode) == n and n > 1:
+            mode = None  # No mode if all values are unique
+        elif len(mode) == 1:
+            mode = mode[0]
+        mean, std_dev = self.moments()
+        min_val, max_val = self.extremes()
+        return {
+            'mean': mean,
+            'median': self.median(),
+            'mode': mode,
+            'std_dev': std_dev,
+            'count': n,
+            'min': min_val,
+            'max': max_val
+        }
+    
+    def normalize(self, method: str) -> List[float]:
+        """The ``data_normalization`` result for this dataset."""
+        if method == 'z_score':
+            offset, scale = self.moments()
+        else:
+            offset, max_val = self.extremes()
+            scale = max_val - offset
+        if scale == 0:
+            raise ValueError("Cannot normalize: data has no variance")
+        return [(x - offset) / scale for x in self._values]
+    
+    def outlier_indices(self, method: str) -> List[int]:
+        """The ``outlier_indices`` result for this dataset."""
+        data = self._values
+        if method == 'iqr':
+            q1, q3 = self.quartiles()
+            iqr = q3 - q1
+            lower_bound = q1 - 1.5 * iqr
+            upper_bound = q3 + 1.5 * iqr
+        elif method == 'z_score':
+            mean, std_dev = self.moments()
+            if std_dev == 0:
+                return []
+            lower_bound = mean - 3 * std_dev
+            upper_bound = mean + 3 * std_dev
+        else:
+            median = self.median()
+            deviations = [abs(x - median) for x in data]
+            mad = _median(deviations)
+            if mad == 0:
+                return []
+            cutoff = 3.5 * mad / 0.6745
+            return [i for i, d in enumerate(deviations) if d > cutoff]
+        return [i for i, x in enumerate(data) if x < lower_bound or x > upper_bound]
+
+
+def statistical_analysis(data: List[float], parallel: bool = False, workers: int = None) -> dict:
     """
     Perform basic statistical analysis on a dataset.
     
     Calculates mean, median, mode, and standard deviation for the given dataset.
     
     Args:
-        data (List[float]): Input dataset
+        data (List[float]): Input dataset, a ``Dataset``, or a chunked
+            source from ``data_loader`` (``Float64File``, ``CsvColumn``)
+        parallel (bool): Split large datasets into shards processed by a
+            process pool (see ``parallel_stats``); for a ``Dataset`` this
+            bypasses its memoized artifacts
+        workers (int): Number of worker processes; implies parallel
         
     Returns:
         dict: Dictionary containing mean, median, mode, std_dev
@@ -157,12 +485,29 @@ def statistical_analysis(data: List[float]) -> dict:
         
     @author: Contributor 3
     """
+    if isinstance(data, Dataset):
+        if parallel or workers is not None:
+            if len(data) == 0:
+                raise ValueError("Data cannot be empty")
+            from parallel_stats import parallel_statistical_analysis
+            return parallel_statistical_analysis(data._values, workers)
+        return data.statistics()
+    
+    if hasattr(data, 'iter_chunks'):
+        # Out-of-core sources are processed chunk by chunk, never as a list
+        from data_loader import streaming_statistical_analysis
+        return streaming_statistical_analysis(data)
+    
     if not isinstance(data, list):
         raise TypeError("Data must be a list")
     
     if len(data) == 0:
         raise ValueError("Data cannot be empty")
     
+    if parallel or workers is not None:
+        from parallel_stats import parallel_statistical_analysis
+        return parallel_statistical_analysis(data, workers)
+    
     # Check for non-numeric values
     for value in data:
         if not isinstance(value, (int, float)):
@@ -206,6 +551,48 @@ def statistical_analysis(data: List[float]) -> dict:
     }
 
 
+def _regression_fit(x_data: List[float], y_data: List[float]) -> Tuple[float, float, float, float]:
+    """
+    Least squares fit of already validated data.
+
+    Shared by ``linear_regression`` and the pure Python path of
+    ``linear_regression_many`` so that both produce identical numbers.
+
+    Returns:
+        Tuple[float, float, float, float]: slope, intercept, r_squared, correlation
+
+    Raises:
+        ValueError: If x_data has no variance
+    """
+    n = len(x_data)
+    
+    # Calculate means
+    x_mean = sum(x_data) / n
+    y_mean = sum(y_data) / n
+    
+    # Calculate slope and intercept using least squares method
+    numerator = sum((x_data[i] - x_mean) * (y_data[i] - y_mean) for i in range(n))
+    denominator = sum((x_data[i] - x_mean) ** 2 for i in range(n))
+    
+    if denominator == 0:
+        raise ValueError("Cannot perform regression: x_data has no variance")
+    
+    slope = numerator / denominator
+    intercept = y_mean - slope * x_mean
+    
+    # Calculate R-squared
+    ss_res = sum((y_data[i] - (slope * x_data[i] + intercept)) ** 2 for i in range(n))
+    ss_tot = sum((y_data[i] - y_mean) ** 2 for i in range(n))
+    
+    if ss_tot == 0:
+        # If y_data has no variance, R-squared is undefined (set to 0)
+        return slope, intercept, 0.0, 0.0
+    
+    r_squared = 1 - (ss_res / ss_tot)
+    correlation = math.sqrt(r_squared) if slope >= 0 else -math.sqrt(r_squared)
+    return slope, intercept, r_squared, correlation
+
+
 def linear_regression(x_data: List[float], y_data: List[float]) -> dict:
     """
     Perform simple linear regression analysis.
@@ -214,8 +601,8 @@ def linear_regression(x_data: List[float], y_data: List[float]) -> dict:
     the least squares method.
     
     Args:
-        x_data (List[float]): Independent variable data
-        y_data (List[float]): Dependent variable data
+        x_data (List[float]): Independent variable data (list or ``Dataset``)
+        y_data (List[float]): Dependent variable data (list or ``Dataset``)
         
     Returns:
         dict: Dictionary containing slope, intercept, r_squared, and equation
@@ -226,6 +613,11 @@ def linear_regression(x_data: List[float], y_data: List[float]) -> dict:
         
     @author: Contributor 3
     """
+    if isinstance(x_data, Dataset):
+        x_data = x_data._values
+    if isinstance(y_data, Dataset):
+        y_data = y_data._values
+    
     if not isinstance(x_data, list) or not isinstance(y_data, list):
         raise TypeError("Both x_data and y_data must be lists")
     
@@ -240,49 +632,459 @@ def linear_regression(x_data: List[float], y_data: List[float]) -> dict:
         if not isinstance(value, (int, float)):
             raise TypeError("All data values must be numeric")
     
-    n = len(x_data)
-    
-    # Calculate means
-    x_mean = sum(x_data) / n
-    y_mean = sum(y_data) / n
-    
-    # Calculate slope and intercept using least squares method
-    numerator = sum((x_data[i] - x_mean) * (y_data[i] - y_mean) for i in range(n))
-    denominator = sum((x_data[i] - x_mean) ** 2 for i in range(n))
+    slope, intercept, r_squared, correlation = _regression_fit(x_data, y_data)
     
-    if denominator == 0:
-        raise ValueError("Cannot perform regression: x_data has no variance")
+    return {
+        'slope': slope,
+        'intercept': intercept,
+        'r_squared': r_squared,
+        'equation': f"y = {slope:.4f}x + {intercept:.4f}",
+        'correlation': correlation
+    }
+
+
+def _get_numpy():
+    """Return the numpy module if it is installed, otherwise None."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def linear_regression_many(x_batch, y_batch, equations: bool = False) -> dict:
+    """
+    Fit many independent simple linear regressions in one call.
     
-    slope = numerator / denominator
-    intercept = y_mean - slope * x_mean
+    The batch is columnar: ``x_batch[i]`` and ``y_batch[i]`` form series i.
+    Inputs are validated once for the whole batch and no equation strings
+    are built unless requested. When NumPy is installed and the series are
+    of equal length, all fits are computed with whole-array operations;
+    otherwise each series is fitted in a tight Python loop (ragged series
+    are supported on this path).
     
-    # Calculate R-squared
-    y_pred = [slope * x + intercept for x in x_data]
-    ss_res = sum((y_data[i] - y_pred[i]) ** 2 for i in range(n))
-    ss_tot = sum((y_data[i] - y_mean) ** 2 for i in range(n))
+    Args:
+        x_batch: List of x series, or a 2-D array of shape (series, points)
+        y_batch: List of y series, or a 2-D array of the same shape
+        equations (bool): Also return formatted equation strings
+        
+    Returns:
+        dict: Columns 'slope', 'intercept', 'r_squared' and 'correlation'
+        as lists of floats on both paths, plus 'equation' when requested
+        
+    Raises:
+        ValueError: If the batches differ in size, a series is empty or
+            mismatched, or a series has no x variance
+        TypeError: If the batches are not sequences of numeric series
+        
+    @author: Contributor 3
+    """
+    if isinstance(x_batch, (str, bytes)) or isinstance(y_batch, (str, bytes)):
+        raise TypeError("x_batch and y_batch must be batches of series")
+    try:
+        num_series = len(x_batch)
+    except TypeError:
+        raise TypeError("x_batch and y_batch must be batches of series") from None
+    if num_series != len(y_batch):
+        raise ValueError("x_batch and y_batch must contain the same number of series")
     
-    if ss_tot == 0:
-        # If y_data has no variance, R-squared is undefined (set to 0)
-        r_squared = 0.0
+    np = _get_numpy()
+    if np is not None:
+        columns = _linear_regression_many_numpy(np, x_batch, y_batch)
     else:
-        r_squared = 1 - (ss_res / ss_tot)
+        columns = None
+    if columns is None:
+        columns = _linear_regression_many_python(x_batch, y_batch)
     
+    if equations:
+        columns['equation'] = [f"y = {slope:.4f}x + {intercept:.4f}"
+                               for slope, intercept in zip(columns['slope'], columns['intercept'])]
+    return columns
 
-    # Calculate correlation coefficient
-    if ss_tot == 0:
-        correlation = 0.0
-    else:
-        correlation = math.sqrt(r_squared) if slope >= 0 else -math.sqrt(r_squared)
+
+def _linear_regression_many_numpy(np, x_batch, y_batch):
+    """Vectorized batch fit; returns None when the batch is ragged."""
+    try:
+        x = np.asarray(x_batch)
+        y = np.asarray(y_batch)
+    except ValueError:
+        return None  # ragged batch
+    if x.ndim != 2 or y.ndim != 2 or x.dtype.kind not in 'biuf' or y.dtype.kind not in 'biuf':
+        # Ragged or mixed-type batches are validated series by series
+        return None
+    x = x.astype(float, copy=False)
+    y = y.astype(float, copy=False)
+    if x.shape != y.shape:
+        raise ValueError("x_data and y_data must have the same length")
+    if x.shape[1] == 0:
+        raise ValueError("Data cannot be empty")
+    
+    dx = x - x.mean(axis=1, keepdims=True)
+    y_mean = y.mean(axis=1)
+    dy = y - y_mean[:, None]
+    denominator = np.einsum('ij,ij->i', dx, dx)
+    if not denominator.all():
+        bad = int(np.flatnonzero(denominator == 0)[0])
+        raise ValueError(f"Cannot perform regression: x_data of series {bad} has no variance")
     
+    slope = np.einsum('ij,ij->i', dx, dy) / denominator
+    intercept = y_mean - slope * x.mean(axis=1)
+    residual = dy - slope[:, None] * dx
+    ss_res = np.einsum('ij,ij->i', residual, residual)
+    ss_tot = np.einsum('ij,ij->i', dy, dy)
+    has_variance = ss_tot != 0
+    r_squared = np.where(has_variance, 1 - ss_res / np.where(has_variance, ss_tot, 1.0), 0.0)
+    correlation = np.where(has_variance, np.copysign(np.sqrt(np.maximum(r_squared, 0.0)), slope), 0.0)
     return {
-        'slope': slope,
-        'intercept': intercept,
-        'r_squared': r_squared,
-        'equation': f"y = {slope:.4f}x + {intercept:.4f}",
-        'correlation': correlation
+        'slope': slope.tolist(),
+        'intercept': intercept.tolist(),
+        'r_squared': r_squared.tolist(),
+        'correlation': correlation.tolist()
     }
 
 
+def _check_numeric(values):
+    """Raise TypeError unless every value is an int or float, checking each distinct type once."""
+    if not all(issubclass(kind, (int, float)) for kind in set(map(type, values))):
+        raise TypeError("All data values must be numeric")
+
+
+def _linear_regression_many_python(x_batch, y_batch):
+    """Per-series batch fit used without NumPy or for ragged batches."""
+    columns = {'slope': [], 'intercept': [], 'r_squared': [], 'correlation': []}
+    for index, (x_data, y_data) in enumerate(zip(x_batch, y_batch)):
+        x_data = list(x_data)
+        y_data = list(y_data)
+        if len(x_data) == 0:
+            raise ValueError("Data cannot be empty")
+        if len(x_data) != len(y_data):
+            raise ValueError("x_data and y_data must have the same length")
+        _check_numeric(x_data)
+        _check_numeric(y_data)
+        try:
+            fit = _regression_fit(x_data, y_data)
+        except ValueError:
+            raise ValueError(f"Cannot perform regression: x_data of series {index} has no variance") from None
+        for key, value in zip(('slope', 'intercept', 'r_squared', 'correlation'), fit):
+            columns[key].append(value)
+    return columns
+
+
+class OnlineLinearRegression:
+    """
+    Incremental simple linear regression built on sufficient statistics.
+
+    Keeps the count, the means of x and y and the centred sums
+    Σ(x - x̄)², Σ(y - ȳ)² and Σ(x - x̄)(y - ȳ). These carry the same
+    information as n, Σx, Σy, Σxy, Σx², Σy² but do not suffer from
+    catastrophic cancellation on large offsets. Chunks are folded in with
+    ``update()`` and independent shards are combined with ``merge()``;
+    slope, intercept, R² and correlation are available in O(1) at any point
+    and agree with ``linear_regression`` on the same data.
+
+    Example:
+        >>> model = OnlineLinearRegression()
+        >>> model.update([1, 2, 3], [2, 4, 6]).update([4, 5], [8, 10]).slope
+        2.0
+
+    @author: Contributor 3
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def update(self, x_data: List[float], y_data: List[float]) -> 'OnlineLinearRegression':
+        """
+        Fold a chunk of paired observations into the running statistics.
+
+        Args:
+            x_data (List[float]): Independent variable chunk
+            y_data (List[float]): Dependent variable chunk
+
+        Returns:
+            OnlineLinearRegression: ``self``, to allow chaining
+
+        Raises:
+            ValueError: If the chunk lengths don't match
+            TypeError: If the chunk contains non-numeric values
+        """
+        x_data = list(x_data)
+        y_data = list(y_data)
+        if len(x_data) != len(y_data):
+            raise ValueError("x_data and y_data must have the same length")
+        if not x_data:
+            return self
+        _check_numeric(x_data)
+        _check_numeric(y_data)
+
+        n = len(x_data)
+        chunk = OnlineLinearRegression()
+        chunk.n = n
+        chunk.mean_x = sum(x_data) / n
+        chunk.mean_y = sum(y_data) / n
+        for x, y in zip(x_data, y_data):
+            dx = x - chunk.mean_x
+            dy = y - chunk.mean_y
+            chunk.m2_x += dx * dx
+            chunk.m2_y += dy * dy
+            chunk.c_xy += dx * dy
+        return self.merge(chunk)
+
+    def merge(self, other: 'OnlineLinearRegression') -> 'OnlineLinearRegression':
+        """
+        Combine the statistics of another regressor into this one.
+
+        Args:
+            other (OnlineLinearRegression): Regressor fitted on another shard
+
+        Returns:
+            OnlineLinearRegression: ``self``, to allow chaining
+
+        Raises:
+            TypeError: If other is not an OnlineLinearRegression
+        """
+        if not isinstance(other, OnlineLinearRegression):
+            raise TypeError("Can only merge another OnlineLinearRegression")
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n = other.n
+            self.mean_x, self.mean_y = other.mean_x, other.mean_y
+            self.m2_x, self.m2_y, self.c_xy = other.m2_x, other.m2_y, other.c_xy
+            return self
+
+        n = self.n + other.n
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        self.mean_x += dx * other.n / n
+        self.mean_y += dy * other.n / n
+        self.m2_x += other.m2_x + dx * dx * weight
+        self.m2_y += other.m2_y + dy * dy * weight
+        self.c_xy += other.c_xy + dx * dy * weight
+        self.n = n
+        return self
+
+    @property
+    def slope(self) -> float:
+        """Least squares slope of the data seen so far."""
+        if self.n == 0:
+            raise ValueError("Data cannot be empty")
+        if self.m2_x == 0:
+            raise ValueError("Cannot perform regression: x_data has no variance")
+        return self.c_xy / self.m2_x
+
+    @property
+    def intercept(self) -> float:
+        """Least squares intercept of the data seen so far."""
+        return self.mean_y - self.slope * self.mean_x
+
+    @property
+    def r_squared(self) -> float:
+        """Coefficient of determination (0.0 when y has no variance)."""
+        slope = self.slope
+        if self.m2_y == 0:
+            return 0.0
+        ss_res = max(self.m2_y - slope * self.c_xy, 0.0)
+        return 1 - (ss_res / self.m2_y)
+
+    @property
+    def correlation(self) -> float:
+        """Pearson correlation coefficient (0.0 when y has no variance)."""
+        r_squared = self.r_squared
+        if self.m2_y == 0:
+            return 0.0
+        return math.sqrt(r_squared) if self.slope >= 0 else -math.sqrt(r_squared)
+
+    def result(self) -> dict:
+        """
+        Summarise the fit in the same shape as ``linear_regression``.
+
+        Returns:
+            dict: Dictionary containing slope, intercept, r_squared, equation
+            and correlation
+        """
+        slope = self.slope
+        intercept = self.intercept
+        return {
+            'slope': slope,
+            'intercept': intercept,
+            'r_squared': self.r_squared,
+            'equation': f"y = {slope:.4f}x + {intercept:.4f}",
+            'correlation': self.correlation
+        }
+
+
+class NormalEquationsSolver:
+    """
+    Cached Cholesky factorization of XᵀX for repeated least squares solves.
+    
+    Building XᵀX (via ``matrix_multiply``) and factorizing it costs
+    O(n·p²) + O(p³); once that is done, each new response vector only needs
+    Xᵀy and two triangular solves, O(n·p) + O(p²). Reuse one solver to fit
+    many y vectors against the same design matrix.
+    
+    Args:
+        x_data (List[List[float]]): Design matrix, one row per observation
+        fit_intercept (bool): Prepend a column of ones to the design matrix
+        
+    Raises:
+        ValueError: If the matrix is empty, ragged, has fewer rows than
+            coefficients, or its columns are collinear
+        TypeError: If the matrix is not a list of lists of numbers
+        
+    @author: Contributor 3
+    """
+    
+    def __init__(self, x_data: List[List[float]], fit_intercept: bool = True):
+        if not (isinstance(x_data, list) and all(isinstance(row, list) for row in x_data)):
+            raise TypeError("x_data must be a list of lists")
+        if len(x_data) == 0 or len(x_data[0]) == 0:
+            raise ValueError("Data cannot be empty")
+        
+        self.fit_intercept = fit_intercept
+        self.design = [[1.0] + row for row in x_data] if fit_intercept else [list(row) for row in x_data]
+        self.transposed = [list(column) for column in zip(*self.design)]
+        num_coefficients = len(self.transposed)
+        if any(len(row) != num_coefficients for row in self.design):
+            raise ValueError("All rows in x_data must have the same length")
+        if len(self.design) < num_coefficients:
+            raise ValueError("Need at least as many observations as coefficients")
+        for column in self.transposed:
+            _check_numeric(column)
+        
+        gram = matrix_multiply(self.transposed, self.design)
+        self.cholesky = self._factorize(gram)
+    
+    @staticmethod
+    def _factorize(gram: List[List[float]]) -> List[List[float]]:
+        """Lower triangular L with L·Lᵀ = gram."""
+        size = len(gram)
+        lower = [[0.0] * size for _ in range(size)]
+        for j in range(size):
+            row_j = lower[j]
+            pivot = gram[j][j] - sum(value * value for value in row_j[:j])
+            if pivot <= 1e-12 * gram[j][j]:
+                raise ValueError("Cannot perform regression: predictors are collinear")
+            row_j[j] = math.sqrt(pivot)
+            for i in range(j + 1, size):
+                row_i = lower[i]
+                row_i[j] = (gram[i][j] - sum(a * b for a, b in zip(row_i[:j], row_j))) / row_j[j]
+        return lower
+    
+    def solve(self, y_data: List[float]) -> List[float]:
+        """
+        Least squares coefficients for a new response vector.
+        
+        Args:
+            y_data (List[float]): Dependent variable, one value per row
+            
+        Returns:
+            List[float]: Coefficients, intercept first when fit_intercept
+            
+        Raises:
+            ValueError: If y_data length doesn't match the design matrix
+            TypeError: If y_data is not a list of numbers
+        """
+        if not isinstance(y_data, list):
+            raise TypeError("y_data must be a list")
+        if len(y_data) != len(self.design):
+            raise ValueError("x_data and y_data must have the same length")
+        _check_numeric(y_data)
+        
+        rhs = [row[0] for row in matrix_multiply(self.transposed, [[y] for y in y_data])]
+        lower = self.cholesky
+        size = len(lower)
+        # Forward substitution: L·z = Xᵀy
+        z = [0.0] * size
+        for i in range(size):
+            row = lower[i]
+            z[i] = (rhs[i] - sum(a * b for a, b in zip(row[:i], z))) / row[i]
+        # Back substitution: Lᵀ·beta = z
+        beta = [0.0] * size
+        for i in reversed(range(size)):
+            beta[i] = (z[i] - sum(lower[k][i] * beta[k] for k in range(i + 1, size))) / lower[i][i]
+        return beta
+    
+    def fit(self, y_data: List[float]) -> dict:
+        """
+        Solve for y_data and summarise the fit.
+        
+        Returns:
+            dict: Dictionary containing coefficients, intercept and r_squared
+        """
+        beta = self.solve(y_data)
+        n = len(y_data)
+        y_mean = sum(y_data) / n
+        ss_res = 0.0
+        ss_tot = 0.0
+        for row, y in zip(self.design, y_data):
+            residual = y - sum(a * b for a, b in zip(row, beta))
+            ss_res += residual * residual
+            ss_tot += (y - y_mean) ** 2
+        r_squared = 0.0 if ss_tot == 0 else 1 - (ss_res / ss_tot)
+        
+        return {
+            'coefficients': beta[1:] if self.fit_intercept else beta,
+            'intercept': beta[0] if self.fit_intercept else 0.0,
+            'r_squared': r_squared
+        }
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_solver(design_key: Tuple[Tuple[float, ...], ...], fit_intercept: bool) -> NormalEquationsSolver:
+    """Factorizations keyed by design matrix contents (each entry keeps the key and its solver alive)."""
+    return NormalEquationsSolver([list(row) for row in design_key], fit_intercept)
+
+
+def multiple_linear_regression(x_data: List[List[float]], y_data: List[float],
+                               fit_intercept: bool = True, use_cache: bool = True) -> dict:
+    """
+    Perform multiple linear regression using the normal equations.
+    
+    The Cholesky factorization of XᵀX is cached by design matrix, so refitting
+    new y vectors against the same X only costs a solve. The cache key is a
+    tuple copy of x_data, so every call, hit or miss, still copies and
+    hashes the whole matrix (O(n·p)), and the cache keeps up to 16 design
+    matrices alive, each with its solver. In a loop over one X, hold a
+    ``NormalEquationsSolver`` instead: it skips the key and only solves.
+    
+    Args:
+        x_data (List[List[float]]): Design matrix, one row of predictors per observation
+        y_data (List[float]): Dependent variable data
+        fit_intercept (bool): Include an intercept term
+        use_cache (bool): Reuse a cached factorization for identical x_data
+        
+    Returns:
+        dict: Dictionary containing coefficients, intercept and r_squared
+        
+    Raises:
+        ValueError: If data is empty, lengths don't match or predictors are collinear
+        TypeError: If inputs are not lists or contain non-numeric values
+        
+    @author: Contributor 3
+    """
+    if not (isinstance(x_data, list) and all(isinstance(row, list) for row in x_data)):
+        raise TypeError("x_data must be a list of lists")
+    design_key = None
+    if use_cache:
+        try:
+            design_key = tuple(map(tuple, x_data))
+            hash(design_key)
+        except TypeError:
+            design_key = None  # unhashable, hence non-numeric; the solver reports it
+    if design_key is not None:
+        solver = _cached_solver(design_key, fit_intercept)
+    else:
+        solver = NormalEquationsSolver(x_data, fit_intercept)
+    return solver.fit(y_data)
+
+
 def data_normalization(data: List[float], method: str = 'z_score') -> List[float]:
     """
     Normalize data using specified method.
@@ -290,7 +1092,7 @@ def data_normalization(data: List[float], method: str = 'z_score') -> List[float
     Supports z-score normalization and min-max scaling methods.
     
     Args:
-        data (List[float]): Input dataset to normalize
+        data (List[float]): Input dataset to normalize, or a ``Dataset``
         method (str): Normalization method ('z_score' or 'min_max')
         
     Returns:
@@ -302,6 +1104,13 @@ def data_normalization(data: List[float], method: str = 'z_score') -> List[float
         
     @author: Contributor 3
     """
+    if isinstance(data, Dataset):
+        if len(data) == 0:
+            raise ValueError("Data cannot be empty")
+        if method not in ['z_score', 'min_max']:
+            raise ValueError("Method must be 'z_score' or 'min_max'")
+        return data.normalize(method)
+    
     if not isinstance(data, list):
         raise TypeError("Data must be a list")
     
@@ -338,15 +1147,352 @@ def data_normalization(data: List[float], method: str = 'z_score') -> List[float
         return [(x - min_val) / (max_val - min_val) for x in data]
 
 
+class Normalizer:
+    """
+    Fit-once, transform-many data normalization.
+    
+    Statistics are fitted on a reference set (in one call with ``fit()`` or
+    streamed with ``partial_fit()``) and then applied to any number of
+    batches without recomputing them. ``transform()`` can write into a
+    caller-provided buffer or back into the input (``list``, ``array('d')``
+    or NumPy array), and ``iter_transform()`` yields values lazily.
+    Fitting and transforming the same data reproduces ``data_normalization``.
+    
+    Args:
+        method (str): Normalization method ('z_score' or 'min_max')
+        
+    Raises:
+        ValueError: If method is invalid
+        
+    Example:
+        >>> Normalizer('min_max').fit([10, 20, 30]).transform([15, 30])
+        [0.25, 1.0]
+        
+    @author: Contributor 3
+    """
+    
+    def __init__(self, method: str = 'z_score'):
+        if method not in ['z_score', 'min_max']:
+            raise ValueError("Method must be 'z_score' or 'min_max'")
+        self.method = method
+        self._reset()
+    
+    def _reset(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    @staticmethod
+    def _validate(data):
+        """Reject non-numeric input, skipping the element scan for typed buffers."""
+        if hasattr(data, 'dtype'):
+            if data.dtype.kind not in 'biuf':
+                raise TypeError("All data values must be numeric")
+        elif not isinstance(data, array):
+            if not isinstance(data, list):
+                raise TypeError("Data must be a list")
+            for value in data:
+                if not isinstance(value, (int, float)):
+                    raise TypeError("All data values must be numeric")
+    
+    def fit(self, data: List[float]) -> 'Normalizer':
+        """Discard any fitted statistics and fit on data; returns ``self``."""
+        self._reset()
+        return self.partial_fit(data)
+    
+    def partial_fit(self, data: List[float]) -> 'Normalizer':
+        """
+        Update the fitted statistics with another batch; returns ``self``.
+        
+        Raises:
+            TypeError: If data is not a list, Dataset, array('d') or NumPy array of numbers
+        """
+        if not isinstance(data, Dataset):
+            self._validate(data)
+        n = len(data)
+        if n == 0:
+            return self
+        if isinstance(data, Dataset):
+            # Reuse the moments the dataset may already have computed
+            batch_mean, batch_std = data.moments()
+            batch_m2 = batch_std * batch_std * n
+            batch_min, batch_max = data.extremes()
+        elif hasattr(data, 'dtype'):
+            batch_mean = float(data.mean())
+            batch_m2 = float(((data - batch_mean) ** 2).sum())
+            batch_min, batch_max = float(data.min()), float(data.max())
+        else:
+            batch_mean = sum(data) / n
+            # Spread and extremes together in a second pass
+            batch_m2 = 0.0
+            batch_min = batch_max = data[0]
+            for x in data:
+                d = x - batch_mean
+                batch_m2 += d * d
+                if x < batch_min:
+                    batch_min = x
+                elif x > batch_max:
+                    batch_max = x
+        
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean = self.mean + delta * n / total if self.count else batch_mean
+        self.m2 += batch_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, batch_min)
+        self.max = max(self.max, batch_max)
+        return self
+    
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation of the fitted data."""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+    
+    def _parameters(self) -> Tuple[float, float]:
+        """Offset and scale so that normalized = (x - offset) / scale."""
+        if self.count == 0:
+            raise ValueError("Normalizer has not been fitted")
+        if self.method == 'z_score':
+            offset, scale = self.mean, self.std_dev
+        else:
+            offset, scale = self.min, self.max - self.min
+        if scale == 0:
+            raise ValueError("Cannot normalize: data has no variance")
+        return offset, scale
+    
+    def transform(self, data: List[float], out=None, in_place: bool = False):
+        """
+        Normalize data with the fitted statistics.
+        
+        Args:
+            data (List[float]): Values to normalize (list, Dataset, array('d') or NumPy array)
+            out: Optional float buffer of the same length to write results into
+            in_place (bool): Overwrite data (which must hold floats) with the results
+            
+        Returns:
+            The buffer written to, or a new list when neither out nor in_place is given
+            
+        Raises:
+            ValueError: If not fitted, the fitted data has no variance, or
+                out has the wrong length or is an array that can't hold floats
+            TypeError: If data is not numeric
+        """
+        offset, scale = self._parameters()
+        if isinstance(data, Dataset):
+            if in_place:
+                raise TypeError("A Dataset cannot be normalized in place")
+            data = data._values
+        self._validate(data)
+        if in_place:
+            out = data
+        if out is None:
+            if hasattr(data, 'dtype'):
+                return (data - offset) / scale
+            return [(x - offset) / scale for x in data]
+        if len(out) != len(data):
+            raise ValueError("out must have the same length as data")
+        if ((hasattr(out, 'dtype') and out.dtype.kind != 'f')
+                or (isinstance(out, array) and out.typecode not in 'fd')):
+            kind = out.dtype if hasattr(out, 'dtype') else f"array('{out.typecode}')"
+            raise ValueError(f"Cannot write normalized floats into {kind} data")
+        
+        if hasattr(out, 'dtype'):
+            numpy = _get_numpy()
+            numpy.subtract(data, offset, out=out)
+            numpy.divide(out, scale, out=out)
+        else:
+            for i, x in enumerate(data):
+                out[i] = (x - offset) / scale
+        return out
+    
+    def iter_transform(self, data):
+        """
+        Lazily yield normalized values for any iterable of numbers.
+        
+        The fitted parameters are checked when called, not on the first
+        ``next()``.
+        
+        Raises:
+            ValueError: If not fitted or the fitted data has no variance
+        """
+        offset, scale = self._parameters()
+        return ((x - offset) / scale for x in data)
+    
+    def fit_transform(self, data: List[float], out=None, in_place: bool = False):
+        """Fit on data, then transform it; see ``transform``."""
+        return self.fit(data).transform(data, out=out, in_place=in_place)
+
+
+def _quickselect(values: List[float], ranks: List[int]) -> List[float]:
+    """
+    Values at the given 0-based ranks in expected linear time.
+    
+    Three-way partitioning around a median-of-three pivot; ranks on the
+    same side of a pivot share its partitioning passes, so Q1 and Q3 (or
+    the two middle values) cost about as much as one rank. ``values`` is
+    not modified.
+    """
+    found = {}
+    pending = [(values, sorted(set(ranks)), 0)]
+    while pending:
+        values, wanted, offset = pending.pop()
+        if len(values) <= 32:
+            ordered = sorted(values)
+            for k in wanted:
+                found[k] = ordered[k - offset]
+            continue
+        first, middle, last = values[0], values[len(values) // 2], values[-1]
+        pivot = max(min(first, middle), min(max(first, middle), last))
+        lows = [x for x in values if x < pivot]
+        if wanted[-1] - offset < len(lows):
+            pending.append((lows, wanted, offset))
+            continue
+        highs = [x for x in values if x > pivot]
+        high_offset = offset + len(values) - len(highs)
+        low_end = offset + len(lows)
+        low_ranks = []
+        high_ranks = []
+        for k in wanted:
+            if k < low_end:
+                low_ranks.append(k)
+            elif k >= high_offset:
+                high_ranks.append(k)
+            else:
+                found[k] = pivot
+        if low_ranks:
+            pending.append((lows, low_ranks, offset))
+        if high_ranks:
+            pending.append((highs, high_ranks, high_offset))
+    return [found[k] for k in ranks]
+
+
+def _quartile_ranks(n: int) -> Tuple[int, int]:
+    """Positions of Q1 and Q3 in sorted data, as used by the IQR method."""
+    q1_idx = n // 4
+    q3_idx = 3 * n // 4
+    if n % 4 == 0:
+        return (q1_idx - 1 if q1_idx > 0 else 0), (q3_idx - 1 if q3_idx > 0 else n - 1)
+    return q1_idx, q3_idx
+
+
+def _outlier_indices(data, method: str) -> List[int]:
+    """
+    Positions of outliers in already validated data, without sorting.
+    
+    'iqr' selects Q1 and Q3 together by linear-time selection, then filters
+    in one pass; 'z_score' takes mean and variance from one pass of shifted
+    sums, then filters; 'mad' selects the median, builds the list of
+    deviations, selects their median (the MAD) and flags modified z-scores
+    0.6745·|x - median| / MAD above 3.5.
+    """
+    n = len(data)
+    if hasattr(data, 'dtype'):
+        return _outlier_indices_numpy(_get_numpy(), data, method)
+    
+    if method == 'iqr':
+        # IQR method: outliers are values outside Q1 - 1.5*IQR and Q3 + 1.5*IQR
+        q1_idx, q3_idx = _quartile_ranks(n)
+        q1, q3 = _quickselect(data, [q1_idx, q3_idx])
+        iqr = q3 - q1
+        lower_bound = q1 - 1.5 * iqr
+        upper_bound = q3 + 1.5 * iqr
+        return [i for i, x in enumerate(data) if x < lower_bound or x > upper_bound]
+    
+    if method == 'z_score':
+        # Z-score method: outliers are values with |z-score| > 3. Sums are
+        # shifted by the first value to avoid cancellation in the variance.
+        shift = data[0]
+        total = 0.0
+        total_sq = 0.0
+        for x in data:
+            d = x - shift
+            total += d
+            total_sq += d * d
+        mean_shifted = total / n
+        variance = max(total_sq / n - mean_shifted * mean_shifted, 0.0)
+        std_dev = math.sqrt(variance)
+        if std_dev == 0:
+            return []  # No outliers if no variance
+        mean = shift + mean_shifted
+        lower_bound = mean - 3 * std_dev
+        upper_bound = mean + 3 * std_dev
+        return [i for i, x in enumerate(data) if x < lower_bound or x > upper_bound]
+    
+    # MAD method: robust to the outliers themselves inflating the spread
+    median = _median(data)
+    deviations = [abs(x - median) for x in data]
+    mad = _median(deviations)
+    if mad == 0:
+        return []  # No outliers if no spread
+    cutoff = 3.5 * mad / 0.6745
+    return [i for i, d in enumerate(deviations) if d > cutoff]
+
+
+def _median(values: List[float]) -> float:
+    """Median by linear-time selection."""
+    n = len(values)
+    if n % 2:
+        return _quickselect(values, [n // 2])[0]
+    low, high = _quickselect(values, [n // 2 - 1, n // 2])
+    return (low + high) / 2
+
+
+def _outlier_indices_numpy(np, data, method: str) -> List[int]:
+    """Vectorized ``_outlier_indices`` for NumPy arrays."""
+    values = np.asarray(data, dtype=float)
+    n = values.size
+    if method == 'iqr':
+        q1_idx, q3_idx = _quartile_ranks(n)
+        q1, q3 = np.partition(values, (q1_idx, q3_idx))[[q1_idx, q3_idx]]
+        iqr = q3 - q1
+        flagged = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+    elif method == 'z_score':
+        std_dev = values.std()
+        if std_dev == 0:
+            return []
+        flagged = np.abs((values - values.mean()) / std_dev) > 3
+    else:
+        deviations = np.abs(values - np.median(values))
+        mad = np.median(deviations)
+        if mad == 0:
+            return []
+        flagged = 0.6745 * deviations / mad > 3.5
+    return np.flatnonzero(flagged).tolist()
+
+
+def _validate_outlier_input(data, method: str):
+    """Shared validation for outlier_detection and outlier_indices."""
+    if hasattr(data, 'dtype'):
+        if data.ndim != 1 or data.dtype.kind not in 'biuf':
+            raise TypeError("All data values must be numeric")
+    else:
+        if not isinstance(data, list):
+            raise TypeError("Data must be a list")
+        # Check for non-numeric values
+        for value in data:
+            if not isinstance(value, (int, float)):
+                raise TypeError("All data values must be numeric")
+    
+    if len(data) == 0:
+        raise ValueError("Data cannot be empty")
+    
+    if method not in ['iqr', 'z_score', 'mad']:
+        raise ValueError("Method must be 'iqr', 'z_score' or 'mad'")
+
+
 def outlier_detection(data: List[float], method: str = 'iqr') -> List[float]:
     """
     Detect outliers in a dataset using specified method.
     
-    Supports IQR (Interquartile Range) and Z-score methods for outlier detection.
+    Supports IQR (Interquartile Range), Z-score and median absolute
+    deviation (MAD) methods for outlier detection.
     
     Args:
-        data (List[float]): Input dataset
-        method (str): Detection method ('iqr' or 'z_score')
+        data (List[float]): Input dataset, a ``Dataset``, or a chunked
+            source from ``data_loader`` (``Float64File``, ``CsvColumn``)
+        method (str): Detection method ('iqr', 'z_score' or 'mad')
         
     Returns:
         List[float]: List of outlier values
@@ -357,56 +1503,227 @@ def outlier_detection(data: List[float], method: str = 'iqr') -> List[float]:
         
     @author: Contributor 3
     """
-    if not isinstance(data, list):
+    if hasattr(data, 'iter_chunks'):
+        # Out-of-core sources are processed chunk by chunk, never as a list
+        from data_loader import streaming_outlier_detection
+        return streaming_outlier_detection(data, method)
+    
+    if not isinstance(data, (list, Dataset)):
         raise TypeError("Data must be a list")
     
-    if len(data) == 0:
-        raise ValueError("Data cannot be empty")
+    values = data._values if isinstance(data, Dataset) else data
+    return [values[i] for i in outlier_indices(data, method)]
+
+
+def outlier_indices(data: List[float], method: str = 'iqr', mask: bool = False) -> List:
+    """
+    Locate outliers instead of returning their values.
     
-    # Check for non-numeric values
-    for value in data:
-        if not isinstance(value, (int, float)):
-            raise TypeError("All data values must be numeric")
+    Uses the same rules as ``outlier_detection``, so
+    ``[data[i] for i in outlier_indices(data, m)] == outlier_detection(data, m)``.
+    NumPy arrays are accepted and processed with vectorized operations.
+    
+    Args:
+        data (List[float]): Input dataset (list, ``Dataset`` or 1-D NumPy array)
+        method (str): Detection method ('iqr', 'z_score' or 'mad')
+        mask (bool): Return a boolean flag per value instead of positions
+        
+    Returns:
+        List: Ascending outlier positions, or a list of booleans if mask is set
+        
+    Raises:
+        ValueError: If data is empty or invalid method
+        TypeError: If data is not a list or contains non-numeric values
+        
+    @author: Contributor 3
+    """
+    if isinstance(data, Dataset):
+        if len(data) == 0:
+            raise ValueError("Data cannot be empty")
+        if method not in ['iqr', 'z_score', 'mad']:
+            raise ValueError("Method must be 'iqr', 'z_score' or 'mad'")
+        indices = data.outlier_indices(method)
+    else:
+        _validate_outlier_input(data, method)
+        indices = _outlier_indices(data, method)
+    if not mask:
+        return indices
+    flags = [False] * len(data)
+    for i in indices:
+        flags[i] = True
+    return flags
+
+
+class StreamingOutlierDetector:
+    """
+    Online z-score outlier detector built on running moments.
     
-    if method not in ['iqr', 'z_score']:
-        raise ValueError("Method must be 'iqr' or 'z_score'")
+    Each value is scored against the mean and standard deviation of
+    everything seen before it (Welford's update), then folded into the
+    moments, so a stream is processed in a single pass with O(1) memory.
+    Unlike ``outlier_detection(data, 'z_score')``, early values are judged
+    without knowledge of later ones.
     
-    outliers = []
+    Args:
+        threshold (float): Flag values whose |z-score| exceeds this
+        min_count (int): Values to observe before anything is flagged
+        
+    Example:
+        >>> detector = StreamingOutlierDetector(min_count=5)
+        >>> detector.update([10, 11, 9, 10, 11, 10, 95])
+        [6]
+        
+    @author: Contributor 3
+    """
     
-    if method == 'iqr':
-        # IQR method: outliers are values outside Q1 - 1.5*IQR and Q3 + 1.5*IQR
-        sorted_data = sorted(data)
-        n = len(sorted_data)
+    def __init__(self, threshold: float = 3.0, min_count: int = 2):
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        self.threshold = threshold
+        self.min_count = max(min_count, 2)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation of the values seen so far."""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+    
+    def update(self, values: List[float]) -> List[int]:
+        """
+        Score and absorb a batch of values.
+        
+        Args:
+            values (List[float]): Next values of the stream
+            
+        Returns:
+            List[int]: Stream positions (counting from the first value ever
+            seen) of the values flagged as outliers
+            
+        Raises:
+            TypeError: If a value is not numeric
+        """
+        flagged = []
+        threshold = self.threshold
+        count, mean, m2 = self.count, self.mean, self.m2
+        for x in values:
+            if not isinstance(x, (int, float)):
+                raise TypeError("All data values must be numeric")
+            delta = x - mean
+            if count >= self.min_count and m2 > 0:
+                if abs(delta) > threshold * math.sqrt(m2 / count):
+                    flagged.append(count)
+            count += 1
+            mean += delta / count
+            m2 += delta * (x - mean)
+            self.count, self.mean, self.m2 = count, mean, m2
+        return flagged
+
+
+def _validated(data: List[float]):
+    """Yield the values of data, raising TypeError at the first non-numeric one."""
+    for x in data:
+        if not isinstance(x, (int, float)):
+            raise TypeError("All data values must be numeric")
+        yield x
+
+
+def describe(data: List[float], outlier_methods: Tuple[str, ...] = ('iqr', 'z_score'),
+             normalize_methods: Tuple[str, ...] = ('z_score', 'min_max')) -> dict:
+    """
+    Compute statistics, outliers and normalizations of one dataset together.
+    
+    Calling ``statistical_analysis``, ``outlier_detection`` for two methods
+    and ``data_normalization`` for two methods scans the data about fifteen
+    times. This plans the shared work instead: the two moment passes of
+    ``statistical_analysis`` (so mean and std_dev match it exactly), the
+    first one also validating, one sort giving median, quartiles, min and
+    max, one counting pass for the mode, one pass that flags IQR and
+    z-score outlier candidates together, and one output pass per
+    normalization.
+    
+    Args:
+        data (List[float]): Input dataset or a ``Dataset``
+        outlier_methods (Tuple[str, ...]): Methods for ``outlier_detection``
+        normalize_methods (Tuple[str, ...]): Methods for ``data_normalization``;
+            pass an empty tuple to skip the output passes
         
-        # Calculate Q1 and Q3
-        q1_idx = n // 4
-        q3_idx = 3 * n // 4
+    Returns:
+        dict: 'statistics' (the ``statistical_analysis`` result), 'outliers'
+        and 'normalized' (dicts mapping each method to its result)
         
-        if n % 4 == 0:
-            q1 = sorted_data[q1_idx - 1] if q1_idx > 0 else sorted_data[0]
-            q3 = sorted_data[q3_idx - 1] if q3_idx > 0 else sorted_data[-1]
-        else:
-            q1 = sorted_data[q1_idx]
-            q3 = sorted_data[q3_idx]
+    Raises:
+        ValueError: If data is empty, a method is invalid, or a requested
+            normalization has no variance
+        TypeError: If data is not a list or contains non-numeric values
         
-        iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
+    Example:
+        >>> describe([1, 2, 3, 4, 100], normalize_methods=())['outliers']
+        {'iqr': [100], 'z_score': []}
         
-        outliers = [x for x in data if x < lower_bound or x > upper_bound]
+    @author: Contributor 3
+    """
+    for method in outlier_methods:
+        if method not in ['iqr', 'z_score', 'mad']:
+            raise ValueError("Method must be 'iqr', 'z_score' or 'mad'")
+    for method in normalize_methods:
+        if method not in ['z_score', 'min_max']:
+            raise ValueError("Method must be 'z_score' or 'min_max'")
     
-    elif method == 'z_score':
-        # Z-score method: outliers are values with |z-score| > 3
-        mean = sum(data) / len(data)
-        variance = sum((x - mean) ** 2 for x in data) / len(data)
-        std_dev = math.sqrt(variance)
-        
-        if std_dev == 0:
-            return []  # No outliers if no variance
+    if isinstance(data, Dataset):
+        if len(data) == 0:
+            raise ValueError("Data cannot be empty")
+        dataset = data
+    else:
+        if not isinstance(data, list):
+            raise TypeError("Data must be a list")
+        if len(data) == 0:
+            raise ValueError("Data cannot be empty")
         
-        outliers = [x for x in data if abs((x - mean) / std_dev) > 3]
+        # Passes 1 and 2: validation fused with the sum, then the squared
+        # deviations; the same sums as statistical_analysis, so mean and
+        # std_dev match it exactly
+        n = len(data)
+        mean = sum(_validated(data)) / n
+        variance = sum((x - mean) ** 2 for x in data) / n
+        dataset = Dataset._wrap(data, (mean, math.sqrt(variance)))
+    
+    # Passes 3 and 4: the mode count, and one sort for min, max, median and
+    # quartiles
+    dataset.sorted_values()
+    statistics = dataset.statistics()
+    
+    # Pass 5: one sweep outside the tightest bounds (the intersection of the
+    # methods' intervals) finds every IQR and z-score candidate; each method
+    # then only filters the (few) candidates
+    bounds = {}
+    if 'iqr' in outlier_methods:
+        q1, q3 = dataset.quartiles()
+        bounds['iqr'] = (q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+    if 'z_score' in outlier_methods:
+        mean, std_dev = dataset.moments()
+        if std_dev > 0:
+            bounds['z_score'] = (mean - 3 * std_dev, mean + 3 * std_dev)
+    values = dataset._values
+    candidates = []
+    if bounds:
+        low = max(lower for lower, _ in bounds.values())
+        high = min(upper for _, upper in bounds.values())
+        candidates = [x for x in values if x < low or x > high]
+    
+    outliers = {}
+    for method in outlier_methods:
+        if method in bounds:
+            lower, upper = bounds[method]
+            outliers[method] = [x for x in candidates if x < lower or x > upper]
+        elif method == 'z_score':
+            outliers[method] = []  # No outliers if no variance
+        else:
+            outliers[method] = [values[i] for i in dataset.outlier_indices(method)]
     
-    return outliers 
+    normalized = {method: dataset.normalize(method) for method in normalize_methods}
+    return {'statistics': statistics, 'outliers': outliers, 'normalized': normalized}
 
 # TODO: Contributor 4 - Add your function here
 # Example:
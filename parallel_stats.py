@@ -0,0 +1,236 @@
+"""
+Parallel Statistics Module
+Sharded ``statistical_analysis`` over a process pool.
+
+The parent copies the data once into a shared memory block of float64
+values. Workers attach to it by name and only ever receive shard bounds, so
+no data is pickled per task. Each worker returns partial results: moments
+and min/max for its shard, bucket histograms for the median selection
+rounds, and the value counts of its shard for the mode. The parent merges
+these exactly, so the result matches the serial path to floating-point
+tolerance.
+
+@author: Contributor 3
+"""
+
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import data_loader
+from math_utils import _get_numpy
+
+PARALLEL_MIN_SIZE = 100_000
+
+
+def _on_shard(name: str, start: int, stop: int, func, *args):
+    """Attach to the shared block, run ``func(np, shard, *args)`` and detach."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast('d')
+        shard = view[start:stop]
+        try:
+            return func(_get_numpy(), shard, *args)
+        finally:
+            shard.release()
+            view.release()
+    finally:
+        shm.close()
+
+
+def _moments(np, shard):
+    return data_loader.chunk_moments(np, shard)
+
+
+def _buckets(np, shard, edges):
+    return data_loader.bucket_counts(np, [shard], edges)
+
+
+def _collect(np, shard, low, high):
+    return data_loader.collect_range(np, [shard], low, high)
+
+
+def _nonfinite(np, shard):
+    return data_loader.nonfinite_counts(np, [shard])
+
+
+def _slice_counts(np, shard, start: int):
+    """
+    Value counts of one contiguous slice, with each value's first index.
+
+    Returns:
+        Tuple: distinct values, their first indices in the whole data and
+        their counts, as arrays with NumPy, or a dict of value ->
+        [count, first index] without
+    """
+    if np is not None:
+        values = np.frombuffer(shard, dtype=np.float64) + 0.0  # folds -0.0 into 0.0
+        unique, first, counts = np.unique(values, return_index=True, return_counts=True)
+        return unique, first + start, counts
+
+    table = {}
+    for i, x in enumerate(shard, start):
+        entry = table.get(x)
+        if entry is None:
+            table[x] = [1, i]
+        else:
+            entry[0] += 1
+    return table
+
+
+def _mode(np, data: list, partials) -> Optional[object]:
+    """
+    Merge slice counts into the mode, ordered by first occurrence like ``Counter``.
+
+    Slices are contiguous and in order, so a value's first index is the one
+    from the earliest slice holding it, and the modes are the elements of
+    data at those indices.
+    """
+    if np is not None:
+        values, firsts, counts = (np.concatenate(column) for column in zip(*partials))
+        values, index, inverse = np.unique(values, return_index=True, return_inverse=True)
+        counts = np.bincount(inverse, weights=counts)
+        first = firsts[index]
+        distinct, max_count = len(values), counts.max()
+        indices = np.sort(first[counts == max_count]).tolist()
+    else:
+        merged = {}
+        for table in partials:
+            for x, (count, first) in table.items():
+                if x in merged:
+                    merged[x][0] += count
+                else:
+                    merged[x] = [count, first]
+        distinct = len(merged)
+        max_count = max(count for count, _ in merged.values())
+        indices = sorted(first for count, first in merged.values() if count == max_count)
+    if distinct == len(data) and len(data) > 1:
+        return None  # No mode if all values are unique
+    mode = [data[i] for i in indices]
+    return mode[0] if len(mode) == 1 else mode
+
+
+def _element(data: list, value: float, integers: bool, floats: bool):
+    """
+    value as the serial path returns it: an int for integer data, and for
+    mixed data the first element equal to it (what ``min`` and ``max`` pick).
+    """
+    if integers and not floats:
+        return int(value)
+    if integers and value == value:
+        return data[data.index(value)]
+    return value
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def parallel_statistical_analysis(data: list, workers: Optional[int] = None) -> dict:
+    """
+    ``statistical_analysis`` computed over shards in a process pool.
+
+    The work outside the pool (a type check, one conversion into shared
+    memory and merging) is linear, while the serial path sorts, so it is
+    only a small fraction for large inputs. Inputs below
+    ``PARALLEL_MIN_SIZE`` values, with fewer than two usable CPUs, or
+    containing integers too large for a float64 to hold exactly, are handed
+    back to the serial implementation. min, max, median and mode come back
+    as elements of the input, so ints stay ints as in the serial path.
+
+    Args:
+        data (list): Input dataset (already checked to be a non-empty list)
+        workers (Optional[int]): Number of worker processes (default and
+            upper bound: the number of usable CPUs)
+
+    Returns:
+        dict: Dictionary containing mean, median, mode, std_dev, count, min, max
+
+    Raises:
+        TypeError: If data contains non-numeric values
+        ValueError: If workers is not positive
+    """
+    from math_utils import statistical_analysis
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive")
+    workers = min(workers or _available_cpus(), _available_cpus())
+    if len(data) < PARALLEL_MIN_SIZE or workers < 2:
+        return statistical_analysis(data)
+    types = set(map(type, data))
+    is_float = {t: issubclass(t, float) for t in types if issubclass(t, (int, float))}
+    if len(is_float) != len(types):
+        raise TypeError("All data values must be numeric")
+    floats = any(is_float.values())
+    integers = not all(is_float.values())
+
+    np = _get_numpy()
+    n = len(data)
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        view = np.ndarray(n, dtype=np.float64, buffer=shm.buf) if np is not None else shm.buf.cast('d')
+        try:
+            view[:] = data if np is not None else array('d', data)
+        except OverflowError:
+            return statistical_analysis(data)
+        finally:
+            if np is None:
+                view.release()
+            del view
+        name = shm.name
+        bounds = [(n * i // workers, n * (i + 1) // workers) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            def on_shards(func, *args):
+                futures = [pool.submit(_on_shard, name, start, stop, func, *args) for start, stop in bounds]
+                return [f.result() for f in futures]
+
+            mode_futures = [pool.submit(_on_shard, name, start, stop, _slice_counts, start)
+                            for start, stop in bounds]
+            moments = (0, 0.0, 0.0, math.inf, -math.inf)
+            for partial in on_shards(_moments):
+                moments = data_loader.merge_moments(moments, partial)
+            count, mean, m2, low, high = moments
+            if integers and max(abs(low), abs(high)) > 2 ** 53:
+                return statistical_analysis(data)
+
+            counts = None
+            if data_loader.needs_nonfinite_counts({'mean': mean, 'min': low, 'max': high}):
+                counts = (0, 0, 0, 0, math.inf, -math.inf)
+                for partial in on_shards(_nonfinite):
+                    counts = data_loader.merge_nonfinite_counts(counts, partial)
+                low, high = data_loader.nonfinite_bounds(counts)
+
+            def count_buckets(edges):
+                below, counts = 0, [0] * (len(edges) - 1)
+                for shard_below, shard_counts in on_shards(_buckets, edges):
+                    below += shard_below
+                    counts = [a + b for a, b in zip(counts, shard_counts)]
+                return below, counts
+
+            def collect(lo, hi):
+                return [x for part in on_shards(_collect, lo, hi) for x in part]
+
+            middle = data_loader.select_ranks([n // 2 - 1, n // 2] if n % 2 == 0 else [n // 2], low, high,
+                                              count_buckets, collect, counts)
+            mode = _mode(np, data, [f.result() for f in mode_futures])
+    finally:
+        shm.close()
+        shm.unlink()
+
+    low, high = _element(data, low, integers, floats), _element(data, high, integers, floats)
+    middle = [_element(data, x, integers, floats) for x in middle]
+    return {
+        'mean': mean,
+        'median': middle[0] if len(middle) == 1 else (middle[0] + middle[1]) / 2,
+        'mode': mode,
+        'std_dev': math.sqrt(m2 / count),
+        'count': count,
+        'min': low,
+        'max': high
+    }
@@ -0,0 +1,483 @@
+"""
+Performance Lint Module
+AST checks for performance anti-patterns, run by
+``CodeAnalyzer.run_performance_lint``.
+
+Rules:
+
+- PERF101 loop-invariant: work inside a nested loop that does not depend on
+  that loop - pure builtin calls such as ``len(matrix_b)`` or
+  ``range(len(matrix_b))`` and row lookups such as ``matrix_a[i]`` in
+  ``matrix_a[i][k]`` - plus ``isinstance`` checks against builtin types
+  repeated per element, which belong in one validation pass before the
+  loops.
+- PERF102 redundant-pass: three or more full passes (loops,
+  comprehensions, ``sum``/``min``/``max``/``sorted``/...) over the same
+  unchanged iterable along one path through a function, and loops over
+  ``a + b`` that copy both lists just to iterate over them. Passes in
+  if/else arms, or after an arm that returns, are counted per path, not
+  summed; names bound only to a literal list, tuple or set are skipped.
+- PERF103 quadratic-list: ``lst = lst + [...]`` or ``lst.insert(0, x)`` /
+  ``lst.pop(0)`` inside a loop, and ``sum(lists, [])``.
+- PERF104 duplicate-definition: a function or class defined twice in the
+  same scope, so the first definition is dead code.
+
+The checks are syntactic and conservative: a name assigned, or mutated
+through a method call, inside a loop is treated as changing with it.
+A ``# noqa: PERF102`` comment (several codes separated by commas) on the
+reported line suppresses those findings; a bare ``# noqa`` does not.
+
+@author: Admin (Repository Owner)
+"""
+
+import ast
+import re
+from typing import Any, Dict, List, Optional, Set
+
+# Bump when rules change, so cached findings are redone
+LINT_VERSION = 3
+RULES = {
+    'PERF101': 'loop-invariant',
+    'PERF102': 'redundant-pass',
+    'PERF103': 'quadratic-list',
+    'PERF104': 'duplicate-definition',
+}
+# Builtins whose result depends only on their arguments
+PURE_BUILTINS = frozenset({'len', 'abs', 'min', 'max', 'sum', 'sorted', 'range', 'tuple', 'frozenset',
+                           'round', 'pow', 'divmod', 'int', 'float', 'str', 'bool', 'hash'})
+# Builtins that consume their whole first argument
+PASS_FUNCTIONS = frozenset({'sum', 'min', 'max', 'sorted', 'any', 'all', 'list', 'tuple', 'set',
+                            'frozenset', 'Counter'})
+PASS_LIMIT = 3
+_NOQA = re.compile(r'#\s*noqa:\s*(PERF\d+(?:\s*,\s*PERF\d+)*)')
+# isinstance() against these is input validation rather than dispatch
+VALIDATION_TYPES = frozenset({'int', 'float', 'complex', 'bool', 'str', 'bytes', 'list', 'tuple', 'dict', 'set'})
+
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+_COMPREHENSIONS = (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)
+
+
+def _finding(code: str, node: ast.AST, message: str) -> Dict[str, Any]:
+    return {'code': code, 'rule': RULES[code], 'line': node.lineno, 'column': node.col_offset,
+            'message': message}
+
+
+def _call_name(node: ast.AST) -> Optional[str]:
+    """Name of a plain ``name(...)`` call."""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        return node.func.id
+    return None
+
+
+def _is_validation(node: ast.Call) -> bool:
+    """True for ``isinstance(x, int)`` / ``isinstance(x, (int, float))`` style checks."""
+    if len(node.args) != 2:
+        return False
+    types = node.args[1]
+    names = types.elts if isinstance(types, ast.Tuple) else [types]
+    return all(isinstance(name, ast.Name) and name.id in VALIDATION_TYPES for name in names)
+
+
+def _changed_names(loop: ast.AST) -> Set[str]:
+    """Names a loop rebinds, or mutates through methods and item/attribute assignment."""
+    names = set()
+    for node in ast.walk(loop):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            names.add(node.id)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            base = node.func.value
+            if isinstance(base, ast.Name):
+                names.add(base.id)
+        elif isinstance(node, (ast.Subscript, ast.Attribute)) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            base = node.value
+            while isinstance(base, (ast.Subscript, ast.Attribute)):
+                base = base.value
+            if isinstance(base, ast.Name):
+                names.add(base.id)
+    return names
+
+
+def _is_invariant(node: ast.AST, changed: Set[str]) -> bool:
+    """True if node only reads names the loop leaves alone and calls only pure builtins."""
+    local = set()
+    loads = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call) and _call_name(child) not in PURE_BUILTINS:
+            return False
+        if isinstance(child, (ast.Yield, ast.YieldFrom, ast.Await, ast.NamedExpr) + _FUNCTIONS):
+            return False
+        if isinstance(child, ast.comprehension):
+            local.update(n.id for n in ast.walk(child.target) if isinstance(n, ast.Name))
+        elif isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
+            loads.add(child.id)
+    loads -= local
+    return bool(loads) and not loads & changed
+
+
+class _LoopVisitor(ast.NodeVisitor):
+    """PERF101 and PERF103: checks that depend on the enclosing loops."""
+
+    def __init__(self, findings: list):
+        self.findings = findings
+        self.loops = []  # names changed by each enclosing loop, innermost last
+        self.list_names = [set()]  # names bound to lists, per function
+
+    def visit_function(self, node):
+        saved = self.loops
+        self.loops = []
+        self.list_names.append(set())
+        self.generic_visit(node)
+        self.list_names.pop()
+        self.loops = saved
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_Lambda = visit_function
+
+    def visit_loop(self, node):
+        # The iterable is evaluated once per run of the enclosing loop
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            self.visit(node.iter)
+            inside = [node.target] + node.body
+        else:
+            inside = [node.test] + node.body
+        self.loops.append(_changed_names(node))
+        for child in inside:
+            self.visit(child)
+        self.loops.pop()
+        for child in node.orelse:
+            self.visit(child)
+
+    visit_For = visit_AsyncFor = visit_While = visit_loop
+
+    def visit_comprehension_node(self, node):
+        generators = node.generators
+        self.visit(generators[0].iter)
+        self.loops.append(_changed_names(node))
+        for index, generator in enumerate(generators):
+            if index:
+                self.visit(generator.iter)
+            for condition in generator.ifs:
+                self.visit(condition)
+        for element in ('elt', 'key', 'value'):
+            if hasattr(node, element):
+                self.visit(getattr(node, element))
+        self.loops.pop()
+
+    visit_ListComp = visit_SetComp = visit_GeneratorExp = visit_DictComp = visit_comprehension_node
+
+    def visit_Assign(self, node):
+        value = node.value
+        for target in node.targets:
+            if not isinstance(target, ast.Name):
+                continue
+            if isinstance(value, (ast.List, ast.ListComp)) or _call_name(value) in ('list', 'sorted'):
+                self.list_names[-1].add(target.id)
+            elif (self.loops and isinstance(value, ast.BinOp) and isinstance(value.op, ast.Add)
+                  and any(isinstance(side, ast.Name) and side.id == target.id
+                          for side in (value.left, value.right))
+                  and (target.id in self.list_names[-1]
+                       or isinstance(value.left, (ast.List, ast.ListComp))
+                       or isinstance(value.right, (ast.List, ast.ListComp)))):
+                self.findings.append(_finding(
+                    'PERF103', node, f"`{ast.unparse(node)}` copies the whole list on every iteration; "
+                                     f"use {target.id}.append() or extend()"))
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        name = _call_name(node)
+        if name == 'sum' and len(node.args) == 2 and isinstance(node.args[1], ast.List):
+            self.findings.append(_finding(
+                'PERF103', node, f"`{ast.unparse(node)}` concatenates lists quadratically; "
+                                 "use itertools.chain.from_iterable()"))
+        if self.loops and isinstance(node.func, ast.Attribute) and node.func.attr in ('insert', 'pop'):
+            first = node.args[0] if node.args else None
+            if isinstance(first, ast.Constant) and first.value == 0:
+                self.findings.append(_finding(
+                    'PERF103', node, f"`{ast.unparse(node)}` inside a loop shifts every element each time; "
+                                     "use collections.deque or build the list reversed"))
+        if len(self.loops) >= 2:
+            if name == 'isinstance' and _is_validation(node):
+                self.findings.append(_finding(
+                    'PERF101', node, f"`{ast.unparse(node)}` runs on every iteration of a nested loop; "
+                                     "validate the input once before the loops"))
+                return
+            if name in PURE_BUILTINS and _is_invariant(node, self.loops[-1]):
+                self.findings.append(_finding(
+                    'PERF101', node, f"`{ast.unparse(node)}` does not change inside the loop; "
+                                     "compute it once before the loop"))
+                return
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node):
+        inner = node.value
+        if (len(self.loops) >= 2 and isinstance(inner, ast.Subscript) and isinstance(node.ctx, ast.Load)
+                and _is_invariant(inner, self.loops[-1])):
+            self.findings.append(_finding(
+                'PERF101', inner, f"`{ast.unparse(inner)}` is looked up on every iteration of the loop; "
+                                  "bind it to a local before the loop"))
+            self.visit(node.slice)
+            return
+        self.generic_visit(node)
+
+
+def _scope_nodes(scope: ast.AST):
+    """Nodes of one function or module body, not descending into nested functions or classes."""
+    stack = list(ast.iter_child_nodes(scope))
+    while stack:
+        node = stack.pop()
+        yield node
+        if not isinstance(node, _FUNCTIONS + (ast.ClassDef,)):
+            stack.extend(ast.iter_child_nodes(node))
+
+
+def _iterated_names(node: ast.AST) -> List[str]:
+    """Names node iterates over in full: ``x``, ``enumerate(x)``, ``zip(x, y)``, ``reversed(x)``."""
+    if isinstance(node, ast.Name):
+        return [node.id]
+    if _call_name(node) in ('enumerate', 'zip', 'reversed'):
+        return [arg.id for arg in node.args if isinstance(arg, ast.Name)]
+    return []
+
+
+def _tiny_names(scope: ast.AST, inherited: Set[str] = frozenset()) -> Set[str]:
+    """
+    Names bound only to a non-empty list, tuple or set display and never
+    mutated through a method - fixed handfuls not worth fusing loops over -
+    plus the inherited (module level) ones the scope doesn't rebind.
+    """
+    literal = {}
+    changed = set()
+    for node in _scope_nodes(scope):
+        if isinstance(node, ast.Assign) and isinstance(node.value, (ast.List, ast.Tuple, ast.Set)) and node.value.elts:
+            literal.update((id(target), target.id) for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)) and id(node) not in literal:
+            changed.add(node.id)
+        elif isinstance(node, ast.arg):
+            changed.add(node.arg)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and isinstance(node.func.value,
+                                                                                               ast.Name):
+            changed.add(node.func.value.id)
+    return (set(literal.values()) | set(inherited)) - changed
+
+
+def _iteration_events(iterable: ast.AST, findings: list) -> list:
+    """Pass events of a loop or comprehension over iterable, reporting ``a + b`` copies."""
+    if (isinstance(iterable, ast.BinOp) and isinstance(iterable.op, ast.Add)
+            and isinstance(iterable.left, ast.Name) and isinstance(iterable.right, ast.Name)):
+        findings.append(_finding(
+            'PERF102', iterable, f"`{ast.unparse(iterable)}` builds a new list just to iterate over it; "
+                                 "use itertools.chain() or loop over each"))
+    return [(iterable.lineno, iterable.col_offset, 'pass', name) for name in _iterated_names(iterable)]
+
+
+def _events(roots: list, findings: list) -> list:
+    """Pass and store events in roots by position, not entering nested functions or classes."""
+    events = []
+    # ``x = sorted(x)`` passes over the old x, so the new binding starts
+    # after the value rather than at the target
+    rebound = {}
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+            for target in (node.targets if isinstance(node, ast.Assign) else [node.target]):
+                if isinstance(target, ast.Name):
+                    rebound[id(target)] = (node.value.end_lineno, node.value.end_col_offset)
+        if isinstance(node, ast.comprehension):
+            events.extend(_iteration_events(node.iter, findings))
+        elif _call_name(node) in PASS_FUNCTIONS and node.args and isinstance(node.args[0], ast.Name):
+            events.append((node.lineno, node.col_offset, 'pass', node.args[0].id))
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            line, column = rebound.get(id(node), (node.lineno, node.col_offset))
+            events.append((line, column, 'store', node.id))
+        if not isinstance(node, _FUNCTIONS + (ast.ClassDef,)):
+            stack.extend(ast.iter_child_nodes(node))
+    return sorted(events)
+
+
+class _PassCounter:
+    """
+    PERF102 pass counting along the paths through one function.
+
+    A state maps each name to the passes over it since it was last bound.
+    Branches start from copies of the state and rejoin keeping, per name,
+    the arm with the most passes, so passes in arms that can't both run are
+    never added up. Returns and raises end a path; breaks and continues
+    carry it to the end of the loop, whose body may also run zero times.
+    """
+
+    def __init__(self, findings: list, tiny: Set[str]):
+        self.findings = findings
+        self.tiny = tiny
+        self.reported = {}
+        self.loop_exits = []
+
+    def run(self, body: list):
+        self.end(self.block(body, {}))
+        self.findings.extend(finding for _, finding in self.reported.values())
+
+    def apply(self, state: dict, events: list) -> dict:
+        for line, column, kind, name in events:
+            if name in self.tiny:
+                continue
+            if kind == 'store':
+                self.report(name, state.pop(name, ()))
+            else:
+                state[name] = state.get(name, ()) + ((line, column),)
+        return state
+
+    def report(self, name: str, passes: tuple):
+        lines = sorted({line for line, _ in passes})
+        if len(lines) < PASS_LIMIT:
+            return
+        line, column = passes[PASS_LIMIT - 1]
+        # Paths sharing a prefix reach the same pass; keep the longest run
+        earlier = self.reported.get((line, column, name))
+        if earlier is None or len(earlier[0]) < len(lines):
+            self.reported[(line, column, name)] = (lines, {
+                'code': 'PERF102', 'rule': RULES['PERF102'], 'line': line, 'column': column,
+                'message': f"{len(lines)} full passes over `{name}` (lines "
+                           f"{', '.join(map(str, lines))}); combine them into a single loop"})
+
+    def end(self, state: Optional[dict]):
+        """Report the passes of a path that stops here."""
+        for name, passes in (state or {}).items():
+            self.report(name, passes)
+
+    @staticmethod
+    def join(*states: Optional[dict]) -> Optional[dict]:
+        """The state after branches rejoin, or None if no branch continues."""
+        live = [state for state in states if state is not None]
+        if not live:
+            return None
+        joined = {}
+        for state in live:
+            for name, passes in state.items():
+                if len({line for line, _ in passes}) > len({line for line, _ in joined.get(name, ())}):
+                    joined[name] = passes
+        return joined
+
+    def block(self, body: list, state: Optional[dict]) -> Optional[dict]:
+        for node in body:
+            if state is None:
+                break
+            state = self.statement(node, state)
+        return state
+
+    def loop(self, node, state: dict) -> Optional[dict]:
+        self.loop_exits.append([])
+        after_body = self.block(node.body, dict(state))
+        exits = self.loop_exits.pop()
+        return self.block(node.orelse, self.join(state, after_body, *exits))
+
+    def statement(self, node: ast.stmt, state: dict) -> Optional[dict]:
+        if isinstance(node, ast.If):
+            state = self.apply(state, _events([node.test], self.findings))
+            return self.join(self.block(node.body, dict(state)), self.block(node.orelse, dict(state)))
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            state = self.apply(state, _iteration_events(node.iter, self.findings))
+            state = self.apply(state, _events([node.iter], self.findings))
+            return self.loop(node, self.apply(state, _events([node.target], self.findings)))
+        if isinstance(node, ast.While):
+            return self.loop(node, self.apply(state, _events([node.test], self.findings)))
+        if isinstance(node, (ast.With, ast.AsyncWith)):
+            return self.block(node.body, self.apply(state, _events(node.items, self.findings)))
+        if isinstance(node, ast.Try):
+            after_body = self.block(node.body, dict(state))
+            handled = [self.block(handler.body, dict(state)) for handler in node.handlers]
+            after = self.join(self.block(node.orelse, after_body), *handled)
+            finished = self.block(node.finalbody, dict(state) if after is None else after)
+            if after is None:
+                self.end(finished)
+                return None
+            return finished
+        if isinstance(node, ast.Match):
+            state = self.apply(state, _events([node.subject], self.findings))
+            return self.join(state, *(self.block(case.body, dict(state)) for case in node.cases))
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            return self.apply(state, [(node.lineno, node.col_offset, 'store', node.name)])
+        state = self.apply(state, _events([node], self.findings))
+        if isinstance(node, (ast.Return, ast.Raise)):
+            self.end(state)
+            return None
+        if isinstance(node, (ast.Break, ast.Continue)) and self.loop_exits:
+            self.loop_exits[-1].append(state)
+            return None
+        return state
+
+
+def _check_passes(scope: ast.AST, findings: list, inherited: Set[str] = frozenset()):
+    """PERF102 within one function (or the module's top level)."""
+    body = scope.body if isinstance(scope.body, list) else [ast.Expr(scope.body)]
+    _PassCounter(findings, _tiny_names(scope, inherited)).run(body)
+
+
+def _check_duplicates(body: list, findings: list):
+    """PERF104 for one statement list, then for the bodies nested in it."""
+    seen = {}
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            earlier = seen.get(node.name)
+            # Decorated redefinitions (property setters, overloads) are intentional
+            if earlier is not None and not earlier.decorator_list and not node.decorator_list:
+                findings.append(_finding(
+                    'PERF104', earlier, f"`{node.name}` is redefined at line {node.lineno}; "
+                                        "this definition is dead code"))
+            seen[node.name] = node
+    for node in body:
+        for field in ('body', 'orelse', 'finalbody'):
+            # Statement bodies are always statement lists
+            nested = getattr(node, field, None)
+            if nested:
+                _check_duplicates(nested, findings)
+        for handler in getattr(node, 'handlers', []):
+            _check_duplicates(handler.body, findings)
+
+
+def lint_tree(tree: ast.Module) -> List[Dict[str, Any]]:
+    """Findings for a parsed module, sorted by position."""
+    findings = []
+    _LoopVisitor(findings).visit(tree)
+    _check_passes(tree, findings)
+    module_tiny = _tiny_names(tree)
+    for node in ast.walk(tree):
+        if isinstance(node, _FUNCTIONS):
+            _check_passes(node, findings, module_tiny)
+    _check_duplicates(tree.body, findings)
+    return sorted(findings, key=lambda finding: (finding['line'], finding['column'], finding['code']))
+
+
+def lint_source(source: str, filename: str = '<string>') -> List[Dict[str, Any]]:
+    """
+    Performance findings for one module's source.
+
+    Args:
+        source (str): Python source code
+        filename (str): Name used in syntax error messages
+
+    Returns:
+        List[Dict[str, Any]]: One dict per finding with code, rule, line,
+        column and message, less those suppressed by ``# noqa: PERFnnn``
+        comments; empty if the source doesn't parse
+    """
+    try:
+        tree = ast.parse(source, filename)
+    except SyntaxError:
+        return []
+    findings = lint_tree(tree)
+    if not findings:
+        return findings
+    lines = source.splitlines()
+    suppressed = {}
+    for finding in findings:
+        line = finding['line']
+        if line not in suppressed:
+            match = _NOQA.search(lines[line - 1]) if line <= len(lines) else None
+            suppressed[line] = set(re.split(r'\s*,\s*', match.group(1))) if match else set()
+    return [finding for finding in findings if finding['code'] not in suppressed[finding['line']]]
+
+
+def lint_file(path: str) -> List[Dict[str, Any]]:
+    """``lint_source`` of the file at path."""
+    with open(path, 'rb') as f:
+        source = f.read().decode('utf-8', errors='replace')
+    return lint_source(source, path)
@@ -0,0 +1,237 @@
+"""
+Result Cache Module
+Opt-in, content-addressed LRU cache for the math_utils functions.
+
+Calls are keyed by a BLAKE2b digest of the function name and the pickled
+arguments, so equal inputs hit the cache no matter which list object holds
+them. Contiguous buffers (``array``, ``bytes``, NumPy arrays) are hashed
+directly from memory instead of being pickled. Results are stored pickled:
+the pickle size is what counts against the byte budget, it doubles as the
+on-disk format, and every hit unpickles a fresh copy, so callers can never
+corrupt a cached entry.
+
+Example:
+    >>> from math_utils import statistical_analysis
+    >>> cache = ResultCache(max_bytes=32 * 1024 * 1024)
+    >>> stats = cache.wrap(statistical_analysis)
+    >>> stats([1, 2, 3])['mean']
+    2.0
+    >>> cache.stats()['misses']
+    1
+
+@author: Admin (Repository Owner)
+"""
+
+import functools
+import hashlib
+import os
+import pickle  # nosec B403 - only used for entries this cache wrote itself
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+def _update_digest(digest, value):
+    """Feed one argument into the digest, hashing raw buffers where possible."""
+    try:
+        view = memoryview(value)
+    except (TypeError, ValueError):
+        view = None
+    if view is not None and view.c_contiguous:
+        digest.update(f"buffer:{type(value).__name__}:{view.format}:{view.shape}:".encode())
+        digest.update(view.cast('B') if view.ndim else view.tobytes())
+        return
+    digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of function results under a byte budget.
+
+    Args:
+        max_bytes (int): Budget for pickled results held in memory
+        disk_dir (Optional[str]): Directory for a persistent second tier;
+            entries written there survive restarts. Only point this at a
+            directory that nothing else writes to.
+        max_disk_bytes (int): Budget for the files in disk_dir. Least
+            recently used files are deleted past it; file modification
+            times carry the recency across restarts.
+
+    Raises:
+        ValueError: If max_bytes or max_disk_bytes is negative
+
+    @author: Admin (Repository Owner)
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, disk_dir: Optional[str] = None,
+                 max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        if max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+        if max_disk_bytes < 0:
+            raise ValueError("max_disk_bytes cannot be negative")
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_dir = disk_dir
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._disk_entries = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'disk_hits': 0, 'evictions': 0, 'disk_evictions': 0}
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    @staticmethod
+    def make_key(func: Callable, args: tuple, kwargs: dict) -> str:
+        """Content hash identifying a call of func with these arguments."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+        for value in args:
+            _update_digest(digest, value)
+        for name in sorted(kwargs):
+            digest.update(name.encode())
+            _update_digest(digest, kwargs[name])
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + '.pkl')
+
+    def _load_disk_index(self):
+        """Index the existing files, oldest first, and trim them to the budget."""
+        files = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith('.pkl'):
+                stat = entry.stat()
+                files.append((stat.st_mtime_ns, entry.name[:-len('.pkl')], stat.st_size))
+        for _, key, size in sorted(files):
+            self._disk_entries[key] = size
+            self._disk_bytes += size
+        self._prune_disk()
+
+    def _prune_disk(self):
+        """Delete least recently used files until the disk tier fits its budget."""
+        while self._disk_bytes > self.max_disk_bytes:
+            key, size = self._disk_entries.popitem(last=False)
+            self._disk_bytes -= size
+            self._counters['disk_evictions'] += 1
+            try:
+                os.remove(self._disk_path(key))
+            except OSError:
+                pass
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._disk_path(key), 'rb') as f:
+                payload = f.read()
+            # Record the use on disk too, so a restarted cache keeps the order
+            os.utime(self._disk_path(key))
+        except OSError:
+            return None
+        with self._lock:
+            if key in self._disk_entries:
+                self._disk_entries.move_to_end(key)
+        return payload
+
+    def _write_disk(self, key: str, payload: bytes):
+        if len(payload) > self.max_disk_bytes:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        with self._lock:
+            self._disk_bytes += len(payload) - self._disk_entries.pop(key, 0)
+            self._disk_entries[key] = len(payload)
+            self._prune_disk()
+
+    def _store(self, key: str, payload: bytes):
+        """Insert into the memory tier and evict least recently used entries."""
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = payload
+            self._bytes += len(payload)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._counters['evictions'] += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Fresh copy of the cached result for key, or default."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+        if payload is None and self.disk_dir is not None:
+            payload = self._read_disk(key)
+            if payload is not None:
+                with self._lock:
+                    self._counters['disk_hits'] += 1
+                self._store(key, payload)
+        if payload is None:
+            with self._lock:
+                self._counters['misses'] += 1
+            return default
+        return pickle.loads(payload)  # nosec B301 - payload was written by this cache
+
+    def put(self, key: str, value: Any):
+        """Cache a copy of value under key."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._store(key, payload)
+        if self.disk_dir is not None:
+            self._write_disk(key, payload)
+
+    def wrap(self, func: Callable) -> Callable:
+        """
+        Return a caching version of func.
+
+        Exceptions are not cached. The wrapper exposes the cache as ``.cache``.
+        """
+        missing = object()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = self.make_key(func, args, kwargs)
+            result = self.get(key, missing)
+            if result is missing:
+                # The cache keeps its own pickled copy, so handing out the
+                # freshly computed object is safe
+                result = func(*args, **kwargs)
+                self.put(key, result)
+            return result
+
+        wrapper.cache = self
+        return wrapper
+
+    def clear(self, disk: bool = False):
+        """Drop all in-memory entries (and the on-disk tier if disk is set)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if disk and self.disk_dir is not None:
+                self._disk_entries.clear()
+                self._disk_bytes = 0
+                for name in os.listdir(self.disk_dir):
+                    if name.endswith('.pkl'):
+                        os.remove(os.path.join(self.disk_dir, name))
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters plus current size of both tiers."""
+        with self._lock:
+            return dict(self._counters, entries=len(self._entries), bytes=self._bytes,
+                        max_bytes=self.max_bytes, disk_entries=len(self._disk_entries),
+                        disk_bytes=self._disk_bytes, max_disk_bytes=self.max_disk_bytes)
@@ -0,0 +1,196 @@
+"""
+Service Module
+Function registry and the long-running JSON-lines worker behind
+``python main.py serve --jsonl``.
+
+Other programs keep one worker process alive and send it requests instead
+of paying interpreter start-up and imports for every call. Each input line
+is one JSON request::
+
+    {"id": "r1", "fn": "statistical_analysis", "args": [[1, 2, 3]]}
+
+and each output line is the matching response, written and flushed as soon
+as the call finishes (so not necessarily in input order)::
+
+    {"id": "r1", "result": {"mean": 2.0, ...}}
+    {"id": "r2", "error": {"type": "ValueError", "message": "Data cannot be empty"}}
+
+Responses are strict JSON: NumPy arrays and scalars are converted to
+lists and numbers, and a result holding NaN or an infinity becomes a
+ValueError response. Error responses echo the request's ``id`` whenever the line
+parsed as a JSON object.
+
+Only functions in ``REGISTRY`` can be called. ``{"fn": "metrics"}`` (or
+``"args": ["prometheus"]``) returns the worker's call metrics when
+``instrumentation`` is enabled.
+
+@author: Admin (Repository Owner)
+"""
+
+import json
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TextIO
+
+import instrumentation
+import math_utils
+from batch_calculator import evaluate_expression
+
+DEFAULT_WORKERS = 4
+
+REGISTRY: Dict[str, Callable] = {}
+
+
+def register(func: Callable, name: Optional[str] = None) -> Callable:
+    """Make func callable through the service under name (default: its own)."""
+    REGISTRY[name or func.__name__] = func
+    return func
+
+
+for _func in (math_utils.basic_calculator, math_utils.basic_calculator_array,
+              math_utils.fibonacci_sequence, math_utils.matrix_multiply,
+              math_utils.prime_number_generator, math_utils.statistical_analysis,
+              math_utils.linear_regression, math_utils.linear_regression_many,
+              math_utils.multiple_linear_regression, math_utils.data_normalization,
+              math_utils.outlier_detection, math_utils.outlier_indices,
+              math_utils.describe, evaluate_expression):
+    register(_func)
+register(instrumentation.metrics_report, 'metrics')
+
+
+def call(name: str, args: list = (), kwargs: Optional[dict] = None) -> Any:
+    """
+    Call a registered function by name.
+
+    Raises:
+        ValueError: If no function is registered under name
+    """
+    func = REGISTRY.get(name)
+    if func is None:
+        raise ValueError(f"Unknown function: {name}")
+    return func(*args, **(kwargs or {}))
+
+
+class InvalidRequest(ValueError):
+    """A request line that decoded but is not a valid request; keeps its id."""
+
+    def __init__(self, message: str, request_id=None):
+        super().__init__(message)
+        self.request_id = request_id
+
+
+def request_id(request: dict):
+    """The request's ``id`` (or ``request_id``), None if it has neither."""
+    return request.get('id', request.get('request_id'))
+
+
+def parse_request(line: str) -> dict:
+    """
+    Decode and check one request line.
+
+    Raises:
+        ValueError: If the line is not a JSON object; ``InvalidRequest``
+            (with the request's id) if it has no string "fn", or "args"
+            is not a list or "kwargs" not an object (both optional)
+    """
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+    if not isinstance(request.get('fn'), str):
+        raise InvalidRequest("Request needs a string 'fn'", request_id(request))
+    if not isinstance(request.get('args', []), list):
+        raise InvalidRequest("'args' must be a list", request_id(request))
+    if not isinstance(request.get('kwargs', {}), dict):
+        raise InvalidRequest("'kwargs' must be an object", request_id(request))
+    return request
+
+
+def error_response(request_id, error: BaseException) -> dict:
+    """Response object reporting that a request failed with error."""
+    return {'id': request_id, 'error': {'type': type(error).__name__, 'message': str(error)}}
+
+
+def _to_json(value: Any) -> Any:
+    # NumPy arrays and scalars
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_response(response: dict) -> str:
+    """
+    One response as strict JSON, with NumPy values converted.
+
+    Raises:
+        TypeError: If the response holds a value JSON can't represent
+        ValueError: If it holds NaN or an infinity
+    """
+    return json.dumps(response, allow_nan=False, default=_to_json)
+
+
+def serve_jsonl(input_stream: TextIO = None, output_stream: TextIO = None,
+                workers: int = DEFAULT_WORKERS, processes: bool = False) -> int:
+    """
+    Answer JSON-lines requests until the input ends.
+
+    Requests run concurrently on a pool of ``workers`` threads (or
+    processes, for CPU-bound loads). At most ``4 * workers`` requests are
+    in flight, so a fast producer cannot queue unbounded work. Every
+    response carries the request's ``id`` (or ``request_id``).
+
+    Args:
+        input_stream (TextIO): Requests, one per line (default: stdin)
+        output_stream (TextIO): Responses, one per line (default: stdout)
+        workers (int): Pool size
+        processes (bool): Use a process pool instead of threads
+
+    Returns:
+        int: Number of requests that produced an error response
+
+    Raises:
+        ValueError: If workers is not positive
+    """
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    input_stream = input_stream or sys.stdin
+    output_stream = output_stream or sys.stdout
+    write_lock = threading.Lock()
+    slots = threading.BoundedSemaphore(4 * workers)
+    failures = [0]
+
+    def respond(response: dict):
+        try:
+            text = encode_response(response)
+        except (TypeError, ValueError) as e:  # result is not strict JSON
+            response = error_response(response['id'], e)
+            text = encode_response(response)
+        with write_lock:
+            if 'error' in response:
+                failures[0] += 1
+            output_stream.write(text + '\n')
+            output_stream.flush()
+
+    executor = ProcessPoolExecutor(workers) if processes else ThreadPoolExecutor(workers)
+    with executor:
+        for line in input_stream:
+            if not line.strip():
+                continue
+            try:
+                request = parse_request(line)
+            except ValueError as e:  # json.JSONDecodeError is a ValueError
+                respond(error_response(getattr(e, 'request_id', None), e))
+                continue
+            slots.acquire()
+            future = executor.submit(call, request['fn'], request.get('args', []), request.get('kwargs'))
+
+            def done(future, request_id=request_id(request)):
+                try:
+                    error = future.exception()
+                    respond(error_response(request_id, error) if error is not None
+                            else {'id': request_id, 'result': future.result()})
+                finally:
+                    slots.release()
+
+            future.add_done_callback(done)
+    return failures[0]
@@ -0,0 +1,196 @@
+"""
+Unit tests for the batch expression calculator.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import io
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+from unittest import mock
+
+# Add the parent directory to the path to import math_utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from batch_calculator import (compile_expression, evaluate_expression, iter_results, process_file,
+                              format_result, parallel_results, MAX_EXPRESSION_LENGTH)
+from math_utils import basic_calculator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestEvaluateExpression(unittest.TestCase):
+    """Test cases for compiling and evaluating single expressions."""
+
+    def test_chained_operations(self):
+        """Test left-to-right chains, precedence, parentheses and signs."""
+        self.assertEqual(evaluate_expression("3 * 3 * 3"), 27)
+        self.assertEqual(evaluate_expression("12 - 8 + 4"), 8)
+        self.assertEqual(evaluate_expression("2 + 3 * 4"), 14)
+        self.assertEqual(evaluate_expression("(2 + 3) * 4"), 20)
+        self.assertEqual(evaluate_expression("-(4 + 2) * 1.5"), -9.0)
+        self.assertEqual(evaluate_expression("100 / 4 / 5"), 5.0)
+
+    def test_matches_basic_calculator(self):
+        """Test that each operator behaves like basic_calculator."""
+        for symbol, operation in (('+', 'add'), ('-', 'subtract'), ('*', 'multiply'), ('/', 'divide')):
+            expected = basic_calculator(operation, 7, 2)
+            result = evaluate_expression(f"7 {symbol} 2")
+            self.assertEqual(result, expected)
+            self.assertIs(type(result), type(expected))
+        with self.assertRaises(ValueError) as context:
+            evaluate_expression("1 / (2 - 2)")
+        self.assertIn("Division by zero is not allowed", str(context.exception))
+
+    def test_rejects_non_arithmetic(self):
+        """Test that names, calls, other operators and non-numbers are refused."""
+        for expression in ('__import__("os")', 'x + 1', '2 ** 3', '7 % 2', 'True + 1',
+                           '"a" * 3', '1 +', '', 'lambda: 1'):
+            with self.assertRaises(ValueError):
+                evaluate_expression(expression)
+        with self.assertRaises(ValueError):
+            evaluate_expression("1" + " + 1" * MAX_EXPRESSION_LENGTH)
+
+    def test_compiled_forms_are_cached(self):
+        """Test that repeated expression text reuses the compiled function."""
+        compile_expression.cache_clear()
+        first = compile_expression("6 * 7")
+        second = compile_expression("6 * 7")
+
+        self.assertIs(first, second)
+        self.assertEqual(compile_expression.cache_info().hits, 1)
+
+
+class TestBatchProcessing(unittest.TestCase):
+    """Test cases for streaming calculation files."""
+
+    def test_sample_file(self):
+        """Test the bundled sample_calculations.txt."""
+        results = list(process_file(os.path.join(ROOT, 'sample_calculations.txt')))
+
+        self.assertEqual([r.value for r in results], [8, 6, 42, 5.0, 4.0, 25.0, 27, 8])
+        self.assertEqual(results[0].line_number, 2)
+        self.assertTrue(all(r.error is None for r in results))
+
+    def test_per_line_errors(self):
+        """Test that a bad line is reported without stopping the batch."""
+        results = list(iter_results(["1 + 1", "", "# note", "1 / 0", "oops", "2 * 2"]))
+
+        self.assertEqual([r.line_number for r in results], [1, 4, 5, 6])
+        self.assertEqual([r.value for r in results], [2, None, None, 4])
+        self.assertIn("Division by zero", results[1].error)
+        self.assertEqual(format_result(results[1]), "line 4: 1 / 0: Division by zero is not allowed")
+        self.assertEqual(format_result(results[3]), "2 * 2 = 4")
+
+    def test_results_are_lazy(self):
+        """Test that lines are consumed only as results are requested."""
+        consumed = []
+
+        def lines():
+            for i in range(1000000):
+                consumed.append(i)
+                yield f"{i} + 1"
+
+        results = iter_results(lines())
+        self.assertEqual(next(results).value, 1)
+        self.assertEqual(next(results).value, 2)
+        self.assertEqual(len(consumed), 2)
+
+    def test_main_batch_command(self):
+        """Test ``main.py batch FILE`` output and exit status."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'calc.txt')
+            with open(path, 'w') as f:
+                f.write("5 + 3\n1 / 0\n")
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                status = main.run_batch(path)
+
+        self.assertEqual(status, 1)
+        self.assertEqual(stdout.getvalue(), "5 + 3 = 8\n")
+        self.assertIn("line 2", stderr.getvalue())
+
+    def test_main_batch_rejects_non_utf8(self):
+        """Test that a non-UTF-8 file is reported on stderr, not raised."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'calc.txt')
+            with open(path, 'wb') as f:
+                f.write(b"5 + 3\n1 \xff 2\n")
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                status = main.run_batch(path)
+
+        self.assertEqual(status, 1)
+        self.assertIn("not valid UTF-8", stderr.getvalue())
+
+
+class TestParallelResults(unittest.TestCase):
+    """Test cases for the process pool batch runner."""
+
+    def setUp(self):
+        self.lines = [f"{i} * 2 + 1\n" if i % 7 else f"{i} / 0\n" for i in range(500)]
+        self.lines[10] = "\n"
+        self.lines[11] = "# comment\n"
+
+    def test_same_results_in_order(self):
+        """Test that small chunks over two workers match the serial results."""
+        expected = list(iter_results(self.lines))
+        results = list(parallel_results(self.lines, workers=2, chunk_size=17, max_pending=3))
+
+        self.assertEqual(results, expected)
+
+    def test_backpressure(self):
+        """Test that reading stops once max_pending chunks are in flight."""
+        consumed = []
+
+        def lines():
+            for i, line in enumerate(self.lines):
+                consumed.append(i)
+                yield line
+
+        results = parallel_results(lines(), workers=2, chunk_size=10, max_pending=2)
+        next(results)
+        self.assertLessEqual(len(consumed), 3 * 10)
+        results.close()
+
+    def test_invalid_settings(self):
+        """Test that non-positive settings raise ValueError."""
+        for kwargs in ({'workers': 0}, {'chunk_size': 0}, {'max_pending': 0}):
+            with self.assertRaises(ValueError):
+                list(parallel_results(self.lines, **kwargs))
+
+    def test_default_workers_use_available_cpus(self):
+        """Test that workers=None follows the CPU affinity, not cpu_count."""
+        with mock.patch('os.cpu_count', return_value=4), \
+                mock.patch('parallel_stats._available_cpus', return_value=1), \
+                mock.patch('batch_calculator.ProcessPoolExecutor') as pool:
+            results = list(parallel_results(self.lines, workers=None))
+
+        pool.assert_not_called()
+        self.assertEqual(results, list(iter_results(self.lines)))
+
+    def test_main_batch_with_workers(self):
+        """Test ``main.py batch FILE -w 2 -o OUT`` and its throughput summary."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'calc.txt')
+            out_path = os.path.join(tmpdir, 'out.txt')
+            with open(path, 'w') as f:
+                f.writelines(self.lines)
+            stderr = io.StringIO()
+            with redirect_stderr(stderr):
+                status = main.run_batch(path, workers=2, chunk_size=50, output=out_path)
+            with open(out_path) as f:
+                written = f.read().splitlines()
+
+        expected = [format_result(r) for r in iter_results(self.lines) if r.error is None]
+        self.assertEqual(status, 1)
+        self.assertEqual(written, expected)
+        self.assertIn("lines/s", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
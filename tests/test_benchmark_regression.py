@@ -0,0 +1,171 @@
+"""
+Unit tests for the benchmark regression gate.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Add the parent directory to the path to import benchmarks.regression
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import regression
+
+SPREAD = (-0.02, -0.01, 0.0, 0.01, 0.02)
+
+
+def entry(function, size, median_ns, reference_ns=1e6):
+    """A suite result entry with five samples around median_ns."""
+    return {'function': function, 'size': size, 'unit': 'values', 'median_ns': median_ns,
+            'samples_ns': [median_ns * (1 + d) for d in SPREAD], 'reference_ns': reference_ns}
+
+
+def results(*entries, python='3.12.0'):
+    return {'schema': 1, 'environment': {'python': python}, 'results': list(entries)}
+
+
+class TestMannWhitney(unittest.TestCase):
+    """Test cases for mann_whitney_u."""
+
+    def test_separated_samples(self):
+        """Test that fully separated samples are significant in one direction only."""
+        u, p_value = regression.mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+        self.assertEqual(u, 25)
+        self.assertAlmostEqual(p_value, 0.0061, places=4)
+        _, p_value = regression.mann_whitney_u([6, 7, 8, 9, 10], [1, 2, 3, 4, 5])
+        self.assertGreater(p_value, 0.99)
+
+    def test_ties(self):
+        """Test mid-ranks and the all-tied case."""
+        self.assertEqual(regression.mann_whitney_u([1, 2, 2], [2, 3, 3])[0], 8.0)
+        self.assertEqual(regression.mann_whitney_u([4, 4, 4], [4, 4, 4]), (4.5, 0.5))
+        with self.assertRaises(ValueError):
+            regression.mann_whitney_u([], [1])
+
+
+class TestCompareResults(unittest.TestCase):
+    """Test cases for compare_results and format_comparison."""
+
+    def setUp(self):
+        self.baseline = results(entry('f', 1000, 1e5), entry('f', 10000, 1e6), entry('g', 1000, 1e5),
+                                entry('g', 10000, 1e6), entry('tiny', 10, 1e3), entry('gone', 10, 1e5))
+
+    def statuses(self, comparison):
+        return {(row['function'], row['size']): row['status'] for row in comparison['comparisons']}
+
+    def test_regression_at_several_sizes_fails(self):
+        """Test that a function slower at two sizes fails the gate."""
+        current = results(entry('f', 1000, 2e5), entry('f', 10000, 2e6), entry('g', 1000, 1e5),
+                          entry('g', 10000, 1.05e6), entry('tiny', 10, 5e3), entry('new', 10, 1e5))
+        comparison = regression.compare_results(self.baseline, current)
+
+        self.assertFalse(comparison['passed'])
+        self.assertEqual(comparison['regressions'], 2)
+        self.assertEqual(self.statuses(comparison), {
+            ('f', 1000): 'regression', ('f', 10000): 'regression', ('g', 1000): 'unchanged',
+            ('g', 10000): 'unchanged', ('tiny', 10): 'below_floor', ('gone', 10): 'missing',
+            ('new', 10): 'new'})
+        self.assertAlmostEqual(comparison['comparisons'][0]['change'], 1.0)
+        lines = regression.format_comparison(comparison)
+        self.assertEqual(len(lines), 3)
+        self.assertIn("f [n=1000]", lines[0])
+        self.assertIn("+100.0%", lines[0])
+        self.assertIn("REGRESSION", lines[0])
+        self.assertTrue(lines[-1].startswith("FAILED: 2 regressions"))
+        self.assertEqual(len(regression.format_comparison(comparison, show_all=True)), 8)
+
+    def test_single_size_is_unconfirmed(self):
+        """Test that a slowdown at one size of several does not fail the gate."""
+        current = results(entry('f', 1000, 2e5), entry('f', 10000, 1e6))
+        comparison = regression.compare_results(self.baseline, current)
+        self.assertTrue(comparison['passed'])
+        self.assertEqual(self.statuses(comparison)[('f', 1000)], 'unconfirmed')
+
+    def test_machine_speed_is_factored_out(self):
+        """Test that a uniformly slower machine is not a regression."""
+        current = results(entry('f', 1000, 1.5e5, 1.5e6), entry('f', 10000, 1.5e6, 1.5e6),
+                          entry('g', 1000, 0.5e5, 1.5e6), entry('g', 10000, 0.5e6, 1.5e6), python='3.13.0')
+        comparison = regression.compare_results(self.baseline, current)
+
+        self.assertTrue(comparison['passed'])
+        self.assertEqual(comparison['improvements'], 2)
+        self.assertAlmostEqual(comparison['comparisons'][0]['machine_factor'], 1.5)
+        self.assertEqual(comparison['warnings'], ["python differs: baseline 3.12.0, current 3.13.0"])
+
+    def test_noise_is_not_significant(self):
+        """Test that overlapping samples are not flagged despite a large median change."""
+        noisy = dict(entry('f', 1000, 1.5e5), samples_ns=[0.9e5, 1.0e5, 1.5e5, 2.0e5, 2.1e5])
+        current = results(noisy, dict(noisy, size=10000, median_ns=1.5e6,
+                                      samples_ns=[0.9e6, 1.0e6, 1.5e6, 2.0e6, 2.1e6]))
+        comparison = regression.compare_results(self.baseline, current)
+        self.assertEqual(comparison['regressions'], 0)
+        self.assertGreater(comparison['comparisons'][0]['p_value'], regression.DEFAULT_ALPHA)
+
+    def test_memory_regression_fails(self):
+        """Test that peak memory growth at a single size fails the gate in the same environment."""
+        def profiled(result, peak_bytes):
+            return dict(result, memory={'peak_bytes': peak_bytes, 'retained_bytes': 0, 'allocations': 10,
+                                        'top_sites': [{'site': 'math_utils.py:10', 'bytes': peak_bytes,
+                                                       'blocks': 10}]})
+
+        baseline = results(profiled(entry('f', 1000, 1e5), 1_000_000), profiled(entry('f', 10000, 1e6), 10_000),
+                           profiled(entry('g', 1000, 1e5), 1_000_000))
+        current = results(profiled(entry('f', 1000, 1e5), 1_500_000), profiled(entry('f', 10000, 1e6), 50_000),
+                          profiled(entry('g', 1000, 1e5), 800_000))
+        comparison = regression.compare_results(baseline, current)
+
+        self.assertFalse(comparison['passed'])
+        self.assertEqual((comparison['regressions'], comparison['memory_regressions']), (0, 1))
+        # Within the absolute slack, and a decrease
+        self.assertEqual([row['memory']['status'] for row in comparison['comparisons']],
+                         ['regression', 'unchanged', 'improvement'])
+        lines = regression.format_comparison(comparison)
+        self.assertEqual(len(lines), 3)
+        self.assertIn("+50.0% peak  MEMORY REGRESSION (math_utils.py:10)", lines[0])
+        self.assertTrue(lines[-1].startswith("FAILED: 0 regressions, 1 memory regressions"))
+        # Advisory only until the baseline is re-recorded in this environment
+        comparison = regression.compare_results(baseline, dict(current, environment={'python': '3.13.0'}))
+        self.assertTrue(comparison['passed'])
+        self.assertEqual(comparison['memory_regressions'], 1)
+        self.assertIn("1 memory regressions (advisory: environment differs)",
+                      regression.format_comparison(comparison)[-1])
+        # Results without memory profiles compare time only
+        self.assertNotIn('memory', regression.compare_results(self.baseline, baseline)['comparisons'][0])
+
+    def test_invalid_settings(self):
+        """Test threshold and alpha validation."""
+        with self.assertRaises(ValueError):
+            regression.compare_results(self.baseline, self.baseline, threshold=-1)
+        with self.assertRaises(ValueError):
+            regression.compare_results(self.baseline, self.baseline, alpha=1)
+
+    def test_main(self):
+        """Test the command line exit status and output."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        paths = {}
+        for name, data in (('baseline', self.baseline),
+                           ('slow', results(entry('f', 1000, 2e5), entry('f', 10000, 2e6))),
+                           ('same', self.baseline), ('bad', {'results': None})):
+            paths[name] = os.path.join(directory.name, f'{name}.json')
+            with open(paths[name], 'w') as f:
+                json.dump(data, f)
+
+        for name, expected in (('same', 0), ('slow', 1), ('bad', 2)):
+            stdout = io.StringIO()
+            with redirect_stdout(stdout), mock.patch('sys.stderr', io.StringIO()):
+                status = regression.main([paths[name], '--baseline', paths['baseline']])
+            self.assertEqual(status, expected, name)
+        self.assertIn("FAILED", regression.format_comparison(regression.check_files(paths['slow'],
+                                                                                    paths['baseline']))[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Unit tests for the benchmark suite harness.
+
+Only tiny sizes are measured, so the tests check the harness (selection,
+deterministic data, statistics, skipping, JSON layout) rather than speed.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stderr
+
+# Add the parent directory to the path to import benchmarks.suite
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+import math_utils
+from benchmarks import suite
+
+
+class TestSuite(unittest.TestCase):
+    """Test cases for benchmarks.suite."""
+
+    def test_select_cases(self):
+        """Test substring and glob filters."""
+        self.assertEqual(len(suite.select_cases()), len(suite.CASES))
+        self.assertEqual([case.name for case in suite.select_cases('OUTLIER_')],
+                         ['outlier_detection', 'outlier_indices'])
+        self.assertEqual([case.name for case in suite.select_cases('*.fit*')],
+                         ['NormalEquationsSolver.fit', 'Normalizer.fit_transform'])
+        self.assertEqual(suite.select_cases('no_such_function'), [])
+
+    def test_data_is_deterministic(self):
+        """Test that the same case and size always give the same data."""
+        case = suite.select_cases('matrix_multiply')[0]
+        first = suite.make_args(case, 100)
+        self.assertEqual(first, suite.make_args(case, 100))
+        self.assertNotEqual(first, suite.make_args(case, 100, seed=1))
+        self.assertEqual((len(first[0]), len(first[0][0])), (10, 10))
+
+    def test_summarize(self):
+        """Test median, quartiles and IQR."""
+        summary = suite.summarize([5, 1, 3, 2, 4])
+        self.assertEqual((summary['median_ns'], summary['q1_ns'], summary['q3_ns']), (3, 2, 4))
+        self.assertEqual((summary['iqr_ns'], summary['min_ns'], summary['max_ns']), (2, 1, 5))
+        self.assertEqual(suite.summarize([7])['iqr_ns'], 0)
+
+    def test_every_case_runs(self):
+        """Test each case at the smallest size."""
+        for case in suite.CASES:
+            with self.subTest(case=case.name):
+                entry, = suite.run_case(case, sizes=[10], repeats=2, warmup=0)
+                self.assertEqual(len(entry['samples_ns']), 2)
+                self.assertGreater(entry['median_ns'], 0)
+                self.assertGreaterEqual(entry['loops'], 1)
+
+    def test_skipping(self):
+        """Test the case size limit and the predicted-time limit."""
+        fib = suite.select_cases('fibonacci')[0]
+        entries = suite.run_case(fib, sizes=[10, 10 ** 6], repeats=1, warmup=0)
+        self.assertIn('above the case limit', entries[1]['skipped'])
+
+        entries = suite.run_case(suite.select_cases('describe')[0], sizes=[100, 10, 1000],
+                                 repeats=1, warmup=0, max_seconds=0)
+        self.assertEqual([entry['size'] for entry in entries], [10, 100, 1000])
+        self.assertNotIn('skipped', entries[0])
+        self.assertIn('predicted', entries[1]['skipped'])
+        self.assertIn('skipped', entries[2])
+
+    def test_profile_memory(self):
+        """Test that the sieve's transient flag list is seen and attributed to math_utils."""
+        small = suite.profile_memory(math_utils.prime_number_generator, (10_000,))
+        large = suite.profile_memory(math_utils.prime_number_generator, (100_000,))
+        self.assertGreater(large['peak_bytes'], 5 * small['peak_bytes'])
+        self.assertGreaterEqual(large['peak_bytes'], large['retained_bytes'])
+        self.assertGreater(large['allocations'], 0)
+        self.assertTrue(large['top_sites'][0]['site'].startswith('math_utils.py:'))
+        self.assertLessEqual(len(large['top_sites']), suite.DEFAULT_TOP_SITES)
+
+        def tracer(frame, event, arg):
+            return None
+
+        previous = sys.gettrace()
+        sys.settrace(tracer)
+        try:
+            suite.profile_memory(math_utils.prime_number_generator, (100,))
+            self.assertIs(sys.gettrace(), tracer)
+        finally:
+            sys.settrace(previous)
+
+        entry, = suite.run_case(suite.select_cases('describe')[0], sizes=[100], repeats=1, warmup=0, memory=True)
+        self.assertEqual(set(entry['memory']), {'peak_bytes', 'retained_bytes', 'allocations', 'top_sites'})
+        self.assertIn("KiB", suite.format_entry(entry))
+
+    def test_run_suite_errors(self):
+        """Test invalid settings."""
+        with self.assertRaises(ValueError):
+            suite.run_suite('no_such_function')
+        with self.assertRaises(ValueError):
+            suite.run_suite('describe', repeats=0)
+
+    def test_main_bench(self):
+        """Test ``main.py --bench`` writing JSON results."""
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        self.addCleanup(os.unlink, path)
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            status = main.main(['--bench', '--filter', 'outlier_*', '--max-size', '100', '--bench-output', path])
+        self.assertEqual(status, 0)
+        with open(path) as f:
+            report = json.load(f)
+
+        self.assertEqual(report['schema'], suite.SCHEMA_VERSION)
+        self.assertIn('python', report['environment'])
+        self.assertEqual([(entry['function'], entry['size']) for entry in report['results']],
+                         [('outlier_detection', 10), ('outlier_detection', 100),
+                          ('outlier_indices', 10), ('outlier_indices', 100)])
+        for entry in report['results']:
+            self.assertLessEqual(entry['q1_ns'], entry['median_ns'])
+            self.assertLessEqual(entry['median_ns'], entry['q3_ns'])
+        self.assertIn("outlier_indices", stderr.getvalue())
+
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(main.main(['--bench', '--filter', 'no_such_function']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
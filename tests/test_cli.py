@@ -0,0 +1,121 @@
+"""
+Unit tests for the main.py subcommands and their start-up cost.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import io
+import re
+import subprocess
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+# Add the parent directory to the path to import math_utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from math_utils import linear_regression, statistical_analysis
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative microseconds of all top-level imports for ``main.py primes``.
+# About 60 ms here even without cached bytecode; the budget leaves room for
+# slow CI machines but fails if something like NumPy creeps back in.
+IMPORT_BUDGET_US = 250_000
+HEAVY_MODULES = ('numpy', 'subprocess', 'code_analysis', 'asyncio', 'concurrent', 'service')
+
+
+def run_main(argv, stdin=''):
+    """Run main.main(argv) with the given stdin; return (status, stdout, stderr)."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with mock.patch('sys.stdin', io.StringIO(stdin)), redirect_stdout(stdout), redirect_stderr(stderr):
+        status = main.main(argv)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+class TestSubcommands(unittest.TestCase):
+    """Test cases for the per-function subcommands."""
+
+    def write(self, text):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as f:
+            f.write(text)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def test_primes_and_fib(self):
+        """Test arguments, stdin input and invalid values."""
+        self.assertEqual(run_main(['primes', '20', '2']), (0, "2 3 5 7 11 13 17 19\n2\n", ""))
+        status, out, err = run_main(['fib'], stdin="5\n\nx\n3\n")
+        self.assertEqual((status, out), (1, "0 1 1 2 3\n0 1 1\n"))
+        self.assertIn("x:", err)
+
+    def test_stats(self):
+        """Test a named column from a file and an indexed column from stdin."""
+        text = "a;b\n1;10\n2;20\n3;30\n4;1000\n"
+        expected = statistical_analysis([10.0, 20.0, 30.0, 1000.0])
+        status, out, _ = run_main(['stats', self.write(text), '--column', 'b', '-d', ';'])
+        self.assertEqual(status, 0)
+        self.assertIn(f"median: {expected['median']}\n", out)
+        self.assertIn(f"std_dev: {expected['std_dev']}\n", out)
+
+        status, out, _ = run_main(['stats', '-', '--header', '--column', '1', '-d', ';'], stdin=text)
+        self.assertIn(f"mean: {expected['mean']}\n", out)
+        self.assertEqual(run_main(['stats', self.write("1\nx\n")])[0], 1)
+
+    def test_matmul(self):
+        """Test matrix files and a dimension mismatch."""
+        a = self.write("1 2\n3 4\n")
+        b = self.write("5, 6\n7, 8\n")
+        self.assertEqual(run_main(['matmul', a, b]), (0, "19.0 22.0\n43.0 50.0\n", ""))
+        status, _, err = run_main(['matmul', a, self.write("1 2 3\n")])
+        self.assertEqual(status, 1)
+        self.assertTrue(err.startswith("Error:"))
+
+    def test_regress_in_chunks(self):
+        """Test that a chunked fit matches linear_regression."""
+        x = list(range(1, 11))
+        y = [2 * v + (v % 3) for v in x]
+        text = "".join(f"{a},{b}\n" for a, b in zip(x, y))
+        stdout = io.StringIO()
+        with mock.patch('sys.stdin', io.StringIO(text)), redirect_stdout(stdout):
+            status = main.run_regress('-', chunk_size=3)
+        out = stdout.getvalue()
+        expected = linear_regression(x, y)
+        self.assertEqual(status, 0)
+        self.assertIn("count: 10\n", out)
+        self.assertIn(f"equation: {expected['equation']}\n", out)
+        self.assertAlmostEqual(float(re.search(r"slope: (\S+)", out).group(1)), expected['slope'])
+
+        with redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(main.run_regress(self.write("1,2\n2\n")), 1)
+        self.assertIn("Line 2", stderr.getvalue())
+
+
+class TestStartup(unittest.TestCase):
+    """Test cases for the cold-start import cost."""
+
+    def test_import_time_budget(self):
+        """Test that a small subcommand skips heavy modules and starts fast."""
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', os.path.join(ROOT, 'main.py'), 'primes', '20'],
+            capture_output=True, text=True, timeout=60)
+        self.assertEqual(completed.returncode, 0)
+        self.assertEqual(completed.stdout, "2 3 5 7 11 13 17 19\n")
+
+        # "import time: self [us] | cumulative | <indent>module"
+        rows = [line.split('|') for line in completed.stderr.splitlines()
+                if line.startswith('import time:') and 'cumulative' not in line]
+        loaded = {row[2].strip() for row in rows}
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, loaded)
+        total = sum(int(row[1]) for row in rows if not row[2].startswith('  '))
+        self.assertLess(total, IMPORT_BUDGET_US)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Unit tests for the code analysis report driver.
+
+The external tools are replaced by a fake ``subprocess.run`` so the tests
+cover scheduling, timeouts, caching and report layout without needing
+flake8 or bandit installed.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+import threading
+import time
+from unittest import mock
+
+# Add the parent directory to the path to import code_analysis
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import code_metrics
+from code_analysis import CodeAnalyzer
+
+TOOL_SECONDS = 0.2
+BRANCHY = "def branchy(x):\n" + "".join(f"    if x == {i}:\n        return {i}\n" for i in range(10))
+
+
+class FakeTools:
+    """Stand-in for subprocess.run: each command sleeps, some time out."""
+
+    def __init__(self, slow=()):
+        self.slow = set(slow)
+        self.commands = []
+        self.lock = threading.Lock()
+
+    def analyzed(self, tool):
+        """Paths passed to the analysis commands of tool (not --version)."""
+        return sorted(path for command in self.commands if command[0] == tool and '--version' not in command
+                      for path in command if path.endswith('.py'))
+
+    def __call__(self, command, timeout=None, **kwargs):
+        with self.lock:
+            self.commands.append(command)
+        tool = command[0]
+        if tool in self.slow:
+            raise subprocess.TimeoutExpired(command, timeout)
+        if '--version' in command:
+            return subprocess.CompletedProcess(command, 0, f"{tool} 1.0\n", '')
+        time.sleep(TOOL_SECONDS)
+        paths = [arg for arg in command if arg.endswith('.py')]
+        if tool == 'flake8':
+            stdout = "".join(f"{path}::1::80::E501::line too long\n" for path in paths)
+        elif tool == 'bandit':
+            stdout = json.dumps({'results': [{'filename': path, 'test_name': 'assert_used',
+                                              'issue_text': 'Use of assert'} for path in paths]})
+        else:
+            stdout = ''
+        return subprocess.CompletedProcess(command, 1 if stdout else 0, stdout, '')
+
+
+class TestGenerateReport(unittest.TestCase):
+    """Test cases for CodeAnalyzer.generate_report."""
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        for path in ('a.py', os.path.join('pkg', 'b.py'), os.path.join('tests', 'test_a.py')):
+            self.write(path, BRANCHY)
+
+    def write(self, path, text):
+        path = os.path.join(self.root.name, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(text)
+
+    def report(self, tools, output_format='text', **kwargs):
+        analyzer = CodeAnalyzer(self.root.name, **kwargs)
+        with mock.patch('code_analysis.subprocess.run', tools), mock.patch('builtins.print'):
+            return analyzer, analyzer.generate_report(output_format)
+
+    def test_tools_run_concurrently(self):
+        """Test that the tool commands take about as long as one."""
+        tools = FakeTools()
+        analyzer, report = self.report(tools, use_cache=False)
+
+        self.assertEqual(sorted(command[0] for command in tools.commands), ['bandit', 'flake8', 'pytest'])
+        self.assertLess(analyzer.timings['total']['seconds'], 3 * TOOL_SECONDS)
+        self.assertEqual(list(analyzer.timings), ['radon', 'flake8', 'bandit', 'pytest', 'perf_lint', 'total'])
+        self.assertIn("PERFORMANCE ANALYSIS", report)
+        self.assertIn("TOOL TIMINGS", report)
+        self.assertIn("a.py, Line 1: E501 line too long", report)
+        self.assertIn("a.py:branchy (Line 1): 11 (C)", report)
+
+    def test_timeout_is_reported(self):
+        """Test that a tool over its timeout is marked and the rest still run."""
+        analyzer, report = self.report(FakeTools(slow={'bandit'}), 'json', timeouts={'bandit': 0.01})
+        data = json.loads(report)
+
+        self.assertEqual(data['timings']['bandit']['status'], 'timeout')
+        self.assertEqual(data['timings']['flake8']['status'], 'ok')
+        self.assertEqual(data['security'], {})
+        self.assertEqual(analyzer.timeouts['flake8'], 60)
+
+    def test_cache_reanalyzes_changed_files_only(self):
+        """Test that unchanged files come from the cache and results merge."""
+        first = json.loads(self.report(FakeTools(), 'json')[1])
+        self.assertEqual(first['cache']['flake8'], {'cached': 0, 'analyzed': 2})
+        self.assertEqual(sorted(first['raw_radon_data']['maintainability_index']),
+                         ['a.py', os.path.join('pkg', 'b.py')])
+
+        self.write('a.py', BRANCHY + "\n")
+        tools = FakeTools()
+        with mock.patch('code_metrics.analyze_file', wraps=code_metrics.analyze_file) as analyze_file:
+            second = json.loads(self.report(tools, 'json')[1])
+        self.assertEqual([call.args[0] for call in analyze_file.call_args_list],
+                         [os.path.join(self.root.name, 'a.py')])
+        for tool in ('radon', 'flake8', 'bandit', 'perf_lint'):
+            self.assertEqual(second['cache'][tool], {'cached': 1, 'analyzed': 1})
+        for tool in ('flake8', 'bandit'):
+            self.assertEqual(tools.analyzed(tool), ['a.py'])
+        self.assertEqual(second['code_style'], first['code_style'])
+        self.assertEqual(len(second['security']['results']), 2)
+        self.assertEqual(second['cyclomatic_complexity'], first['cyclomatic_complexity'])
+
+        tools = FakeTools()
+        self.report(tools, use_cache=False)
+        self.assertEqual(tools.analyzed('flake8'), ['a.py', os.path.join('pkg', 'b.py')])
+
+    def test_benchmark_regressions(self):
+        """Test the benchmark section against the project's baseline."""
+        def results(median_ns):
+            return {'results': [{'function': 'describe', 'size': size, 'median_ns': median_ns * size,
+                                 'samples_ns': [median_ns * size * k for k in (0.98, 0.99, 1, 1.01, 1.02)]}
+                                for size in (1000, 10000)]}
+        self.write(os.path.join('benchmarks', 'baseline.json'), json.dumps(results(100)))
+        self.write('bench.json', json.dumps(results(300)))
+
+        _, report = self.report(FakeTools(), use_cache=False)
+        self.assertIn("No benchmark results given", report)
+        analyzer, report = self.report(FakeTools(), use_cache=False,
+                                       benchmark=os.path.join(self.root.name, 'bench.json'))
+        self.assertIn("PERFORMANCE REGRESSIONS (BENCHMARKS)", report)
+        self.assertIn("describe [n=1000]", report)
+        self.assertIn("FAILED: 2 regressions", report)
+        self.assertFalse(analyzer.regression_results['passed'])
+
+        data = json.loads(self.report(FakeTools(), 'json', use_cache=False, benchmark='missing.json')[1])
+        self.assertIn('error', data['benchmarks'])
+
+
+if __name__ == '__main__':
+    unittest.main()
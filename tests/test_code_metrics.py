@@ -0,0 +1,99 @@
+"""
+Unit tests for the in-process code metrics.
+
+radon is optional, so these check the built-in ``ast`` fallback, which
+follows radon's counting rules.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import textwrap
+
+# Add the parent directory to the path to import code_metrics
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from code_metrics import analyze_source, cc_rank, mi_rank, metrics_version
+
+SOURCE = textwrap.dedent('''\
+    """Module docstring
+    spanning two lines."""
+
+    # A comment on its own line
+    import math
+
+
+    def grade(score, strict=False):
+        if score > 90 and not strict:  # two decision points
+            return 'A'
+        elif score > 80:
+            return 'B'
+        for _ in range(3):
+            pass
+        else:
+            pass
+        return [s for s in (score,) if s]
+
+
+    class Shape:
+        def area(self):
+            return 0
+
+        def scaled(self, k):
+            try:
+                return self.area() * k
+            except TypeError:
+                return None
+    ''')
+
+
+class TestFallbackMetrics(unittest.TestCase):
+    """Test cases for analyze_source without radon."""
+
+    def setUp(self):
+        self.metrics = analyze_source(SOURCE, use_radon=False)
+
+    def test_cyclomatic_complexity(self):
+        """Test per-block complexity and the flattened block order."""
+        blocks = {block['name']: block for block in self.metrics['cc']}
+        self.assertEqual([block['name'] for block in self.metrics['cc']],
+                         ['grade', 'Shape', 'area', 'scaled'])
+        # 1 + if + and + elif + for + for-else + comprehension + its if
+        self.assertEqual(blocks['grade']['complexity'], 8)
+        self.assertEqual(blocks['grade']['rank'], 'B')
+        self.assertEqual(blocks['scaled']['complexity'], 2)
+        self.assertEqual(blocks['scaled']['classname'], 'Shape')
+        self.assertEqual(blocks['Shape']['complexity'], 2)
+        self.assertEqual(len(blocks['Shape']['methods']), 2)
+
+    def test_raw_metrics(self):
+        """Test the line counts add up the way radon's do."""
+        raw = self.metrics['raw']
+        self.assertEqual((raw['loc'], raw['multi'], raw['single_comments'], raw['comments']), (28, 2, 1, 2))
+        self.assertEqual(raw['loc'], raw['sloc'] + raw['blank'] + raw['multi'] + raw['single_comments'])
+        self.assertEqual(raw['blank'], 6)
+
+    def test_maintainability_index(self):
+        """Test that the index is on the 0-100 scale and graded."""
+        mi = self.metrics['mi']
+        self.assertTrue(0 <= mi['mi'] <= 100)
+        self.assertEqual(mi['rank'], mi_rank(mi['mi']))
+        self.assertEqual(analyze_source("", use_radon=False)['mi']['mi'], 100.0)
+
+    def test_syntax_error(self):
+        """Test that unparsable code is reported like radon does."""
+        metrics = analyze_source("def broken(:\n", 'broken.py', use_radon=False)
+        self.assertIn('error', metrics['cc'])
+        self.assertEqual(metrics['cc'], metrics['raw'])
+
+    def test_ranks_and_version(self):
+        """Test rank boundaries and the cache-key version string."""
+        self.assertEqual([cc_rank(c) for c in (5, 6, 11, 21, 31, 41)], ['A', 'B', 'C', 'D', 'E', 'F'])
+        self.assertEqual([mi_rank(s) for s in (20, 10, 9)], ['A', 'B', 'C'])
+        self.assertIn('fallback', metrics_version(use_radon=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Empirical complexity tests for the hot math_utils functions.
+
+Each case in ``benchmarks.complexity.CASES`` is timed at geometrically
+increasing sizes and the fitted log-log slope must stay within
+``DEFAULT_TOLERANCE`` of its model's slope. These catch algorithmic
+regressions (a per-element pass turned quadratic, a sort where a
+selection used to be) that correctness tests can't see.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import math
+
+# Add the parent directory to the path to import benchmarks.complexity
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import complexity
+
+
+def quadratic_pairs(data):
+    """Deliberately O(n**2): count pairs in increasing order."""
+    return sum(1 for a in data for b in data if a < b)
+
+
+class TestFitting(unittest.TestCase):
+    """Test cases for the slope fitting helpers."""
+
+    def test_fit_slope(self):
+        """Test exact power laws and invalid input."""
+        sizes = complexity.geometric_sizes(10, 2, 6)
+        self.assertEqual(sizes, [10, 20, 40, 80, 160, 320])
+        self.assertAlmostEqual(complexity.fit_slope(sizes, [3 * n ** 2 for n in sizes]), 2.0)
+        self.assertAlmostEqual(complexity.model_slope(complexity.cubic, sizes), 3.0)
+        self.assertAlmostEqual(complexity.model_slope(complexity.linear, sizes), 1.0)
+        self.assertGreater(complexity.model_slope(complexity.n_log_n, sizes), 1.1)
+        for sizes, times in (([10], [1]), ([10, 10], [1, 2]), ([10, 20], [1]), ([0, 10], [1, 2])):
+            with self.assertRaises(ValueError):
+                complexity.fit_slope(sizes, times)
+
+    def test_quadratic_is_detected(self):
+        """Test that the measurement tells a quadratic function from a linear one."""
+        sizes = complexity.geometric_sizes(50, 2, 4)
+        times = complexity.scaling_times(quadratic_pairs, lambda rng, n: ([rng.random() for _ in range(n)],),
+                                         sizes, repeats=3)
+        self.assertGreater(complexity.fit_slope(sizes, times), 1.6)
+
+
+class TestEmpiricalComplexity(unittest.TestCase):
+    """Fitted slopes of the hot functions against their expected growth."""
+
+    def assertScaling(self, case):
+        """
+        Fail if the case's fitted slope is off by more than the tolerance.
+
+        A miss is measured once more before failing: noise rarely strikes
+        twice, a real change in complexity does.
+        """
+        for _ in range(2):
+            fitted, expected = complexity.case_slopes(case)
+            if math.isclose(fitted, expected, abs_tol=complexity.DEFAULT_TOLERANCE):
+                return
+        self.fail(f"{case.name}: log-log slope {fitted:.2f} over sizes {case.sizes}, "
+                  f"expected {expected:.2f} ({case.label})")
+
+    def test_hot_functions(self):
+        """Test every case in benchmarks.complexity.CASES."""
+        for case in complexity.CASES:
+            with self.subTest(case=case.name):
+                self.assertScaling(case)
+
+
+if __name__ == '__main__':
+    unittest.main()
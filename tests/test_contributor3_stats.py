@@ -11,11 +11,22 @@ import unittest
 import sys
 import os
 import math
+import random
+from unittest import mock
 
 # Add the parent directory to the path to import math_utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from math_utils import statistical_analysis, linear_regression, data_normalization, outlier_detection
+from math_utils import (statistical_analysis, linear_regression, data_normalization, outlier_detection,
+                        OnlineLinearRegression, linear_regression_many,
+                        multiple_linear_regression, NormalEquationsSolver, Normalizer,
+                        outlier_indices, StreamingOutlierDetector, Dataset, describe)
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestStatisticalAnalysis(unittest.TestCase):
@@ -166,6 +177,235 @@ class TestLinearRegression(unittest.TestCase):
         self.assertIn("must be lists", str(context.exception))
 
 
+class TestOnlineLinearRegression(unittest.TestCase):
+    """Test cases for the OnlineLinearRegression accumulator."""
+    
+    def test_matches_linear_regression(self):
+        """Test that a single update matches linear_regression."""
+        x_data = [1.5, 2.0, 3.7, 4.1, 5.9, 7.3]
+        y_data = [2.1, 3.9, 6.2, 8.8, 9.7, 15.0]
+        expected = linear_regression(x_data, y_data)
+        result = OnlineLinearRegression().update(x_data, y_data).result()
+        
+        for key in ('slope', 'intercept', 'r_squared', 'correlation'):
+            self.assertAlmostEqual(result[key], expected[key], places=10)
+        self.assertEqual(result['equation'], expected['equation'])
+    
+    def test_chunked_updates(self):
+        """Test that chunked updates give the same fit as one update."""
+        x_data = list(range(20))
+        y_data = [3 * x - 7 + (x % 3) for x in x_data]
+        expected = linear_regression(x_data, y_data)
+        
+        model = OnlineLinearRegression()
+        for start in range(0, 20, 7):
+            model.update(x_data[start:start + 7], y_data[start:start + 7])
+        
+        self.assertEqual(model.n, 20)
+        self.assertAlmostEqual(model.slope, expected['slope'], places=10)
+        self.assertAlmostEqual(model.intercept, expected['intercept'], places=10)
+        self.assertAlmostEqual(model.r_squared, expected['r_squared'], places=10)
+    
+    def test_merge_shards(self):
+        """Test that merging shards matches fitting on all the data."""
+        left = OnlineLinearRegression().update([1, 2, 3], [10, 8, 6])
+        right = OnlineLinearRegression().update([4, 5], [4, 2])
+        merged = left.merge(right)
+        
+        self.assertAlmostEqual(merged.slope, -2.0)
+        self.assertAlmostEqual(merged.intercept, 12.0)
+        self.assertAlmostEqual(merged.correlation, -1.0)
+    
+    def test_merge_empty(self):
+        """Test that merging with an empty regressor is a no-op."""
+        model = OnlineLinearRegression().update([1, 2, 3], [2, 4, 6])
+        model.merge(OnlineLinearRegression())
+        merged = OnlineLinearRegression().merge(model)
+        
+        self.assertEqual(merged.n, 3)
+        self.assertAlmostEqual(merged.slope, 2.0)
+    
+    def test_no_correlation(self):
+        """Test that constant y gives zero R-squared and correlation."""
+        model = OnlineLinearRegression().update([1, 2, 3, 4, 5], [5, 5, 5, 5, 5])
+        
+        self.assertEqual(model.slope, 0.0)
+        self.assertEqual(model.r_squared, 0.0)
+        self.assertEqual(model.correlation, 0.0)
+    
+    def test_empty_error(self):
+        """Test that querying an empty regressor raises ValueError."""
+        with self.assertRaises(ValueError) as context:
+            OnlineLinearRegression().slope
+        self.assertIn("Data cannot be empty", str(context.exception))
+    
+    def test_no_variance_error(self):
+        """Test that x without variance raises ValueError."""
+        model = OnlineLinearRegression().update([1, 1, 1], [1, 2, 3])
+        with self.assertRaises(ValueError) as context:
+            model.result()
+        self.assertIn("x_data has no variance", str(context.exception))
+    
+    def test_invalid_input_errors(self):
+        """Test mismatched lengths, non-numeric values and bad merges."""
+        model = OnlineLinearRegression()
+        with self.assertRaises(ValueError):
+            model.update([1, 2, 3], [1, 2])
+        with self.assertRaises(TypeError):
+            model.update([1, "2"], [1, 2])
+        with self.assertRaises(TypeError):
+            model.merge([1, 2])
+
+
+class TestLinearRegressionMany(unittest.TestCase):
+    """Test cases for the linear_regression_many batch function."""
+    
+    X_BATCH = [[1, 2, 3, 4, 5], [1, 2, 3, 4, 5], [1.5, 2.5, 3.5, 4.5, 6.0]]
+    Y_BATCH = [[2, 4, 6, 8, 10], [5, 5, 5, 5, 5], [3.1, 4.8, 7.2, 9.1, 11.5]]
+    
+    def test_matches_linear_regression(self):
+        """Test that every column entry matches a single fit."""
+        result = linear_regression_many(self.X_BATCH, self.Y_BATCH)
+        
+        for i, (x_data, y_data) in enumerate(zip(self.X_BATCH, self.Y_BATCH)):
+            expected = linear_regression(x_data, y_data)
+            for key in ('slope', 'intercept', 'r_squared', 'correlation'):
+                self.assertAlmostEqual(result[key][i], expected[key], places=10)
+        self.assertNotIn('equation', result)
+    
+    def test_equations_on_request(self):
+        """Test that equation strings are only built when requested."""
+        result = linear_regression_many(self.X_BATCH, self.Y_BATCH, equations=True)
+        
+        self.assertEqual(result['equation'][0], "y = 2.0000x + 0.0000")
+        self.assertEqual(len(result['equation']), 3)
+    
+    def test_ragged_batch(self):
+        """Test series of different lengths in one batch."""
+        result = linear_regression_many([[1, 2, 3], [1, 2]], [[1, 2, 3], [4, 2]])
+        
+        self.assertAlmostEqual(result['slope'][0], 1.0)
+        self.assertAlmostEqual(result['slope'][1], -2.0)
+    
+    def test_empty_batch(self):
+        """Test that an empty batch gives empty columns."""
+        result = linear_regression_many([], [])
+        
+        self.assertEqual(len(result['slope']), 0)
+    
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_numpy_arrays(self):
+        """Test 2-D NumPy input on the vectorized path."""
+        x = numpy.array(self.X_BATCH[:2], dtype=float)
+        y = numpy.array(self.Y_BATCH[:2], dtype=float)
+        result = linear_regression_many(x, y)
+        
+        numpy.testing.assert_allclose(result['slope'], [2.0, 0.0])
+        numpy.testing.assert_allclose(result['r_squared'], [1.0, 0.0])
+    
+    def test_same_types_on_both_paths(self):
+        """Test that the vectorized and pure-Python paths return lists of floats."""
+        vectorized = linear_regression_many(self.X_BATCH, self.Y_BATCH)
+        with mock.patch('math_utils._get_numpy', return_value=None):
+            pure = linear_regression_many(self.X_BATCH, self.Y_BATCH)
+        
+        for key in ('slope', 'intercept', 'r_squared', 'correlation'):
+            for result in (vectorized, pure):
+                self.assertIs(type(result[key]), list)
+                self.assertTrue(all(type(value) is float for value in result[key]))
+    
+    def test_no_variance_error(self):
+        """Test that the offending series is named in the error."""
+        with self.assertRaises(ValueError) as context:
+            linear_regression_many([[1, 2], [3, 3]], [[1, 2], [1, 2]])
+        self.assertIn("series 1 has no variance", str(context.exception))
+    
+    def test_invalid_input_errors(self):
+        """Test batch size mismatch, bad series and non-numeric values."""
+        with self.assertRaises(ValueError):
+            linear_regression_many([[1, 2]], [])
+        with self.assertRaises(ValueError):
+            linear_regression_many([[1, 2, 3]], [[1, 2]])
+        with self.assertRaises(ValueError):
+            linear_regression_many([[]], [[]])
+        with self.assertRaises(TypeError):
+            linear_regression_many([[1, "2"]], [[1, 2]])
+        with self.assertRaises(TypeError):
+            linear_regression_many(5, [[1, 2]])
+
+
+class TestMultipleLinearRegression(unittest.TestCase):
+    """Test cases for multiple_linear_regression and NormalEquationsSolver."""
+    
+    X_DATA = [[1, 2], [2, 1], [3, 5], [4, 3], [5, 8], [6, 2]]
+    
+    def test_exact_fit(self):
+        """Test recovery of an exact linear relationship."""
+        y_data = [4 + 2 * a - 3 * b for a, b in self.X_DATA]
+        result = multiple_linear_regression(self.X_DATA, y_data)
+        
+        self.assertAlmostEqual(result['intercept'], 4.0, places=8)
+        self.assertAlmostEqual(result['coefficients'][0], 2.0, places=8)
+        self.assertAlmostEqual(result['coefficients'][1], -3.0, places=8)
+        self.assertAlmostEqual(result['r_squared'], 1.0, places=10)
+    
+    def test_matches_simple_regression(self):
+        """Test that one predictor agrees with linear_regression."""
+        x_data = [1.5, 2.0, 3.7, 4.1, 5.9]
+        y_data = [2.1, 3.9, 6.2, 8.8, 9.7]
+        expected = linear_regression(x_data, y_data)
+        result = multiple_linear_regression([[x] for x in x_data], y_data)
+        
+        self.assertAlmostEqual(result['coefficients'][0], expected['slope'], places=10)
+        self.assertAlmostEqual(result['intercept'], expected['intercept'], places=10)
+        self.assertAlmostEqual(result['r_squared'], expected['r_squared'], places=10)
+    
+    def test_cached_and_uncached_agree(self):
+        """Test that the cached factorization gives the same answer."""
+        y_data = [1.0, -2.0, 0.5, 3.0, 2.5, -1.0]
+        cached = multiple_linear_regression(self.X_DATA, y_data)
+        fresh = multiple_linear_regression(self.X_DATA, y_data, use_cache=False)
+        
+        self.assertEqual(cached, fresh)
+    
+    def test_solver_reuse(self):
+        """Test solving several responses with one factorization."""
+        solver = NormalEquationsSolver(self.X_DATA, fit_intercept=False)
+        
+        for a, b in [(1, 1), (2, -1), (0, 5)]:
+            beta = solver.solve([a * x1 + b * x2 for x1, x2 in self.X_DATA])
+            self.assertAlmostEqual(beta[0], a, places=8)
+            self.assertAlmostEqual(beta[1], b, places=8)
+    
+    def test_solver_validates(self):
+        """Test that the solver checks values itself when used directly."""
+        with self.assertRaises(TypeError) as context:
+            NormalEquationsSolver([[1, 2], [2, 'x'], [3, 1]])
+        self.assertIn("numeric", str(context.exception))
+        solver = NormalEquationsSolver(self.X_DATA)
+        with self.assertRaises(TypeError):
+            solver.solve([1, 2, 3, 4, 5, None])
+    
+    def test_collinear_error(self):
+        """Test that collinear predictors raise ValueError."""
+        with self.assertRaises(ValueError) as context:
+            multiple_linear_regression([[1, 2], [2, 4], [3, 6]], [1, 2, 3])
+        self.assertIn("collinear", str(context.exception))
+    
+    def test_invalid_input_errors(self):
+        """Test empty, ragged, mismatched and non-numeric inputs."""
+        with self.assertRaises(ValueError):
+            multiple_linear_regression([], [])
+        with self.assertRaises(ValueError):
+            multiple_linear_regression([[1, 2], [3]], [1, 2])
+        with self.assertRaises(ValueError):
+            multiple_linear_regression(self.X_DATA, [1, 2, 3])
+        with self.assertRaises(TypeError):
+            multiple_linear_regression("not a list", [1, 2])
+        with self.assertRaises(TypeError):
+            multiple_linear_regression([[1, "x"], [2, 3], [4, 1]], [1, 2, 3])
+
+
 class TestDataNormalization(unittest.TestCase):
     """Test cases for the data_normalization function."""
     
@@ -240,6 +480,90 @@ class TestDataNormalization(unittest.TestCase):
         self.assertIn("Data must be a list", str(context.exception))
 
 
+class TestNormalizer(unittest.TestCase):
+    """Test cases for the Normalizer fit/transform object."""
+    
+    DATA = [3.0, 7.5, 1.0, 9.0, 4.5, 6.0]
+    
+    def test_matches_data_normalization(self):
+        """Test that fit + transform reproduces data_normalization."""
+        for method in ('z_score', 'min_max'):
+            result = Normalizer(method).fit_transform(self.DATA)
+            self.assertEqual(result, data_normalization(self.DATA, method))
+    
+    def test_partial_fit(self):
+        """Test that streamed batches fit the same statistics."""
+        normalizer = Normalizer()
+        normalizer.partial_fit(self.DATA[:2]).partial_fit([]).partial_fit(self.DATA[2:])
+        expected = data_normalization(self.DATA)
+        
+        self.assertEqual(normalizer.count, 6)
+        for actual, value in zip(normalizer.transform(self.DATA), expected):
+            self.assertAlmostEqual(actual, value, places=12)
+    
+    def test_transform_new_batches(self):
+        """Test applying reference statistics to other data."""
+        normalizer = Normalizer('min_max').fit([10, 20, 30])
+        
+        self.assertEqual(normalizer.transform([15, 30, 40]), [0.25, 1.0, 1.5])
+        self.assertEqual(list(normalizer.iter_transform(iter([10, 20]))), [0.0, 0.5])
+    
+    def test_refit_discards_statistics(self):
+        """Test that fit() starts from scratch."""
+        normalizer = Normalizer('min_max').fit([0, 100])
+        normalizer.fit([10, 20])
+        
+        self.assertEqual(normalizer.transform([15]), [0.5])
+    
+    def test_in_place_and_out_buffer(self):
+        """Test writing into array('d') buffers."""
+        normalizer = Normalizer('min_max').fit([0, 4])
+        buffer = array('d', [1, 2, 4])
+        out = array('d', [0, 0, 0])
+        
+        self.assertIs(normalizer.transform(buffer, out=out), out)
+        self.assertEqual(list(out), [0.25, 0.5, 1.0])
+        normalizer.transform(buffer, in_place=True)
+        self.assertEqual(list(buffer), [0.25, 0.5, 1.0])
+    
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_numpy_buffers(self):
+        """Test NumPy input, output and in-place transforms."""
+        values = numpy.array(self.DATA)
+        normalizer = Normalizer().fit(values)
+        out = numpy.empty_like(values)
+        
+        normalizer.transform(values, out=out)
+        numpy.testing.assert_allclose(out, data_normalization(self.DATA))
+        normalizer.transform(values, in_place=True)
+        numpy.testing.assert_allclose(values, out)
+        with self.assertRaises(ValueError) as context:
+            normalizer.transform(numpy.array([1, 2, 3]), in_place=True)
+        self.assertIn("int", str(context.exception))
+    
+    def test_errors(self):
+        """Test invalid method, unfitted use, no variance and bad input."""
+        with self.assertRaises(ValueError):
+            Normalizer('invalid_method')
+        with self.assertRaises(ValueError) as context:
+            Normalizer().transform([1, 2])
+        self.assertIn("not been fitted", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            Normalizer().fit([5, 5, 5]).transform([5])
+        self.assertIn("no variance", str(context.exception))
+        with self.assertRaises(ValueError):
+            Normalizer().fit([1, 2]).transform([1, 2], out=[0.0])
+        with self.assertRaises(TypeError):
+            Normalizer().fit([1, "2"])
+        with self.assertRaises(TypeError):
+            Normalizer().fit("not a list")
+        # Raised by the call itself, not by the first next()
+        with self.assertRaises(ValueError):
+            Normalizer().iter_transform([1, 2])
+        with self.assertRaises(ValueError):
+            Normalizer().fit([0, 4]).transform(array('i', [1, 2]), in_place=True)
+
+
 class TestOutlierDetection(unittest.TestCase):
     """Test cases for the outlier_detection function."""
     
@@ -308,6 +632,267 @@ class TestOutlierDetection(unittest.TestCase):
         with self.assertRaises(TypeError) as context:
             outlier_detection("not a list", 'iqr')
         self.assertIn("Data must be a list", str(context.exception))
+    
+    def test_iqr_matches_sorted_quartiles(self):
+        """Test selection-based quartiles against the sorted definition."""
+        rng = random.Random(5)
+        for n in (4, 5, 8, 37, 400):
+            data = [rng.gauss(0, 1) for _ in range(n)] + [rng.choice([-9.0, 9.0])]
+            sorted_data = sorted(data)
+            size = len(data)
+            if size % 4 == 0:
+                q1 = sorted_data[size // 4 - 1]
+                q3 = sorted_data[3 * size // 4 - 1]
+            else:
+                q1 = sorted_data[size // 4]
+                q3 = sorted_data[3 * size // 4]
+            iqr = q3 - q1
+            expected = [x for x in data if x < q1 - 1.5 * iqr or x > q3 + 1.5 * iqr]
+            self.assertEqual(outlier_detection(data, 'iqr'), expected)
+    
+    def test_mad_method(self):
+        """Test the median absolute deviation method."""
+        data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 100]
+        
+        self.assertEqual(outlier_detection(data, 'mad'), [100])
+        self.assertEqual(outlier_detection([5, 5, 5, 9], 'mad'), [])  # MAD is 0
+
+
+class TestOutlierIndices(unittest.TestCase):
+    """Test cases for the outlier_indices function."""
+    
+    DATA = [12, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 100, -60]
+    
+    def test_indices_match_values(self):
+        """Test that indices select exactly the outlier_detection values."""
+        for method in ('iqr', 'z_score', 'mad'):
+            indices = outlier_indices(self.DATA, method)
+            self.assertEqual([self.DATA[i] for i in indices], outlier_detection(self.DATA, method))
+        self.assertEqual(outlier_indices(self.DATA, 'iqr'), [11, 12])
+    
+    def test_mask(self):
+        """Test the boolean mask variant."""
+        mask = outlier_indices(self.DATA, 'iqr', mask=True)
+        
+        self.assertEqual(len(mask), len(self.DATA))
+        self.assertEqual([i for i, flag in enumerate(mask) if flag], [11, 12])
+    
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_numpy_input(self):
+        """Test that NumPy arrays give the same positions as lists."""
+        rng = random.Random(6)
+        data = [rng.gauss(0, 1) for _ in range(500)] + [8.0, -7.5]
+        for method in ('iqr', 'z_score', 'mad'):
+            self.assertEqual(outlier_indices(numpy.array(data), method), outlier_indices(data, method))
+    
+    def test_errors(self):
+        """Test invalid input and method."""
+        with self.assertRaises(ValueError):
+            outlier_indices([], 'iqr')
+        with self.assertRaises(ValueError):
+            outlier_indices([1, 2], 'invalid_method')
+        with self.assertRaises(TypeError):
+            outlier_indices([1, "2"], 'iqr')
+        with self.assertRaises(TypeError):
+            outlier_indices("not a list")
+
+
+class TestStreamingOutlierDetector(unittest.TestCase):
+    """Test cases for the StreamingOutlierDetector class."""
+    
+    def test_flags_spikes_across_batches(self):
+        """Test that positions continue across update() calls."""
+        detector = StreamingOutlierDetector(min_count=5)
+        
+        self.assertEqual(detector.update([10, 11, 9, 10, 11, 10, 95]), [6])
+        self.assertEqual(detector.update([10, -200, 11]), [1 + 7])
+        self.assertEqual(detector.count, 10)
+    
+    def test_running_moments(self):
+        """Test that the running moments match the batch statistics."""
+        data = [3.5, 1.0, 4.0, 1.5, 5.0, 9.0, 2.5]
+        detector = StreamingOutlierDetector()
+        detector.update(data[:3])
+        detector.update(data[3:])
+        expected = statistical_analysis(data)
+        
+        self.assertAlmostEqual(detector.mean, expected['mean'], places=12)
+        self.assertAlmostEqual(detector.std_dev, expected['std_dev'], places=12)
+    
+    def test_warmup_and_constant_stream(self):
+        """Test that nothing is flagged before min_count or without variance."""
+        detector = StreamingOutlierDetector(min_count=3)
+        
+        self.assertEqual(detector.update([1, 1000]), [])
+        self.assertEqual(StreamingOutlierDetector().update([5, 5, 5, 5]), [])
+    
+    def test_errors(self):
+        """Test invalid threshold and non-numeric values."""
+        with self.assertRaises(ValueError):
+            StreamingOutlierDetector(threshold=0)
+        with self.assertRaises(TypeError):
+            StreamingOutlierDetector().update([1, "x"])
+
+
+class TestDataset(unittest.TestCase):
+    """Test cases for the Dataset class."""
+    
+    def setUp(self):
+        rng = random.Random(3)
+        self.values = [round(rng.gauss(20, 4), 1) for _ in range(200)] + [90.0, -50.0]
+    
+    def test_matches_list_functions(self):
+        """Test that every statistics function gives the list result."""
+        ds = Dataset(list(self.values))
+        
+        expected = statistical_analysis(self.values)
+        result = statistical_analysis(ds)
+        for key in ('median', 'mode', 'count', 'min', 'max'):
+            self.assertEqual(result[key], expected[key])
+        self.assertAlmostEqual(result['mean'], expected['mean'], places=10)
+        self.assertAlmostEqual(result['std_dev'], expected['std_dev'], places=10)
+        for method in ('iqr', 'z_score', 'mad'):
+            self.assertEqual(outlier_detection(ds, method), outlier_detection(self.values, method))
+            self.assertEqual(outlier_indices(ds, method), outlier_indices(self.values, method))
+        for method in ('z_score', 'min_max'):
+            for a, b in zip(data_normalization(ds, method), data_normalization(self.values, method)):
+                self.assertAlmostEqual(a, b, places=10)
+        x = list(range(len(self.values)))
+        self.assertEqual(linear_regression(x, ds), linear_regression(x, self.values))
+    
+    def test_sorts_once(self):
+        """Test that the sort is shared by median, quartiles and extremes."""
+        ds = Dataset(list(self.values))
+        with mock.patch('builtins.sorted', wraps=sorted) as sorted_spy:
+            statistical_analysis(ds)
+            outlier_detection(ds, 'iqr')
+            outlier_detection(ds, 'mad')
+            data_normalization(ds, 'min_max')
+        
+        # The MAD method also sorts its deviations; only count sorts of the values
+        value_sorts = [c for c in sorted_spy.call_args_list if c.args[0] == ds.values]
+        self.assertEqual(len(value_sorts), 1)
+    
+    def test_mutation_invalidates(self):
+        """Test that append and extend drop memoized results."""
+        ds = Dataset([1, 2, 3])
+        self.assertEqual(statistical_analysis(ds)['max'], 3)
+        
+        ds.append(10)
+        self.assertEqual(statistical_analysis(ds)['max'], 10)
+        self.assertEqual(statistical_analysis(ds)['median'], 2.5)
+        ds.extend([20, 30])
+        self.assertEqual(ds.median(), 6.5)
+        self.assertEqual(len(ds), 6)
+        
+        # values is a copy, so it can't bypass the invalidation
+        ds.values.append(1000)
+        self.assertEqual(statistical_analysis(ds)['max'], 30)
+    
+    def test_parallel_is_forwarded(self):
+        """Test that parallel and workers reach the sharded path for a Dataset."""
+        ds = Dataset(list(self.values))
+        with mock.patch('parallel_stats.parallel_statistical_analysis',
+                        return_value={'count': len(self.values)}) as parallel:
+            self.assertEqual(statistical_analysis(ds, workers=3), {'count': len(self.values)})
+        parallel.assert_called_once_with(self.values, 3)
+        with self.assertRaises(ValueError):
+            statistical_analysis(Dataset([]), parallel=True)
+    
+    def test_normalizer_fit(self):
+        """Test that Normalizer accepts a Dataset."""
+        ds = Dataset(list(self.values))
+        normalizer = Normalizer('z_score').fit(ds)
+        
+        for a, b in zip(normalizer.transform(ds), data_normalization(self.values, 'z_score')):
+            self.assertAlmostEqual(a, b, places=10)
+        with self.assertRaises(TypeError):
+            normalizer.transform(ds, in_place=True)
+    
+    def test_errors(self):
+        """Test invalid construction, values, methods and empty datasets."""
+        with self.assertRaises(TypeError):
+            Dataset((1, 2))
+        with self.assertRaises(TypeError):
+            Dataset([1, "a"])
+        ds = Dataset([1, 2])
+        with self.assertRaises(TypeError):
+            ds.append(None)
+        self.assertEqual(len(ds), 2)
+        with self.assertRaises(ValueError):
+            outlier_detection(ds, 'bogus')
+        with self.assertRaises(ValueError):
+            data_normalization(ds, 'bogus')
+        for func in (statistical_analysis, outlier_detection, data_normalization):
+            with self.assertRaises(ValueError) as context:
+                func(Dataset([]))
+            self.assertIn("Data cannot be empty", str(context.exception))
+
+
+class TestDescribe(unittest.TestCase):
+    """Test cases for the describe function."""
+    
+    def setUp(self):
+        rng = random.Random(5)
+        self.values = [rng.gauss(0, 1) for _ in range(500)] + [40.0, -35.0, 4.5]
+    
+    def test_matches_individual_calls(self):
+        """Test that every result equals the corresponding function call."""
+        result = describe(self.values, ('iqr', 'z_score', 'mad'))
+        
+        expected = statistical_analysis(self.values)
+        for key in ('median', 'mode', 'count', 'min', 'max'):
+            self.assertEqual(result['statistics'][key], expected[key])
+        self.assertEqual(result['statistics']['mean'], expected['mean'])
+        self.assertEqual(result['statistics']['std_dev'], expected['std_dev'])
+        for method in ('iqr', 'z_score', 'mad'):
+            self.assertEqual(result['outliers'][method], outlier_detection(self.values, method))
+        for method in ('z_score', 'min_max'):
+            for a, b in zip(result['normalized'][method], data_normalization(self.values, method)):
+                self.assertAlmostEqual(a, b, places=10)
+    
+    def test_large_offset(self):
+        """Test that mean and std_dev equal statistical_analysis's far from zero."""
+        values = [1e12 + x for x in self.values]
+        result = describe(values, normalize_methods=())['statistics']
+        expected = statistical_analysis(values)
+        self.assertEqual((result['mean'], result['std_dev']), (expected['mean'], expected['std_dev']))
+    
+    def test_fewer_passes(self):
+        """Test that describe scans the data at most seven times."""
+        class CountingList(list):
+            passes = 0
+            
+            def __iter__(self):
+                CountingList.passes += 1
+                return super().__iter__()
+        
+        describe(CountingList(self.values))
+        self.assertLessEqual(CountingList.passes, 7)
+    
+    def test_selected_methods(self):
+        """Test skipping outputs, Dataset input and constant data."""
+        result = describe(Dataset([5, 5, 5, 5]), ('z_score',), ())
+        
+        self.assertEqual(result['outliers'], {'z_score': []})
+        self.assertEqual(result['normalized'], {})
+        self.assertEqual(result['statistics']['mode'], 5)
+    
+    def test_errors(self):
+        """Test invalid input and methods."""
+        with self.assertRaises(TypeError):
+            describe((1, 2, 3))
+        with self.assertRaises(TypeError):
+            describe([1, "2", 3])
+        with self.assertRaises(ValueError):
+            describe([])
+        with self.assertRaises(ValueError):
+            describe([1, 2, 3], outlier_methods=('bogus',))
+        with self.assertRaises(ValueError):
+            describe([1, 2, 3], normalize_methods=('bogus',))
+        with self.assertRaises(ValueError) as context:
+            describe([2, 2, 2])
+        self.assertIn("no variance", str(context.exception))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,222 @@
+"""
+Unit tests for the out-of-core data loader.
+
+Checks that memory-mapped float64 files and chunked CSV columns give the
+same statistics as the in-memory functions on equivalent lists.
+
+@author: Contributor 3
+"""
+
+import unittest
+import sys
+import os
+import math
+import random
+import tempfile
+from array import array
+from unittest import mock
+
+# Add the parent directory to the path to import math_utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader
+from data_loader import Float64File, CsvColumn, streaming_select
+from math_utils import statistical_analysis, outlier_detection
+
+
+class DataFileTestCase(unittest.TestCase):
+    """Base class providing a temporary directory for data files."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write_float64(self, values, name='data.f64'):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, 'wb') as f:
+            array('d', values).tofile(f)
+        return path
+
+    def write_text(self, text, name='data.csv'):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, 'w', newline='') as f:
+            f.write(text)
+        return path
+
+
+class TestFloat64File(DataFileTestCase):
+    """Test cases for the memory-mapped float64 source."""
+
+    def test_zero_copy_chunks(self):
+        """Test that chunks are views over the mapped file."""
+        path = self.write_float64(range(10))
+        with Float64File(path, chunk_size=4) as source:
+            chunks = list(source.iter_chunks())
+
+            self.assertEqual(len(source), 10)
+            self.assertEqual([len(c) for c in chunks], [4, 4, 2])
+            self.assertIsInstance(chunks[0], memoryview)
+            self.assertEqual(chunks[2].tolist(), [8.0, 9.0])
+            for chunk in chunks:
+                chunk.release()
+
+    def test_statistics_match_in_memory(self):
+        """Test statistical_analysis on a mapped file against a list."""
+        rng = random.Random(1)
+        values = [rng.gauss(50, 10) for _ in range(1001)]
+        path = self.write_float64(values)
+        expected = statistical_analysis(values)
+
+        with Float64File(path, chunk_size=97) as source:
+            result = statistical_analysis(source)
+
+        self.assertEqual(result['count'], expected['count'])
+        self.assertEqual(result['median'], expected['median'])
+        self.assertEqual(result['min'], expected['min'])
+        self.assertEqual(result['max'], expected['max'])
+        self.assertIsNone(result['mode'])
+        self.assertAlmostEqual(result['mean'], expected['mean'], places=9)
+        self.assertAlmostEqual(result['std_dev'], expected['std_dev'], places=9)
+
+    def test_outliers_match_in_memory(self):
+        """Test outlier_detection on a mapped file against a list."""
+        values = [float(x) for x in range(1, 11)] + [100.0, -80.0]
+        path = self.write_float64(values)
+
+        with Float64File(path, chunk_size=5) as source:
+            self.assertEqual(outlier_detection(source, 'iqr'), outlier_detection(values, 'iqr'))
+            self.assertEqual(outlier_detection(source, 'z_score'), outlier_detection(values, 'z_score'))
+
+    def test_empty_file_error(self):
+        """Test that an empty file raises ValueError."""
+        path = self.write_float64([])
+        with Float64File(path) as source:
+            with self.assertRaises(ValueError) as context:
+                statistical_analysis(source)
+        self.assertIn("Data cannot be empty", str(context.exception))
+
+    def test_truncated_file_error(self):
+        """Test that a size that isn't a multiple of 8 raises ValueError."""
+        path = self.write_text("abc", name='bad.f64')
+        with self.assertRaises(ValueError):
+            Float64File(path)
+
+
+class TestCsvColumn(DataFileTestCase):
+    """Test cases for the chunked CSV column source."""
+
+    def test_named_column(self):
+        """Test selecting a column by header name."""
+        path = self.write_text("id,value\n1,2.5\n2,4.5\n\n3,3.5\n4,4.5\n")
+        source = CsvColumn(path, 'value', chunk_size=3)
+
+        self.assertEqual([list(c) for c in source.iter_chunks()], [[2.5, 4.5, 3.5], [4.5]])
+        result = statistical_analysis(source)
+        self.assertEqual(result['median'], 4.0)
+        self.assertEqual(result['mode'], 4.5)
+
+    def test_indexed_column(self):
+        """Test selecting a column by index without a header."""
+        path = self.write_text("a;1\nb;2\nc;3\n")
+        result = statistical_analysis(CsvColumn(path, 1, delimiter=';'))
+
+        self.assertEqual(result['mean'], 2.0)
+        self.assertEqual(result['median'], 2.0)
+
+    def test_invalid_values(self):
+        """Test non-numeric cells, missing columns and unknown names."""
+        path = self.write_text("value\n1\nabc\n")
+        with self.assertRaises(TypeError) as context:
+            statistical_analysis(CsvColumn(path, 'value'))
+        self.assertIn("line 3", str(context.exception))
+        with self.assertRaises(ValueError):
+            statistical_analysis(CsvColumn(path, 3, has_header=True))
+        with self.assertRaises(ValueError):
+            statistical_analysis(CsvColumn(path, 'missing'))
+
+
+class TestStreamingSelect(DataFileTestCase):
+    """Test cases for multi-pass order statistic selection."""
+
+    def test_refinement_with_small_buckets(self):
+        """Test exact selection when several refinement passes are needed."""
+        rng = random.Random(7)
+        values = [rng.expovariate(1.0) for _ in range(2000)] + [5.0] * 300
+        path = self.write_float64(values)
+        ordered = sorted(values)
+
+        with mock.patch.object(data_loader, 'SELECT_BUCKETS', 4), \
+                mock.patch.object(data_loader, 'SELECT_COLLECT_LIMIT', 8), \
+                Float64File(path, chunk_size=128) as source:
+            for k in (0, 1, 999, 1500, 2150, len(values) - 1):
+                self.assertEqual(streaming_select(source, k, ordered[0], ordered[-1]), ordered[k])
+
+    def test_python_fallback(self):
+        """Test selection and moments without NumPy."""
+        values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+        path = self.write_float64(values)
+
+        with mock.patch.object(data_loader, '_get_numpy', return_value=None), \
+                Float64File(path, chunk_size=3) as source:
+            result = statistical_analysis(source)
+
+        self.assertEqual(result['median'], statistical_analysis(values)['median'])
+        self.assertEqual(result['mode'], 1.0)
+
+
+class TestNonFiniteValues(DataFileTestCase):
+    """Test cases for infinities, NaN and ranges wider than the largest float."""
+
+    def analyses(self, values):
+        """Yield statistical_analysis and streaming_statistical_analysis results, with and without NumPy."""
+        path = self.write_float64(values)
+        for numpy in (data_loader._get_numpy(), None):
+            with mock.patch.object(data_loader, '_get_numpy', return_value=numpy), \
+                    Float64File(path, chunk_size=2) as source:
+                yield statistical_analysis(source)
+                yield data_loader.streaming_statistical_analysis(source)
+
+    def test_infinities(self):
+        """Test that infinities sort at the ends like in the in-memory path."""
+        inf = math.inf
+        for values, median, low, high in (([1.0, 2.0, inf, 3.0], 2.5, 1.0, inf),
+                                          ([-inf, 1.0, 2.0, inf], 1.5, -inf, inf),
+                                          ([inf, 5.0, inf], inf, 5.0, inf),
+                                          ([-inf, -inf, 4.0], -inf, -inf, 4.0)):
+            expected = statistical_analysis(values)
+            self.assertEqual((expected['median'], expected['min'], expected['max']), (median, low, high))
+            for result in self.analyses(values):
+                self.assertEqual((result['median'], result['min'], result['max']), (median, low, high), values)
+                self.assertEqual(result['count'], len(values))
+
+    def test_nan(self):
+        """Test that a NaN makes the median NaN and is ignored by min and max."""
+        for values in ([1.0, 2.0, math.nan, 3.0], [math.nan, 4.0, 1.0], [math.nan, math.nan]):
+            for result in self.analyses(values):
+                self.assertTrue(math.isnan(result['median']), values)
+                self.assertTrue(math.isnan(result['mean']))
+                finite = [x for x in values if not math.isnan(x)]
+                if finite:
+                    self.assertEqual((result['min'], result['max']), (min(finite), max(finite)))
+
+    def test_range_wider_than_float_max(self):
+        """Test selection between -1e308 and 1e308."""
+        for values in ([1e308, -1e308, 0.0, 5.0], [-1e308] * 3 + [1e308] * 2):
+            ordered = sorted(values)
+            for result in self.analyses(values):
+                n = len(values)
+                expected = ordered[n // 2] if n % 2 else (ordered[n // 2 - 1] + ordered[n // 2]) / 2
+                self.assertEqual(result['median'], expected)
+                self.assertEqual((result['min'], result['max']), (-1e308, 1e308))
+
+    def test_outlier_detection(self):
+        """Test that IQR outliers find infinities."""
+        path = self.write_float64([float(x) for x in range(1, 11)] + [math.inf])
+        with Float64File(path, chunk_size=4) as source:
+            self.assertEqual(outlier_detection(source, 'iqr'), [math.inf])
+            self.assertEqual(streaming_select(source, 10, 1.0, math.inf), math.inf)
+            self.assertEqual(streaming_select(source, 9, 1.0, math.inf), 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
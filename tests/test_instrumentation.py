@@ -0,0 +1,155 @@
+"""
+Unit tests for the opt-in call metrics of the math functions.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+# Add the parent directory to the path to import instrumentation
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import instrumentation
+import main
+import math_utils
+import service
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for enable/disable and the recorded metrics."""
+
+    def setUp(self):
+        instrumentation.METRICS.reset()
+        self.addCleanup(instrumentation.METRICS.reset)
+        self.addCleanup(instrumentation.disable)
+
+    def test_disabled_functions_are_untouched(self):
+        """Test that nothing is wrapped unless enabled, and disable restores the originals."""
+        original = math_utils.statistical_analysis
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(service.REGISTRY['statistical_analysis'], original)
+
+        instrumentation.enable()
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(math_utils.statistical_analysis, original)
+        self.assertIs(math_utils.statistical_analysis.__wrapped__, original)
+        self.assertIs(service.REGISTRY['statistical_analysis'], math_utils.statistical_analysis)
+
+        instrumentation.disable()
+        self.assertIs(math_utils.statistical_analysis, original)
+        self.assertIs(service.REGISTRY['statistical_analysis'], original)
+        math_utils.statistical_analysis([1, 2])
+        self.assertEqual(len(instrumentation.METRICS), 0)
+
+    def test_records_calls_errors_and_sizes(self):
+        """Test counts, error types and both histograms."""
+        instrumentation.enable()
+        math_utils.statistical_analysis([1.0] * 50)
+        math_utils.statistical_analysis([2.0] * 5000)
+        with self.assertRaises(ValueError):
+            math_utils.statistical_analysis([])
+        math_utils.prime_number_generator(1000)
+        math_utils.basic_calculator('add', 1, 2)
+        service.call('fibonacci_sequence', [5])
+
+        functions = instrumentation.METRICS.snapshot()['functions']
+        stats = functions['statistical_analysis']
+        self.assertEqual(stats['calls'], 3)
+        self.assertEqual(stats['errors'], {'ValueError': 1})
+        self.assertEqual(sum(stats['latency']['counts']), 3)
+        # 0, 50 and 5000 elements: buckets <=1, <=100 and <=10000
+        self.assertEqual(stats['size']['counts'], [1, 0, 1, 0, 1, 0, 0, 0, 0])
+        self.assertEqual(stats['size']['sum'], 5050)
+        self.assertEqual(functions['prime_number_generator']['size']['sum'], 1000)
+        self.assertEqual(sum(functions['basic_calculator']['size']['counts']), 0)
+        self.assertEqual(functions['fibonacci_sequence']['calls'], 1)
+
+    def test_nested_calls_are_not_recorded(self):
+        """Test that only the outermost call is counted when math_utils calls itself."""
+        instrumentation.enable()
+        math_utils.outlier_detection([1, 2, 3, 100])
+        math_utils.multiple_linear_regression([[1, 2], [2, 1], [3, 5], [4, 3]], [1, 2, 3, 4])
+        with mock.patch('parallel_stats._available_cpus', return_value=1):
+            math_utils.statistical_analysis([1.0] * 20_000, parallel=True)
+        math_utils.matrix_multiply([[1]], [[2]])
+
+        functions = instrumentation.METRICS.snapshot()['functions']
+        self.assertEqual({name: data['calls'] for name, data in functions.items()},
+                         {'outlier_detection': 1, 'multiple_linear_regression': 1,
+                          'statistical_analysis': 1, 'matrix_multiply': 1})
+
+    def test_prometheus_format(self):
+        """Test metric names, labels and cumulative buckets."""
+        registry = instrumentation.MetricsRegistry()
+        registry.record('describe', 0.002, 100)
+        registry.record('describe', 20.0, 100, 'TypeError')
+        text = instrumentation.to_prometheus(registry.snapshot())
+        lines = text.splitlines()
+
+        self.assertIn('# TYPE math_utils_latency_seconds histogram', lines)
+        self.assertIn('math_utils_calls_total{function="describe"} 2', lines)
+        self.assertIn('math_utils_errors_total{function="describe",exception="TypeError"} 1', lines)
+        self.assertIn('math_utils_latency_seconds_bucket{function="describe",le="0.001"} 0', lines)
+        self.assertIn('math_utils_latency_seconds_bucket{function="describe",le="0.005"} 1', lines)
+        self.assertIn('math_utils_latency_seconds_bucket{function="describe",le="10.0"} 1', lines)
+        self.assertIn('math_utils_latency_seconds_bucket{function="describe",le="+Inf"} 2', lines)
+        self.assertIn('math_utils_latency_seconds_count{function="describe"} 2', lines)
+        self.assertIn('math_utils_input_size_bucket{function="describe",le="100"} 2', lines)
+        self.assertEqual(instrumentation._labels(function='a"b\\c'), '{function="a\\"b\\\\c"}')
+
+    def test_save_merges_and_main_prints(self):
+        """Test saving twice into one file and ``main.py metrics``."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'metrics.json')
+        instrumentation.save(path)
+        self.assertFalse(os.path.exists(path))
+
+        instrumentation.METRICS.record('outlier_detection', 0.01, 10)
+        instrumentation.save(path)
+        instrumentation.save(path)
+        self.assertEqual(instrumentation.load(path)['functions']['outlier_detection']['calls'], 2)
+        with self.assertRaises(ValueError):
+            instrumentation.METRICS.merge(dict(instrumentation.load(path), size_buckets=[1]))
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            self.assertEqual(main.main(['metrics', '--file', path]), 0)
+        self.assertIn('math_utils_calls_total{function="outlier_detection"} 2', stdout.getvalue())
+        stdout = io.StringIO()
+        with redirect_stdout(stdout), mock.patch.dict(os.environ, {instrumentation.METRICS_ENV: path}):
+            self.assertEqual(main.main(['metrics', '--format', 'json']), 0)
+        self.assertEqual(json.loads(stdout.getvalue())['functions']['outlier_detection']['size']['sum'], 20)
+
+        with redirect_stderr(io.StringIO()), mock.patch.dict(os.environ, {instrumentation.METRICS_ENV: ''}):
+            self.assertEqual(main.main(['metrics']), 1)
+            self.assertEqual(main.main(['metrics', '--file', os.path.join(directory.name, 'missing.json')]), 1)
+
+    def test_environment_enables_main(self):
+        """Test that MATH_UTILS_METRICS makes main.py record and save at exit."""
+        with mock.patch.dict(os.environ, {instrumentation.METRICS_ENV: 'm.json'}), \
+                mock.patch('atexit.register') as register, redirect_stdout(io.StringIO()):
+            self.assertEqual(main.main(['primes', '10']), 0)
+        register.assert_called_once_with(instrumentation.save, 'm.json')
+        self.assertEqual(instrumentation.METRICS.snapshot()['functions']['prime_number_generator']['calls'], 1)
+
+    def test_service_metrics(self):
+        """Test the service's metrics function."""
+        instrumentation.enable()
+        service.call('describe', [[1, 2, 3]])
+        self.assertEqual(service.call('metrics')['functions']['describe']['calls'], 1)
+        self.assertIn('math_utils_calls_total{function="describe"} 1', service.call('metrics', ['prometheus']))
+        with self.assertRaises(ValueError):
+            service.call('metrics', ['xml'])
+
+
+if __name__ == '__main__':
+    unittest.main()
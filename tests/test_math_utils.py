@@ -10,11 +10,17 @@ a template for contributors to follow when creating their own test files.
 import unittest
 import sys
 import os
+import math
 
 # Add the parent directory to the path to import math_utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from math_utils import basic_calculator
+from math_utils import basic_calculator, basic_calculator_array, OPERATION_CODES
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestBasicCalculator(unittest.TestCase):
@@ -88,5 +94,85 @@ class TestBasicCalculator(unittest.TestCase):
         self.assertEqual(result, 3.0)
 
 
+class TestBasicCalculatorArray(unittest.TestCase):
+    """Test cases for the basic_calculator_array function."""
+    
+    def setUp(self):
+        self.a = [5, -2, 7.5, 10]
+        self.b = [3, 7, 2.5, 4]
+    
+    def test_single_operation(self):
+        """Test that every element matches basic_calculator."""
+        for operation in OPERATION_CODES:
+            expected = [basic_calculator(operation, x, y) for x, y in zip(self.a, self.b)]
+            self.assertEqual(basic_calculator_array(operation, self.a, self.b), expected)
+    
+    def test_per_element_operations(self):
+        """Test operation names and codes given per element."""
+        operations = ['add', 'subtract', 'multiply', 'divide']
+        expected = [basic_calculator(op, x, y) for op, x, y in zip(operations, self.a, self.b)]
+        
+        self.assertEqual(basic_calculator_array(operations, self.a, self.b), expected)
+        self.assertEqual(basic_calculator_array([0, 1, 2, 3], self.a, self.b), expected)
+    
+    def test_division_by_zero_reporting(self):
+        """Test raise, mask and list reporting of division by zero."""
+        with self.assertRaises(ValueError) as context:
+            basic_calculator_array('divide', [1, 2], [1, 0])
+        self.assertIn("Division by zero is not allowed", str(context.exception))
+        
+        results, mask = basic_calculator_array('divide', [1, 2, 3], [1, 0, 2], errors='mask')
+        self.assertEqual(mask, [False, True, False])
+        self.assertTrue(math.isnan(results[1]))
+        self.assertEqual(results[2], 1.5)
+        
+        results, failed = basic_calculator_array(['divide', 'add'], [4, 1], [0, 0], errors='list')
+        self.assertEqual(failed, [(0, "Division by zero is not allowed")])
+        self.assertEqual(results[1], 1)
+    
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_arrays(self):
+        """Test the vectorized path against the list path."""
+        operations = ['add', 'divide', 'divide', 'multiply']
+        a, b = [1, 2, 3, 4], [5, 0, 2, 6]
+        expected, expected_mask = basic_calculator_array(operations, a, b, errors='mask')
+        
+        for ops in (numpy.array(operations), numpy.array([OPERATION_CODES[op] for op in operations])):
+            results, mask = basic_calculator_array(ops, numpy.array(a), numpy.array(b), errors='mask')
+            self.assertEqual(mask.tolist(), expected_mask)
+            self.assertEqual(results[[0, 2, 3]].tolist(), [expected[i] for i in (0, 2, 3)])
+            self.assertTrue(numpy.isnan(results[1]))
+        self.assertEqual(basic_calculator_array('add', numpy.array([1, 2]), numpy.array([3, 4])).tolist(), [4, 6])
+        with self.assertRaises(ValueError):
+            basic_calculator_array('divide', numpy.array([1.0]), numpy.array([0.0]))
+    
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_rejects_what_lists_reject(self):
+        """Test that float and bool op codes fail on both paths."""
+        for ops in ([1.0, 2.0], [True, False]):
+            with self.assertRaises(ValueError):
+                basic_calculator_array(ops, [1, 2], [3, 4])
+            with self.assertRaises(ValueError):
+                basic_calculator_array(numpy.array(ops), numpy.array([1, 2]), numpy.array([3, 4]))
+        mixed = numpy.array(['add', 3], dtype=object)
+        self.assertEqual(basic_calculator_array(mixed, numpy.array([1, 6]), numpy.array([3, 4])).tolist(),
+                         basic_calculator_array(['add', 3], [1, 6], [3, 4]))
+    
+    def test_errors(self):
+        """Test invalid operations, lengths and error modes."""
+        with self.assertRaises(ValueError):
+            basic_calculator_array('power', [1], [2])
+        with self.assertRaises(ValueError):
+            basic_calculator_array(['add', 'modulo'], [1, 2], [3, 4])
+        with self.assertRaises(ValueError):
+            basic_calculator_array([7], [1], [2])
+        with self.assertRaises(ValueError):
+            basic_calculator_array('add', [1, 2], [3])
+        with self.assertRaises(ValueError):
+            basic_calculator_array(['add'], [1, 2], [3, 4])
+        with self.assertRaises(ValueError):
+            basic_calculator_array('add', [1], [2], errors='ignore')
+
+
 if __name__ == '__main__':
     unittest.main()
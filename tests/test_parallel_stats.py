@@ -0,0 +1,109 @@
+"""
+Unit tests for sharded parallel statistical analysis.
+
+@author: Contributor 3
+"""
+
+import unittest
+import sys
+import os
+import math
+import random
+from unittest import mock
+
+# Add the parent directory to the path to import math_utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parallel_stats
+from math_utils import statistical_analysis
+
+
+class TestParallelStatisticalAnalysis(unittest.TestCase):
+    """Test cases for statistical_analysis(parallel=True)."""
+
+    def setUp(self):
+        # Pretend there are CPUs to spare, so the pool runs on any machine
+        for patcher in (mock.patch.object(parallel_stats, 'PARALLEL_MIN_SIZE', 0),
+                        mock.patch.object(parallel_stats, '_available_cpus', return_value=4)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assert_matches_serial(self, data, workers=2):
+        expected = statistical_analysis(data)
+        result = statistical_analysis(data, workers=workers)
+
+        self.assertEqual(result['count'], expected['count'])
+        for key in ('median', 'mode', 'min', 'max'):
+            self.assertEqual(result[key], expected[key], key)
+            self.assertIs(type(result[key]), type(expected[key]), key)
+        for key in ('mean', 'std_dev'):
+            if math.isnan(expected[key]):
+                self.assertTrue(math.isnan(result[key]), key)
+            else:
+                self.assertAlmostEqual(result[key], expected[key], places=9)
+
+    def test_float_data(self):
+        """Test unique float data (no mode) across three shards."""
+        rng = random.Random(3)
+        self.assert_matches_serial([rng.uniform(-5, 5) for _ in range(5001)], workers=3)
+
+    def test_integer_data_with_mode(self):
+        """Test integer data with a single mode."""
+        rng = random.Random(4)
+        self.assert_matches_serial([rng.randint(0, 50) for _ in range(4000)] + [7] * 200)
+
+    def test_integer_types_are_kept(self):
+        """Test that min, max, median and mode are ints for integer data, with and without NumPy."""
+        rng = random.Random(5)
+        data = [rng.randint(-1000, 1000) for _ in range(3001)]
+        self.assert_matches_serial(data, workers=3)
+        with mock.patch.object(parallel_stats, '_get_numpy', return_value=None):
+            self.assert_matches_serial(data, workers=3)
+
+    def test_non_finite_values(self):
+        """Test infinities and NaN in the sharded selection."""
+        rng = random.Random(6)
+        data = [rng.random() for _ in range(4000)]
+        data[17] = math.inf
+        self.assert_matches_serial(data)
+        data[18] = -math.inf
+        self.assert_matches_serial(data)
+        data[19] = math.nan
+        result = statistical_analysis(data, workers=2)
+        self.assertTrue(math.isnan(result['median']))
+        self.assertEqual((result['min'], result['max']), (-math.inf, math.inf))
+
+    def test_multiple_modes_keep_first_occurrence_order(self):
+        """Test that several modes are ordered like the serial Counter."""
+        data = [9, 1, 9, 1, 3, 2, 2, 9, 1, 2, 0.5]
+        self.assert_matches_serial(data)
+        self.assertEqual(statistical_analysis(data, parallel=True, workers=2)['mode'], [9, 1, 2])
+
+    def test_small_input_runs_serially(self):
+        """Test that inputs under the size threshold skip the pool."""
+        with mock.patch.object(parallel_stats, 'PARALLEL_MIN_SIZE', 100), \
+                mock.patch.object(parallel_stats, 'ProcessPoolExecutor') as pool:
+            result = statistical_analysis([1, 2, 3, 4], parallel=True)
+        pool.assert_not_called()
+        self.assertEqual(result['median'], 2.5)
+
+    def test_single_cpu_runs_serially(self):
+        """Test that workers are capped at the usable CPUs."""
+        with mock.patch.object(parallel_stats, '_available_cpus', return_value=1), \
+                mock.patch.object(parallel_stats, 'ProcessPoolExecutor') as pool:
+            result = statistical_analysis([1, 2, 3, 4], workers=4)
+        pool.assert_not_called()
+        self.assertEqual(result['median'], 2.5)
+
+    def test_errors(self):
+        """Test the same validation as the serial path."""
+        with self.assertRaises(TypeError):
+            statistical_analysis([1, 2, "three"], parallel=True)
+        with self.assertRaises(ValueError):
+            statistical_analysis([], parallel=True)
+        with self.assertRaises(ValueError):
+            statistical_analysis([1, 2, 3], workers=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
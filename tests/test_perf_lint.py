@@ -0,0 +1,216 @@
+"""
+Unit tests for the AST performance lint.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import textwrap
+
+# Add the parent directory to the path to import perf_lint
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from perf_lint import lint_source
+
+
+def findings(source):
+    """(code, line) of every finding in the dedented source."""
+    return [(f['code'], f['line']) for f in lint_source(textwrap.dedent(source))]
+
+
+class TestLoopInvariant(unittest.TestCase):
+    """Test cases for PERF101."""
+
+    def test_matrix_multiply_pattern(self):
+        """Test invariant range(len()), row lookups and per-element type checks."""
+        result = findings('''\
+            def multiply(a, b):
+                result = []
+                for i in range(len(a)):
+                    row = []
+                    for j in range(len(b[0])):
+                        total = 0
+                        for k in range(len(b)):
+                            if not isinstance(a[i][k], (int, float)):
+                                raise TypeError
+                            total += a[i][k] * b[k][j]
+                        row.append(total)
+                    result.append(row)
+                return result
+            ''')
+        self.assertEqual(result, [('PERF101', 7), ('PERF101', 8), ('PERF101', 10)])
+
+    def test_loop_dependent_work_is_not_flagged(self):
+        """Test that expressions using names the loop changes are left alone."""
+        self.assertEqual(findings('''\
+            def f(rows):
+                for row in rows:
+                    seen = []
+                    for value in row:
+                        seen.append(value)
+                        if len(seen) > 3:
+                            pass
+                        if isinstance(value, Node):
+                            pass
+            '''), [])
+
+
+class TestRedundantPasses(unittest.TestCase):
+    """Test cases for PERF102."""
+
+    def test_repeated_passes(self):
+        """Test that the third pass over an unchanged list is reported."""
+        result = lint_source(textwrap.dedent('''\
+            def stats(data):
+                for value in data:
+                    check(value)
+                total = sum(data)
+                peak = max(data)
+                data = sorted(data)
+                return min(data), total, peak
+            '''))
+        self.assertEqual([(f['code'], f['line']) for f in result], [('PERF102', 5)])
+        self.assertIn("lines 2, 4, 5", result[0]['message'])
+
+    def test_rebinding_starts_after_the_value(self):
+        """Test that ``x = list(x)`` counts as a pass over the old x only."""
+        self.assertEqual(findings('''\
+            def fit(x_data):
+                x_data = list(x_data)
+                mean = sum(x_data) / len(x_data)
+                return sum((x - mean) ** 2 for x in x_data)
+            '''), [])
+
+    def test_branch_exclusive_passes(self):
+        """Test that passes in arms that can't both run are not added up."""
+        self.assertEqual(findings('''\
+            def outliers(data, method):
+                if method == 'iqr':
+                    low, high = sorted(data)[0], max(data)
+                    return [x for x in data if x < low or x > high]
+                if method == 'mean':
+                    mean = sum(data) / len(data)
+                else:
+                    mean = min(data)
+                return [x for x in data if x > mean]
+
+            def select(values, wanted):
+                while wanted:
+                    if len(values) < 8:
+                        ordered = sorted(values)
+                        continue
+                    lows = [x for x in values if x < 0]
+                    try:
+                        total = sum(values)
+                    except TypeError:
+                        total = max(values)
+            '''), [])
+
+    def test_passes_along_one_path_are_reported(self):
+        """Test that branches still count the passes before and after them."""
+        self.assertEqual(findings('''\
+            def stats(data, scale):
+                total = sum(data)
+                if scale:
+                    peak = max(data)
+                else:
+                    peak = 1
+                return [x / peak for x in data], total
+            '''), [('PERF102', 7)])
+
+    def test_literal_iterables_are_skipped(self):
+        """Test that names bound to a fixed literal display are not counted."""
+        self.assertEqual(findings('''\
+            METHODS = ['iqr', 'z_score', 'mad']
+
+            def check(method):
+                names = [m for m in METHODS]
+                first = min(METHODS)
+                return method in names and any(m == first for m in METHODS) and sorted(METHODS)
+
+            def grow(items):
+                seen = [0]
+                for item in items:
+                    seen.append(item)
+                total = sum(seen)
+                peak = max(seen)
+                return sorted(seen), total, peak
+            '''), [('PERF102', 14)])
+
+    def test_concatenation_just_to_iterate(self):
+        """Test that looping over a + b is reported."""
+        self.assertEqual(findings('''\
+            def check(x_data, y_data):
+                for value in x_data + y_data:
+                    pass
+            '''), [('PERF102', 2)])
+
+
+class TestQuadraticLists(unittest.TestCase):
+    """Test cases for PERF103."""
+
+    def test_quadratic_building(self):
+        """Test list re-concatenation, front inserts/pops and sum(lists, [])."""
+        self.assertEqual(findings('''\
+            def build(items, queue):
+                out = []
+                count = 0
+                for item in items:
+                    out = out + [item]
+                    count = count + item
+                    queue.insert(0, item)
+                while queue:
+                    queue.pop(0)
+                return sum([[1], [2]], [])
+            '''), [('PERF103', 5), ('PERF103', 7), ('PERF103', 9), ('PERF103', 10)])
+
+
+class TestDuplicateDefinitions(unittest.TestCase):
+    """Test cases for PERF104."""
+
+    def test_shadowed_definition(self):
+        """Test that only undecorated same-scope redefinitions are reported."""
+        self.assertEqual(findings('''\
+            def generate(limit):
+                return []
+
+            class Box:
+                @property
+                def size(self):
+                    return 1
+
+                @size.setter
+                def size(self, value):
+                    pass
+
+            try:
+                from fast import helper
+            except ImportError:
+                def helper():
+                    pass
+
+            def generate(limit):
+                return [limit]
+            '''), [('PERF104', 1)])
+
+    def test_noqa_suppression(self):
+        """Test that only the codes named on the reported line are suppressed."""
+        self.assertEqual(findings('''\
+            def f(a, b):
+                for x in a + b:  # noqa: PERF101, PERF102
+                    pass
+                for x in a + b:  # noqa: PERF101
+                    pass
+                for x in a + b:  # noqa
+                    pass
+            '''), [('PERF102', 4), ('PERF102', 6)])
+
+    def test_syntax_error(self):
+        """Test that unparsable code yields no findings."""
+        self.assertEqual(lint_source("def broken(:\n"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Unit tests for the content-addressed result cache.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from array import array
+
+# Add the parent directory to the path to import math_utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from math_utils import Dataset, statistical_analysis, prime_number_generator
+from result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for the ResultCache class."""
+
+    def test_hits_on_equal_content(self):
+        """Test that equal inputs in different objects share an entry."""
+        cache = ResultCache()
+        stats = cache.wrap(statistical_analysis)
+
+        first = stats([1, 2, 3, 4])
+        second = stats(list([1, 2, 3, 4]))
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, statistical_analysis([1, 2, 3, 4]))
+        counters = cache.stats()
+        self.assertEqual((counters['hits'], counters['misses'], counters['entries']), (1, 1, 1))
+
+    def test_parameters_are_part_of_the_key(self):
+        """Test that arguments, keywords and buffer types change the key."""
+        key = ResultCache.make_key
+        self.assertNotEqual(key(len, ([1, 2],), {}), key(len, ([2, 1],), {}))
+        self.assertNotEqual(key(len, ([1, 2],), {}), key(len, ([1, 2],), {'method': 'iqr'}))
+        self.assertNotEqual(key(len, (array('d', [1]),), {}), key(len, (array('q', [1]),), {}))
+        self.assertEqual(key(len, (array('d', [1, 2]),), {}), key(len, (array('d', [1, 2]),), {}))
+
+    def test_dataset_key_ignores_memo(self):
+        """Test that a Dataset's key depends on its values, not on what it has memoized."""
+        cache = ResultCache()
+        stats = cache.wrap(statistical_analysis)
+        warmed = Dataset([4, 1, 3, 100])
+        warmed.sorted_values()
+        warmed.moments()
+
+        self.assertEqual(ResultCache.make_key(statistical_analysis, (warmed,), {}),
+                         ResultCache.make_key(statistical_analysis, (Dataset([4, 1, 3, 100]),), {}))
+        stats(warmed)
+        stats(Dataset([4, 1, 3, 100]))
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_hits_return_independent_copies(self):
+        """Test that mutating a returned result doesn't corrupt the cache."""
+        cache = ResultCache()
+        primes = cache.wrap(prime_number_generator)
+
+        primes(20).append(-1)
+        cached = primes(20)
+        cached.append(-2)
+
+        self.assertEqual(primes(20), [2, 3, 5, 7, 11, 13, 17, 19])
+
+    def test_lru_eviction_under_byte_budget(self):
+        """Test that least recently used entries are evicted first."""
+        cache = ResultCache(max_bytes=100)
+        cache.put('a', 'x' * 30)
+        cache.put('b', 'y' * 30)
+        cache.get('a')
+        cache.put('c', 'z' * 30)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'x' * 30)
+        self.assertEqual(cache.get('c'), 'z' * 30)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertLessEqual(cache.stats()['bytes'], 100)
+
+        cache.put('huge', 'w' * 500)
+        self.assertIsNone(cache.get('huge'))
+
+    def test_exceptions_are_not_cached(self):
+        """Test that failing calls are retried."""
+        cache = ResultCache()
+        stats = cache.wrap(statistical_analysis)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                stats([])
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_disk_tier_survives_restart(self):
+        """Test that a new cache instance reads entries from disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ResultCache(disk_dir=tmpdir).wrap(prime_number_generator)(30)
+
+            restarted = ResultCache(disk_dir=tmpdir)
+            primes = restarted.wrap(prime_number_generator)
+            self.assertEqual(primes(30)[-1], 29)
+            counters = restarted.stats()
+            self.assertEqual((counters['disk_hits'], counters['misses']), (1, 0))
+
+            restarted.clear(disk=True)
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    def test_disk_tier_lru_under_byte_budget(self):
+        """Test that the disk tier evicts least recently used files, also across restarts."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResultCache(max_bytes=0, disk_dir=tmpdir, max_disk_bytes=100)
+            cache.put('a', 'x' * 30)
+            cache.put('b', 'y' * 30)
+            self.assertEqual(cache.get('a'), 'x' * 30)
+            cache.put('c', 'z' * 30)
+
+            self.assertEqual(sorted(os.listdir(tmpdir)), ['a.pkl', 'c.pkl'])
+            counters = cache.stats()
+            self.assertEqual((counters['disk_evictions'], counters['disk_entries']), (1, 2))
+            self.assertLessEqual(counters['disk_bytes'], 100)
+
+            cache.put('huge', 'w' * 500)
+            self.assertNotIn('huge.pkl', os.listdir(tmpdir))
+
+            # Recency is kept in file times, so a smaller budget on restart
+            # drops the least recently used file
+            os.utime(os.path.join(tmpdir, 'a.pkl'), ns=(1, 1))
+            restarted = ResultCache(disk_dir=tmpdir, max_disk_bytes=60)
+            self.assertEqual(os.listdir(tmpdir), ['c.pkl'])
+            self.assertEqual(restarted.stats()['disk_evictions'], 1)
+
+    def test_thread_safety(self):
+        """Test concurrent use from several threads."""
+        cache = ResultCache(max_bytes=2000)
+        stats = cache.wrap(statistical_analysis)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(50):
+                    data = [offset, i, i + 1]
+                    self.assertEqual(stats(data)['count'], 3)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(t % 3,)) for t in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        counters = cache.stats()
+        self.assertEqual(counters['hits'] + counters['misses'], 300)
+        self.assertLessEqual(counters['bytes'], 2000)
+
+    def test_negative_budget_error(self):
+        """Test that a negative byte budget raises ValueError."""
+        with self.assertRaises(ValueError):
+            ResultCache(max_bytes=-1)
+        with self.assertRaises(ValueError):
+            ResultCache(max_disk_bytes=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Unit tests for the asyncio RPC server.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import asyncio
+import json
+import threading
+from unittest import mock
+
+# Add the parent directory to the path to import math_utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rpc_server
+from rpc_server import RpcServer
+from service import REGISTRY, register
+from math_utils import basic_calculator, linear_regression
+
+
+class TestRpcServer(unittest.TestCase):
+    """Test cases for RpcServer dispatch."""
+
+    def run_async(self, coroutine_function):
+        server = RpcServer(workers=2)
+        self.addCleanup(server.close)
+        return server, asyncio.run(coroutine_function(server))
+
+    def test_coalesces_identical_requests(self):
+        """Test that identical in-flight requests share one computation."""
+        calls = []
+        lock = threading.Lock()
+
+        def slow_square(x):
+            with lock:
+                calls.append(x)
+            return x * x
+
+        register(slow_square)
+        self.addCleanup(REGISTRY.pop, 'slow_square')
+
+        async def scenario(server):
+            return await asyncio.gather(*(server.execute('slow_square', [4]) for _ in range(5)),
+                                        server.execute('slow_square', [5]))
+
+        server, results = self.run_async(scenario)
+        self.assertEqual(results, [16, 16, 16, 16, 16, 25])
+        self.assertEqual(calls, [4, 5])
+        self.assertEqual(server.stats['coalesced'], 4)
+
+    def test_micro_batches_basic_calculator(self):
+        """Test that concurrent calls run as one basic_calculator_array batch."""
+        calls = [['add', 1, 2], ['divide', 9, 3], ['multiply', 2.5, 4], ['divide', 1, 0]]
+
+        async def scenario(server):
+            return await asyncio.gather(*(server.execute('basic_calculator', args) for args in calls),
+                                        return_exceptions=True)
+
+        server, results = self.run_async(scenario)
+        self.assertEqual(results[:3], [basic_calculator(*args) for args in calls[:3]])
+        self.assertIsInstance(results[3], ValueError)
+        self.assertEqual(str(results[3]), "Division by zero is not allowed")
+        self.assertEqual((server.stats['batches'], server.stats['batched_calls']), (1, 4))
+
+    def test_batched_matches_unbatched(self):
+        """Test that a request gets the same answer whether or not it is batched."""
+        calls = [[0, 1, 2], ['add', 1, 2], ['divide', 1, 2]]
+
+        async def scenario(server):
+            return await asyncio.gather(*(server.execute('basic_calculator', args) for args in calls),
+                                        return_exceptions=True)
+
+        batched_server, batched = self.run_async(scenario)
+        unbatched_server = RpcServer(max_batch=1)
+        unbatched = asyncio.run(scenario(unbatched_server))
+        self.assertEqual(unbatched_server.stats['batches'], 0)
+        for one, other in zip(batched, unbatched):
+            self.assertEqual(repr(one), repr(other))
+        self.assertEqual(str(batched[0]), "Unsupported operation: 0")
+        self.assertEqual(batched[1], 3)
+
+    def test_linear_regression_is_not_batched(self):
+        """Test that concurrent linear_regression calls give the unbatched numbers exactly."""
+        series = [([1, 2, 3, 4, 5, 6, 7], [3.2, 5.9, 9.4, 12.1, 15.8, 18.7, 22.3]), ([1, 2, 3], [3, 1, 2]),
+                  ([1, 2, 3, 4], [2, 4, 6, 8.5])]
+
+        async def scenario(server):
+            good = await asyncio.gather(*(server.execute('linear_regression', [x, y]) for x, y in series))
+            mixed = await asyncio.gather(server.execute('linear_regression', [[1, 2], [1, 2]]),
+                                         server.execute('linear_regression', [[1, 1], [1, 2]]),
+                                         return_exceptions=True)
+            return good, mixed
+
+        server, (good, mixed) = self.run_async(scenario)
+        self.assertEqual(good, [linear_regression(x, y) for x, y in series])
+        self.assertEqual(mixed[0]['slope'], 1.0)
+        self.assertIsInstance(mixed[1], ValueError)
+        self.assertEqual(server.stats['batches'], 0)
+
+    def test_cpu_bound_offload(self):
+        """Test that CPU-heavy functions run in the process pool."""
+        async def scenario(server):
+            return await server.execute('prime_number_generator', [30])
+
+        server, result = self.run_async(scenario)
+        self.assertEqual(result, [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+        self.assertEqual(server.stats['offloaded'], 1)
+
+    def test_socket_protocol(self):
+        """Test pipelined JSON-lines requests over TCP."""
+        requests = [{'id': 1, 'fn': 'fibonacci_sequence', 'args': [5]},
+                    {'id': 2, 'fn': 'unknown'},
+                    {'id': 3, 'fn': 'statistical_analysis', 'args': [[1, 2, 3]]}]
+
+        async def scenario(server):
+            listener = await server.start(port=0)
+            async with listener:
+                host, port = listener.sockets[0].getsockname()[:2]
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(b"".join(json.dumps(r).encode() + b"\n" for r in requests) + b"oops\n")
+                writer.write_eof()
+                lines = [json.loads(line) async for line in reader]
+                writer.close()
+            return lines
+
+        server, responses = self.run_async(scenario)
+        by_id = {r['id']: r for r in responses}
+        self.assertEqual(by_id[1]['result'], [0, 1, 1, 2, 3])
+        self.assertIn("Unknown function", by_id[2]['error']['message'])
+        self.assertEqual(by_id[3]['result']['mean'], 2.0)
+        self.assertEqual(by_id[None]['error']['type'], 'JSONDecodeError')
+
+    def test_oversized_line_after_pending_request(self):
+        """Test that a too long line doesn't drop the response of a request still running."""
+        async def scenario(server):
+            listener = await server.start(port=0)
+            async with listener:
+                host, port = listener.sockets[0].getsockname()[:2]
+                reader, writer = await asyncio.open_connection(host, port)
+                # The batch window keeps the first request pending while the long line arrives
+                writer.write(json.dumps({'id': 1, 'fn': 'basic_calculator', 'args': ['add', 1, 2]}).encode()
+                             + b"\n" + b"x" * 4096 + b"\n")
+                writer.write_eof()
+                lines = [json.loads(line) async for line in reader]
+                writer.close()
+            return lines
+
+        server = RpcServer(batch_window=0.2)
+        self.addCleanup(server.close)
+        with mock.patch.object(rpc_server, 'MAX_REQUEST_BYTES', 1024):
+            responses = asyncio.run(scenario(server))
+        by_id = {r['id']: r for r in responses}
+        self.assertEqual(by_id[1]['result'], 3)
+        self.assertEqual(by_id[None]['error']['type'], 'ValueError')
+
+    def test_invalid_settings(self):
+        """Test that invalid batching settings raise ValueError."""
+        with self.assertRaises(ValueError):
+            RpcServer(batch_window=-1)
+        with self.assertRaises(ValueError):
+            RpcServer(max_batch=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
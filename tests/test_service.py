@@ -0,0 +1,186 @@
+"""
+Unit tests for the function registry and the JSON-lines worker.
+
+@author: Admin (Repository Owner)
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import subprocess
+import threading
+
+# Add the parent directory to the path to import math_utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from service import REGISTRY, call, encode_response, register, serve_jsonl
+from math_utils import statistical_analysis
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# One call per registered function, for the round-trip test
+SAMPLE_CALLS = {
+    'basic_calculator': (['add', 1, 2], {}),
+    'basic_calculator_array': (['multiply', [1, 2], [3, 4]], {}),
+    'fibonacci_sequence': ([7], {}),
+    'matrix_multiply': ([[[1, 2], [3, 4]], [[5, 6], [7, 8]]], {}),
+    'prime_number_generator': ([30], {}),
+    'statistical_analysis': ([[1, 2, 2, 5]], {}),
+    'linear_regression': ([[1, 2, 3], [2, 4, 7]], {}),
+    'linear_regression_many': ([[[1, 2, 3], [1, 2, 4]], [[2, 4, 6], [1, 3, 4]]], {'equations': True}),
+    'multiple_linear_regression': ([[[1, 0], [0, 1], [1, 1], [2, 1]], [1, 2, 3, 4]], {}),
+    'data_normalization': ([[1, 2, 3]], {'method': 'min_max'}),
+    'outlier_detection': ([[1, 2, 3, 4, 100]], {}),
+    'outlier_indices': ([[1, 2, 3, 4, 100]], {'method': 'z_score'}),
+    'describe': ([[1, 2, 3, 4, 100]], {}),
+    'evaluate_expression': (['2 * (3 + 4)'], {}),
+    'metrics': ([], {}),
+}
+
+
+def run_lines(lines, **kwargs):
+    """Serve the given request lines and return (responses by id, failures)."""
+    output = io.StringIO()
+    failures = serve_jsonl(io.StringIO("\n".join(lines) + "\n"), output, **kwargs)
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    return {r['id']: r for r in responses}, failures
+
+
+class TestRegistry(unittest.TestCase):
+    """Test cases for dispatch through the registry."""
+
+    def test_call_by_name(self):
+        """Test positional and keyword arguments."""
+        self.assertEqual(call('statistical_analysis', [[1, 2, 3]]), statistical_analysis([1, 2, 3]))
+        self.assertEqual(call('outlier_detection', [[1, 2, 3, 4, 100]], {'method': 'iqr'}), [100])
+        self.assertIn('evaluate_expression', REGISTRY)
+
+    def test_unknown_function(self):
+        """Test that only registered names can be called."""
+        with self.assertRaises(ValueError):
+            call('__import__', ['os'])
+
+    def test_register(self):
+        """Test registering under a custom name."""
+        register(len, 'length')
+        self.addCleanup(REGISTRY.pop, 'length')
+        self.assertEqual(call('length', [[1, 2]]), 2)
+
+
+class TestServeJsonl(unittest.TestCase):
+    """Test cases for serve_jsonl."""
+
+    def test_results_tagged_by_id(self):
+        """Test results, request_id tagging and error responses."""
+        responses, failures = run_lines([
+            '{"id": 1, "fn": "prime_number_generator", "args": [20]}',
+            '{"request_id": "r2", "fn": "basic_calculator", "args": ["divide", 1, 0]}',
+            '',
+            '{"id": 3, "fn": "data_normalization", "args": [[1, 2, 3]], "kwargs": {"method": "min_max"}}',
+            '{"id": 4, "fn": "missing"}',
+        ])
+
+        self.assertEqual(responses[1]['result'], [2, 3, 5, 7, 11, 13, 17, 19])
+        self.assertEqual(responses['r2']['error'],
+                         {'type': 'ValueError', 'message': 'Division by zero is not allowed'})
+        self.assertEqual(responses[3]['result'], [0.0, 0.5, 1.0])
+        self.assertIn("Unknown function", responses[4]['error']['message'])
+        self.assertEqual(failures, 2)
+
+    def test_malformed_requests(self):
+        """Test invalid JSON and invalid request shapes."""
+        responses, failures = run_lines(['not json', '[1, 2]', '{"fn": "describe", "args": 5}'])
+
+        self.assertEqual(failures, 3)
+        self.assertEqual(list(responses), [None])
+
+    def test_malformed_request_keeps_id(self):
+        """Test that an invalid request that decoded is answered under its id."""
+        responses, failures = run_lines(['{"id": 5, "fn": "describe", "args": 5}',
+                                         '{"request_id": "r", "args": []}'])
+
+        self.assertEqual(failures, 2)
+        self.assertEqual(responses[5]['error'], {'type': 'InvalidRequest', 'message': "'args' must be a list"})
+        self.assertIn("'fn'", responses['r']['error']['message'])
+
+    def test_every_function_round_trips(self):
+        """Test that every registered function's result survives strict JSON."""
+        self.assertEqual(set(SAMPLE_CALLS), set(REGISTRY))
+        lines = [json.dumps({'id': name, 'fn': name, 'args': args, 'kwargs': kwargs})
+                 for name, (args, kwargs) in SAMPLE_CALLS.items()]
+        responses, failures = run_lines(lines)
+
+        self.assertEqual(failures, 0, [r for r in responses.values() if 'error' in r])
+        for name, (args, kwargs) in SAMPLE_CALLS.items():
+            if name != 'metrics':
+                self.assertEqual(responses[name]['result'], json.loads(encode_response(call(name, args, kwargs))),
+                                 name)
+        self.assertEqual(len(responses['linear_regression_many']['result']['slope']), 2)
+
+    def test_non_finite_result(self):
+        """Test that NaN and infinities become errors instead of invalid JSON."""
+        register(lambda: {'value': float('nan')}, 'make_nan')
+        self.addCleanup(REGISTRY.pop, 'make_nan')
+        output = io.StringIO()
+        failures = serve_jsonl(io.StringIO('{"id": 1, "fn": "make_nan"}\n'
+                                           '{"id": 2, "fn": "statistical_analysis", "args": [[1e308, 1e308]]}\n'),
+                               output)
+
+        # The second mean overflows to inf
+        self.assertEqual(failures, 2)
+        responses = {r['id']: r for r in map(json.loads, output.getvalue().splitlines())}
+        self.assertEqual([responses[i]['error']['type'] for i in (1, 2)], ['ValueError', 'ValueError'])
+        self.assertNotIn('NaN', output.getvalue())
+
+    def test_unserializable_result(self):
+        """Test that a result JSON can't encode becomes an error response."""
+        register(lambda: object(), 'make_object')
+        self.addCleanup(REGISTRY.pop, 'make_object')
+        responses, failures = run_lines(['{"id": 1, "fn": "make_object"}'])
+
+        self.assertEqual(responses[1]['error']['type'], 'TypeError')
+        self.assertEqual(failures, 1)
+
+    def test_requests_run_concurrently(self):
+        """Test that a slow request doesn't hold back the ones after it."""
+        release = threading.Event()
+        register(lambda: release.wait(5), 'wait')
+        register(lambda: release.set(), 'release')
+        self.addCleanup(REGISTRY.pop, 'wait')
+        self.addCleanup(REGISTRY.pop, 'release')
+        responses, failures = run_lines(['{"id": "w", "fn": "wait"}', '{"id": "r", "fn": "release"}'],
+                                        workers=2)
+
+        # Run one at a time, "wait" would time out and return False
+        self.assertIs(responses['w']['result'], True)
+        self.assertEqual(failures, 0)
+
+    def test_process_pool(self):
+        """Test the process-based pool."""
+        responses, failures = run_lines(['{"id": 7, "fn": "fibonacci_sequence", "args": [6]}'],
+                                        workers=2, processes=True)
+
+        self.assertEqual(responses[7]['result'], [0, 1, 1, 2, 3, 5])
+        self.assertEqual(failures, 0)
+
+    def test_invalid_workers(self):
+        """Test that a non-positive pool size raises ValueError."""
+        with self.assertRaises(ValueError):
+            serve_jsonl(io.StringIO(), io.StringIO(), workers=0)
+
+    def test_main_serve_command(self):
+        """Test ``main.py serve --jsonl`` as a subprocess."""
+        completed = subprocess.run(
+            [sys.executable, os.path.join(ROOT, 'main.py'), 'serve', '--jsonl'],
+            input='{"id": 1, "fn": "evaluate_expression", "args": ["3 * 3 * 3"]}\n',
+            capture_output=True, text=True, timeout=60)
+
+        self.assertEqual(completed.returncode, 0)
+        self.assertEqual(json.loads(completed.stdout), {'id': 1, 'result': 27})
+
+
+if __name__ == '__main__':
+    unittest.main()